@@ -16,7 +16,9 @@ from xsdata.formats.dataclass.serializers import JsonSerializer, writers
 if __name__ == "__main__":
     components = [
         "LxmlEventHandler",
+        "LxmlTargetHandler",
         "XmlEventHandler",
+        "ExpatHandler",
         "LxmlEventWriter",
         "XmlEventWriter",
         "JsonParser",
@@ -32,6 +32,7 @@ class RenameDuplicateClassesTests(FactoryTestCase):
         self.container.extend(classes)
         self.processor.run()
 
+        self.assertEqual({}, self.processor.dependants)
         mock_rename_classes.assert_has_calls(
             [
                 mock.call(classes[:2], False),
@@ -78,6 +79,19 @@ class RenameDuplicateClassesTests(FactoryTestCase):
 
         mock_rename_classes.assert_called_once_with(classes, True)
 
+    def test_build_dependants(self):
+        enumeration = ClassFactory.enumeration(2)
+        first = ClassFactory.elements(2)
+        first.attrs[0].types[0].reference = enumeration.ref
+        first.attrs[1].types[0].reference = enumeration.ref
+        second = ClassFactory.create(inner=[ClassFactory.elements(1)])
+        second.inner[0].attrs[0].types[0].reference = enumeration.ref
+        self.container.extend([enumeration, first, second])
+
+        actual = self.processor.build_dependants()
+        self.assertEqual([first, second], actual[enumeration.ref])
+        self.assertNotIn(first.ref, actual)
+
     @mock.patch.object(RenameDuplicateClasses, "rename_class")
     def test_rename_classes(self, mock_rename_class):
         classes = [
@@ -112,18 +126,22 @@ class RenameDuplicateClassesTests(FactoryTestCase):
     @mock.patch.object(RenameDuplicateClasses, "rename_class_dependencies")
     def test_rename_class(self, mock_rename_class_dependencies):
         target = ClassFactory.create(qname="{foo}_a")
+        dependant = ClassFactory.create(
+            attrs=[AttrFactory.reference(target.qname, reference=target.ref)]
+        )
         self.processor.container.add(target)
+        self.processor.container.add(dependant)
         self.processor.container.add(ClassFactory.create(qname="{foo}a_1"))
         self.processor.container.add(ClassFactory.create(qname="{foo}A_2"))
         self.processor.container.add(ClassFactory.create(qname="{bar}a_3"))
+        self.processor.dependants = self.processor.build_dependants()
         self.processor.rename_class(target, False)
 
         self.assertEqual("{foo}_a_3", target.qname)
         self.assertEqual("_a", target.meta_name)
 
-        mock_rename_class_dependencies.assert_has_calls(
-            mock.call(item, id(target), "{foo}_a_3")
-            for item in self.processor.container
+        mock_rename_class_dependencies.assert_called_once_with(
+            dependant, id(target), "{foo}_a_3"
         )
 
         self.assertEqual([target], self.container.data["{foo}_a_3"])
@@ -132,18 +150,22 @@ class RenameDuplicateClassesTests(FactoryTestCase):
     @mock.patch.object(RenameDuplicateClasses, "rename_class_dependencies")
     def test_rename_class_by_name(self, mock_rename_class_dependencies):
         target = ClassFactory.create(qname="{foo}_a")
+        dependant = ClassFactory.create(
+            extensions=[ExtensionFactory.reference(target.qname, reference=target.ref)]
+        )
         self.processor.container.add(target)
+        self.processor.container.add(dependant)
         self.processor.container.add(ClassFactory.create(qname="{bar}a_1"))
         self.processor.container.add(ClassFactory.create(qname="{thug}A_2"))
         self.processor.container.add(ClassFactory.create(qname="{bar}a_3"))
+        self.processor.dependants = self.processor.build_dependants()
         self.processor.rename_class(target, True)
 
         self.assertEqual("{foo}_a_4", target.qname)
         self.assertEqual("_a", target.meta_name)
 
-        mock_rename_class_dependencies.assert_has_calls(
-            mock.call(item, id(target), "{foo}_a_4")
-            for item in self.processor.container
+        mock_rename_class_dependencies.assert_called_once_with(
+            dependant, id(target), "{foo}_a_4"
         )
 
         self.assertEqual([target], self.container.data["{foo}_a_4"])
@@ -2,7 +2,8 @@ import sys
 from pathlib import Path
 from unittest import TestCase, mock
 
-from xsdata.codegen.parsers.schema import SchemaParser
+from xsdata.codegen.parsers.definitions import DefinitionsParser
+from xsdata.codegen.parsers.schema import SchemaParser, schema_context
 from xsdata.models.enums import FormType, Mode, Namespace
 from xsdata.models.xsd import (
     All,
@@ -33,6 +34,12 @@ class SchemaParserTests(TestCase):
         self.parser = SchemaParser()
         super().setUp()
 
+    def test_schema_context(self):
+        context = schema_context()
+        self.assertIs(context, self.parser.context)
+        self.assertIs(context, DefinitionsParser().context)
+        self.assertEqual(Namespace.XS.uri, context.cache[Element].namespace)
+
     def test_complete(self):
         xsd = """<?xml version="1.0" encoding="utf-8"?>
         <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
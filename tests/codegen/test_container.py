@@ -159,3 +159,24 @@ class ClassContainerTests(FactoryTestCase):
         self.container.extend(classes)
         self.container.remove_groups()
         self.assertEqual(1, len(list(self.container)))
+
+    def test_find_by_name(self):
+        classes = [
+            ClassFactory.create(qname="{xsdata}foo_bar"),
+            ClassFactory.create(qname="FooBar"),
+            ClassFactory.create(qname="{xsdata}bar"),
+        ]
+        self.container.extend(classes)
+
+        self.assertEqual(classes[:2], self.container.find_by_name("foo-bar"))
+        self.assertEqual([], self.container.find_by_name("thug"))
+
+        qname = classes[1].qname
+        classes[1].qname = "thug"
+        self.container.reset(classes[1], qname)
+        self.assertEqual(classes[:1], self.container.find_by_name("foo_bar"))
+        self.assertEqual(classes[1:2], self.container.find_by_name("Thug"))
+
+        self.container.set(classes[2:])
+        self.assertEqual([], self.container.find_by_name("foo_bar"))
+        self.assertEqual(classes[2:], self.container.find_by_name("bar"))
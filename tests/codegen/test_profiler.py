@@ -0,0 +1,120 @@
+import json
+import logging
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase, mock
+
+from tests import fixtures_dir
+from xsdata.codegen.container import ClassContainer
+from xsdata.codegen.handlers import MergeAttributes, ProcessAttributeTypes
+from xsdata.codegen.profiler import Phase, Profiler, ProfileRecord
+from xsdata.codegen.transformer import SchemaTransformer
+from xsdata.codegen.writer import CodeWriter
+from xsdata.logger import logger
+from xsdata.models.config import GeneratorConfig
+
+
+class ProfilerTests(TestCase):
+    def test_enable_and_disable(self):
+        process = ProcessAttributeTypes.__dict__["process"]
+        merge = MergeAttributes.__dict__["process"]
+        ruff_files = CodeWriter.__dict__["ruff_files"]
+        profiler = Profiler()
+
+        profiler.enable()
+        profiler.enable()
+        self.assertTrue(profiler.enabled)
+        self.assertIsNot(process, ProcessAttributeTypes.__dict__["process"])
+        self.assertIsInstance(MergeAttributes.__dict__["process"], classmethod)
+        self.assertIsNot(ruff_files, CodeWriter.__dict__["ruff_files"])
+
+        with self.assertRaises(ValueError):
+            Profiler().enable()
+
+        profiler.disable()
+        profiler.disable()
+        self.assertFalse(profiler.enabled)
+        self.assertIs(process, ProcessAttributeTypes.__dict__["process"])
+        self.assertIs(merge, MergeAttributes.__dict__["process"])
+        self.assertIs(ruff_files, CodeWriter.__dict__["ruff_files"])
+
+    @mock.patch("builtins.print")
+    def test_process(self, *args):
+        uri = fixtures_dir.joinpath("compound/schema.xsd").as_uri()
+        transformer = SchemaTransformer(print=True, config=GeneratorConfig())
+
+        with Profiler() as profiler:
+            transformer.process([uri])
+
+        records = {(x.phase, x.name): x for x in profiler.records()}
+        self.assertEqual(0, records[(Phase.TRANSFORMER, "parse")].classes)
+        self.assertEqual(3, records[(Phase.TRANSFORMER, "map")].classes)
+        self.assertEqual(3, records[(Phase.TRANSFORMER, "analyze")].classes)
+        self.assertEqual(1, records[(Phase.STEP, "FLATTEN")].calls)
+        self.assertEqual(3, records[(Phase.STEP, "FLATTEN")].classes)
+        self.assertEqual(1, records[(Phase.STEP, "DESIGNATE")].calls)
+        self.assertEqual(3, records[(Phase.HANDLER, "MergeAttributes")].calls)
+        self.assertEqual(3, records[(Phase.HANDLER, "MergeAttributes")].classes)
+        self.assertEqual(3, records[(Phase.WRITER, "render")].classes)
+        self.assertEqual(2, records[(Phase.WRITER, "format")].calls)
+
+        phases = [x.phase for x in profiler.records()]
+        self.assertEqual(sorted(phases, key=phases.index), phases)
+
+        profiler.reset()
+        self.assertEqual([], profiler.records())
+
+    def test_nested_handlers(self):
+        profiler = Profiler()
+        with mock.patch("xsdata.codegen.profiler.perf_counter") as mock_perf_counter:
+            mock_perf_counter.side_effect = [0.0, 1.0, 3.0, 10.0]
+            inner = profiler.wrap_handler("Inner")(lambda x, y: None)
+            outer = profiler.wrap_handler("Outer")(lambda x, y: inner(x, y))
+            outer(None, None)
+
+        records = {x.name: x.seconds for x in profiler.records()}
+        self.assertEqual({"Inner": 2.0, "Outer": 8.0}, records)
+
+    def test_table_log_and_dump(self):
+        profiler = Profiler()
+        profiler.add(Phase.WRITER, "render", 0.5, classes=[1, 2])
+        profiler.add(Phase.HANDLER, "Foo", 0.25, classes=[1])
+        profiler.add(Phase.HANDLER, "Foo", 0.25, classes=[1])
+
+        expected = (
+            "Phase    Name    Calls  Classes   Seconds\n"
+            "-------  ------  -----  -------  --------\n"
+            "handler  Foo         2        1  0.500000\n"
+            "writer   render      1        2  0.500000"
+        )
+        self.assertEqual(expected, profiler.table())
+
+        with mock.patch.object(logger, "log") as mock_log:
+            profiler.log(logging.DEBUG)
+
+        mock_log.assert_called_once_with(
+            logging.DEBUG, "Profile summary:\n%s\n", expected
+        )
+
+        with TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir).joinpath("profile.json")
+            profiler.dump(path)
+            records = json.loads(path.read_text())
+
+        self.assertEqual(
+            [
+                ProfileRecord("handler", "Foo", 2, 1, 0.5)._asdict(),
+                ProfileRecord("writer", "render", 1, 2, 0.5)._asdict(),
+            ],
+            records,
+        )
+
+    def test_step_without_handlers(self):
+        container = ClassContainer(GeneratorConfig())
+        profiler = Profiler()
+        profiler.wrap_step("FILTER")(lambda x: None)(container)
+
+        self.assertEqual(
+            [ProfileRecord(Phase.STEP, "FILTER", 1, 0, mock.ANY)],
+            profiler.records(),
+        )
@@ -0,0 +1,146 @@
+import json
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase, mock
+from urllib.error import HTTPError, URLError
+
+from tests import fixtures_dir
+from xsdata.codegen import opener
+from xsdata.codegen.resources import ResourceLoader
+
+
+def response(content: bytes, **headers: str) -> mock.MagicMock:
+    result = mock.MagicMock()
+    result.__enter__.return_value = result
+    result.read.return_value = content
+    result.headers = headers
+    return result
+
+
+class ResourceLoaderTests(TestCase):
+    def setUp(self):
+        self.tmp = TemporaryDirectory()
+        self.cache_dir = Path(self.tmp.name)
+        self.loader = ResourceLoader(cache_dir=self.cache_dir)
+        self.uri = "http://www.w3.org/2001/xml.xsd"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_load_local_resource(self):
+        path = fixtures_dir.joinpath("books/schema.xsd")
+        self.assertEqual(path.read_bytes(), self.loader.load(path.as_uri()))
+        ref = self.loader.read_ref(path.as_uri())
+        self.assertEqual(path.read_bytes(), ref["content"])
+
+    @mock.patch("xsdata.codegen.resources.logger.warning")
+    def test_load_file_resource(self, mock_warning):
+        path = self.cache_dir.joinpath("schemas", "a.xsd")
+        path.parent.mkdir()
+        path.write_bytes(b"foo")
+        uri = path.as_uri()
+
+        self.assertEqual(b"foo", self.loader.load(uri))
+        ref_path = self.loader.ref_path(uri)
+        ref = json.loads(ref_path.read_text())
+        self.assertEqual(uri, ref["uri"])
+
+        os.utime(ref_path, ns=(0, 0))
+        self.assertEqual(b"foo", self.loader.load(uri))
+        self.assertEqual(0, ref_path.stat().st_mtime_ns)
+
+        path.write_bytes(b"bar")
+        self.assertEqual(b"bar", self.loader.load(uri))
+
+        path.unlink()
+        self.assertEqual(b"bar", self.loader.load(uri))
+        mock_warning.assert_called_once()
+
+        with self.assertRaises(OSError):
+            ResourceLoader().load(uri)
+
+    @mock.patch.object(opener, "open")
+    def test_load_without_cache_dir(self, mock_open):
+        mock_open.return_value.read.return_value = b"foo"
+        loader = ResourceLoader()
+
+        self.assertEqual(b"foo", loader.load(self.uri))
+        mock_open.assert_called_once_with(self.uri)
+
+    @mock.patch.object(opener, "open")
+    def test_load_with_validators(self, mock_open):
+        mock_open.side_effect = [
+            response(b"foo", ETag='"v1"', **{"Last-Modified": "Mon"}),
+            HTTPError(self.uri, 304, "Not Modified", {}, None),  # type: ignore
+            response(b"bar"),
+        ]
+
+        self.assertEqual(b"foo", self.loader.load(self.uri))
+        self.assertEqual(b"foo", self.loader.load(self.uri))
+        self.assertEqual(b"bar", self.loader.load(self.uri))
+
+        first, second, third = (call[0][0] for call in mock_open.call_args_list)
+        self.assertEqual({}, first.headers)
+        self.assertEqual(
+            {"If-none-match": '"v1"', "If-modified-since": "Mon"}, second.headers
+        )
+        self.assertEqual(
+            {"If-none-match": '"v1"', "If-modified-since": "Mon"}, third.headers
+        )
+
+        refs = list(self.cache_dir.joinpath("refs").iterdir())
+        blobs = list(self.cache_dir.joinpath("blobs").glob("*/*"))
+        self.assertEqual(1, len(refs))
+        self.assertEqual(2, len(blobs))
+
+        ref = json.loads(refs[0].read_text())
+        self.assertEqual(self.uri, ref["uri"])
+        self.assertIsNone(ref["etag"])
+        self.assertEqual(b"bar", self.loader.blob_path(ref["digest"]).read_bytes())
+
+    @mock.patch("xsdata.codegen.resources.logger.warning")
+    @mock.patch.object(opener, "open")
+    def test_load_with_errors(self, mock_open, mock_warning):
+        mock_open.side_effect = URLError("offline")
+        with self.assertRaises(URLError):
+            self.loader.load(self.uri)
+
+        mock_open.side_effect = HTTPError(self.uri, 304, "", {}, None)  # type: ignore
+        with self.assertRaises(HTTPError):
+            self.loader.load(self.uri)
+
+        mock_open.side_effect = HTTPError(self.uri, 503, "", {}, None)  # type: ignore
+        with self.assertRaises(HTTPError):
+            self.loader.load(self.uri)
+
+        self.loader.write_ref(self.uri, b"foo", None, None)
+        mock_open.side_effect = HTTPError(self.uri, 404, "", {}, None)  # type: ignore
+        with self.assertRaises(HTTPError):
+            self.loader.load(self.uri)
+
+        mock_open.side_effect = HTTPError(self.uri, 503, "", {}, None)  # type: ignore
+        self.assertEqual(b"foo", self.loader.load(self.uri))
+
+        mock_open.side_effect = URLError("offline")
+        self.assertEqual(b"foo", self.loader.load(self.uri))
+        self.assertEqual(2, mock_warning.call_count)
+        mock_warning.assert_called_with(
+            "Using cached resource %s, %s", self.uri, "offline"
+        )
+
+    @mock.patch.object(opener, "open")
+    def test_load_offline(self, mock_open):
+        self.loader.offline = True
+        with self.assertRaises(URLError):
+            self.loader.load(self.uri)
+
+        self.loader.write_ref(self.uri, b"foo", '"v1"', None)
+        self.assertEqual(b"foo", self.loader.load(self.uri))
+
+        ref = json.loads(self.loader.ref_path(self.uri).read_text())
+        self.loader.blob_path(ref["digest"]).unlink()
+        with self.assertRaises(URLError):
+            self.loader.load(self.uri)
+
+        self.assertEqual(0, mock_open.call_count)
@@ -1,8 +1,8 @@
-import pickle
 import tempfile
 from pathlib import Path
 from unittest import mock
 
+from tests import fixtures_dir
 from xsdata.codegen.analyzer import ClassAnalyzer
 from xsdata.codegen.container import ClassContainer
 from xsdata.codegen.mappers.definitions import DefinitionsMapper
@@ -12,7 +12,8 @@ from xsdata.codegen.mappers.element import ElementMapper
 from xsdata.codegen.mappers.schema import SchemaMapper
 from xsdata.codegen.parsers import DefinitionsParser
 from xsdata.codegen.parsers.dtd import DtdParser
-from xsdata.codegen.transformer import SchemaTransformer
+from xsdata.codegen.resources import ResourceLoader
+from xsdata.codegen.transformer import MappedSchema, SchemaTransformer
 from xsdata.codegen.utils import ClassUtils
 from xsdata.codegen.writer import CodeWriter
 from xsdata.exceptions import CodeGenerationError
@@ -67,42 +68,20 @@ class SchemaTransformerTests(FactoryTestCase):
 
     @mock.patch.object(SchemaTransformer, "process_classes")
     @mock.patch.object(SchemaTransformer, "process_sources")
-    @mock.patch.object(SchemaTransformer, "get_cache_file")
-    def test_process_from_cache(
-        self, mock_get_cache_file, mock_process_sources, mock_process_classes
-    ):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache = Path(tmpdir).joinpath("foo.cache")
-            classes = ClassFactory.list(2)
-            cache.write_bytes(pickle.dumps(classes))
-
-            mock_get_cache_file.return_value = cache
-            uris = ["a.xml", "b.xml"]
-
-            self.transformer.process(uris, cache=True)
-
-            self.assertEqual(classes, self.transformer.classes)
-            self.assertEqual(0, mock_process_sources.call_count)
-            mock_process_classes.assert_called_once_with()
-
-    @mock.patch.object(SchemaTransformer, "process_classes")
-    @mock.patch.object(SchemaTransformer, "process_sources")
-    @mock.patch.object(SchemaTransformer, "get_cache_file")
+    @mock.patch.object(SchemaTransformer, "get_cache_dir")
     def test_process_with_cache(
-        self, mock_get_cache_file, mock_process_sources, mock_process_classes
+        self, mock_get_cache_dir, mock_process_sources, mock_process_classes
     ):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache = Path(tmpdir).joinpath("foo.cache")
-            classes = ClassFactory.list(2)
-            self.transformer.classes = classes
-            mock_get_cache_file.return_value = cache
-            uris = ["a.xml", "b.xml"]
+        mock_get_cache_dir.return_value = Path("cache")
+        uris = ["a.xml", "b.xml"]
 
-            self.transformer.process(uris, cache=True)
-            self.assertEqual(1, mock_process_sources.call_count)
+        self.transformer.process(uris)
+        self.assertIsNone(self.transformer.cache_dir)
 
-            self.assertEqual(classes, pickle.loads(cache.read_bytes()))
-            mock_process_classes.assert_called_once_with()
+        self.transformer.process(uris, cache=True)
+        self.assertEqual(Path("cache"), self.transformer.cache_dir)
+        mock_process_sources.assert_has_calls([mock.call(uris), mock.call(uris)])
+        self.assertEqual(2, mock_process_classes.call_count)
 
     @mock.patch.object(SchemaTransformer, "convert_schema")
     @mock.patch.object(SchemaTransformer, "convert_definitions")
@@ -166,6 +145,22 @@ class SchemaTransformerTests(FactoryTestCase):
         mock_map.assert_has_calls([mock.call(x, "foo") for x in elements])
         mock_reduce_classes.assert_called_once_with(classes_a + classes_c)
 
+    def test_process_xml_documents_with_workers(self):
+        uris = [
+            fixtures_dir.joinpath("books/books.xml").as_uri(),
+            fixtures_dir.joinpath("books/books_default_ns.xml").as_uri(),
+        ]
+        config = GeneratorConfig()
+
+        transformer = SchemaTransformer(print=True, config=config)
+        transformer.process_xml_documents(uris)
+        expected = transformer.classes
+
+        transformer = SchemaTransformer(print=True, config=config, workers=2)
+        transformer.process_xml_documents(uris)
+
+        self.assertEqual(expected, transformer.classes)
+
     @mock.patch("xsdata.codegen.transformer.logger.warning")
     @mock.patch.object(ClassUtils, "reduce_classes")
     @mock.patch.object(DictMapper, "map")
@@ -318,6 +313,138 @@ class SchemaTransformerTests(FactoryTestCase):
         self.transformer.process_schema(uri, namespace)
         self.assertEqual(0, mock_convert_schema.call_count)
 
+    @mock.patch.object(SchemaTransformer, "process_mapped_schema")
+    @mock.patch.object(SchemaTransformer, "parse_schema")
+    def test_process_schema_with_cache_or_workers(
+        self, mock_parse_schema, mock_process_mapped_schema
+    ):
+        self.transformer.cache_dir = Path("cache")
+        self.transformer.process_schema("foo.xsd", "fooNS")
+
+        self.transformer.cache_dir = None
+        self.transformer.workers = 2
+        self.transformer.process_schema("bar.xsd")
+
+        mock_process_mapped_schema.assert_has_calls(
+            [mock.call("foo.xsd", "fooNS"), mock.call("bar.xsd", None)]
+        )
+        self.assertEqual(0, mock_parse_schema.call_count)
+
+    @mock.patch("xsdata.codegen.transformer.logger.warning")
+    @mock.patch.object(SchemaTransformer, "map_schema")
+    def test_process_mapped_schema(self, mock_map_schema, mock_warning):
+        classes = ClassFactory.list(2)
+        mock_map_schema.side_effect = [
+            MappedSchema([("b.xsd", "foo"), ("a.xsd", "foo")], classes[:1]),
+            MappedSchema([], classes[1:]),
+            None,
+        ]
+        self.transformer.preloaded["a.xsd"] = b"a"
+        self.transformer.cache_dir = Path("cache")
+
+        self.transformer.process_mapped_schema("a.xsd", None)
+        self.transformer.process_mapped_schema("c.xsd", None)
+
+        self.assertEqual(classes[::-1], self.transformer.classes)
+        self.assertEqual({"a.xsd", "b.xsd", "c.xsd"}, self.transformer.processed)
+        loader = self.transformer.loader
+        mock_map_schema.assert_has_calls(
+            [
+                mock.call("a.xsd", None, b"a", Path("cache"), loader),
+                mock.call("b.xsd", "foo", None, Path("cache"), loader),
+            ]
+        )
+        mock_warning.assert_called_once_with("Resource not found %s", "c.xsd")
+
+    def test_map_schema(self):
+        uri = fixtures_dir.joinpath("404.xsd").as_uri()
+        loader = ResourceLoader()
+        self.assertIsNone(self.transformer.map_schema(uri, None, None, None, loader))
+
+        uri = fixtures_dir.joinpath("books/schema.xsd").as_uri()
+        result = self.transformer.map_schema(uri, "foo", None, None, loader)
+        self.assertEqual([], result.includes)
+        self.assertEqual(3, len(result.classes))
+
+    def test_process_schemas_with_workers(self):
+        uris = [
+            fixtures_dir.joinpath("annotations/model.xsd").as_uri(),
+            fixtures_dir.joinpath("books/schema.xsd").as_uri(),
+        ]
+        config = GeneratorConfig()
+
+        transformer = SchemaTransformer(print=True, config=config)
+        transformer.process_schemas(uris)
+        expected = transformer.classes
+
+        transformer = SchemaTransformer(print=True, config=config, workers=2)
+        transformer.process_schemas(uris)
+
+        self.assertEqual(expected, transformer.classes)
+        self.assertEqual(len(transformer.processed), len(transformer.mapped))
+
+    def test_process_cached_schema(self):
+        main = (
+            '<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">'
+            '<xs:include schemaLocation="sub.xsd"/>'
+            '<xs:element name="root" type="xs:{}"/>'
+            "</xs:schema>"
+        )
+        sub = (
+            '<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">'
+            '<xs:element name="{}" type="xs:string"/>'
+            "</xs:schema>"
+        )
+
+        def process(cache_dir: Path) -> SchemaTransformer:
+            transformer = SchemaTransformer(print=True, config=GeneratorConfig())
+            transformer.cache_dir = cache_dir
+            transformer.process_schema(main_path.as_uri())
+            return transformer
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_dir = Path(tmpdir).joinpath("cache")
+            cache_dir.mkdir()
+            main_path = Path(tmpdir).joinpath("main.xsd")
+            sub_path = Path(tmpdir).joinpath("sub.xsd")
+            main_path.write_text(main.format("int"))
+            sub_path.write_text(sub.format("child"))
+
+            expected = process(cache_dir).classes
+            self.assertEqual(["child", "root"], [x.name for x in expected])
+            self.assertEqual(2, len(list(cache_dir.iterdir())))
+
+            with mock.patch.object(
+                SchemaTransformer, "parse_schema_source"
+            ) as mock_parse_schema_source:
+                self.assertEqual(expected, process(cache_dir).classes)
+                self.assertEqual(0, mock_parse_schema_source.call_count)
+
+            sub_path.write_text(sub.format("other"))
+            with mock.patch.object(
+                SchemaTransformer,
+                "parse_schema_source",
+                wraps=self.transformer.parse_schema_source,
+            ) as mock_parse_schema_source:
+                actual = process(cache_dir).classes
+                self.assertEqual(["other", "root"], [x.name for x in actual])
+                self.assertEqual(1, mock_parse_schema_source.call_count)
+                self.assertEqual(
+                    sub_path.as_uri(), mock_parse_schema_source.call_args[0][1]
+                )
+
+            self.assertEqual(3, len(list(cache_dir.iterdir())))
+
+            for path in cache_dir.iterdir():
+                path.write_bytes(path.read_bytes()[:10])
+
+            with self.assertLogs("xsdata.logger", level="WARNING"):
+                actual = process(cache_dir).classes
+
+            self.assertEqual(["other", "root"], [x.name for x in actual])
+            self.assertEqual(3, len(list(cache_dir.iterdir())))
+            self.assertEqual(actual, process(cache_dir).classes)
+
     @mock.patch.object(SchemaTransformer, "generate_classes")
     @mock.patch.object(SchemaTransformer, "process_schema")
     def test_convert_schema(self, mock_process_schema, mock_generate_classes):
@@ -483,10 +610,21 @@ class SchemaTransformerTests(FactoryTestCase):
         self.assertEqual(2, len(actual.data))
         self.assertEqual(self.transformer.config, actual.config)
 
-    def test_get_cache_file(self):
-        uris = ["a.xml", "b.json"]
-        actual = self.transformer.get_cache_file(uris)
-        tempdir = Path(tempfile.gettempdir())
-        expected = tempdir.joinpath("ae1bed744d3d3611e698a2d2ef5335d2.cache")
+    def test_get_cache_dir(self):
+        actual = self.transformer.get_cache_dir()
+        expected = Path(tempfile.gettempdir()).joinpath("xsdata-schemas")
 
         self.assertEqual(expected, actual)
+        self.assertTrue(actual.is_dir())
+
+    def test_get_cache_file(self):
+        cache_dir = Path("cache")
+        get_cache_file = self.transformer.get_cache_file
+        actual = get_cache_file(cache_dir, "a.xsd", None, b"<a/>")
+
+        self.assertEqual(cache_dir, actual.parent)
+        self.assertEqual(".cache", actual.suffix)
+        self.assertEqual(actual, get_cache_file(cache_dir, "a.xsd", "", b"<a/>"))
+        self.assertNotEqual(actual, get_cache_file(cache_dir, "a.xsd", "a", b"<a/>"))
+        self.assertNotEqual(actual, get_cache_file(cache_dir, "b.xsd", None, b"<a/>"))
+        self.assertNotEqual(actual, get_cache_file(cache_dir, "a.xsd", None, b"<b/>"))
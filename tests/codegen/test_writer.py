@@ -1,3 +1,5 @@
+import json
+import os
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import Iterator, List
@@ -23,15 +25,14 @@ class CodeWriterTests(FactoryTestCase):
         generator = NoneGenerator(config)
         self.writer = CodeWriter(generator)
 
-    @mock.patch.object(CodeWriter, "ruff_code")
+    @mock.patch.object(CodeWriter, "ruff_files")
     @mock.patch.object(NoneGenerator, "render_header")
     @mock.patch.object(NoneGenerator, "render")
     @mock.patch.object(NoneGenerator, "normalize_packages")
     def test_write(
-        self, mock_normalize_packages, mock_render, mock_render_header, mock_ruff_code
+        self, mock_normalize_packages, mock_render, mock_render_header, mock_ruff_files
     ):
         classes = ClassFactory.list(2)
-        mock_ruff_code.side_effect = lambda x, y: x
         with TemporaryDirectory() as tmpdir:
             mock_render.return_value = [
                 GeneratorResult(Path(f"{tmpdir}/foo/a.py"), "file", "aAa"),
@@ -39,13 +40,157 @@ class CodeWriterTests(FactoryTestCase):
                 GeneratorResult(Path(f"{tmpdir}/c.py"), "file", " "),
             ]
             mock_render_header.return_value = "// Head\n"
-            self.writer.write(classes)
+            with mock.patch.object(Path, "cwd", return_value=Path(tmpdir)):
+                self.writer.write(classes)
 
             self.assertEqual("// Head\naAa", Path(f"{tmpdir}/foo/a.py").read_text())
             self.assertEqual("// Head\nbBb", Path(f"{tmpdir}/bar/b.py").read_text())
             self.assertFalse(Path(f"{tmpdir}/c.py").exists())
+            self.assertEqual(["bar", "foo"], sorted(os.listdir(tmpdir)))
             mock_normalize_packages.assert_called_once_with(classes)
 
+            staged = mock_ruff_files.call_args[0][0]
+            self.assertEqual(
+                [Path(f"{tmpdir}/foo"), Path(f"{tmpdir}/bar")],
+                [path.parent for path in staged],
+            )
+            self.assertTrue(staged[0].name.startswith(".a."))
+            self.assertEqual(".py", staged[0].suffix)
+            self.assertEqual(["a.py"], os.listdir(f"{tmpdir}/foo"))
+
+    @mock.patch.object(CodeWriter, "ruff_files")
+    @mock.patch.object(NoneGenerator, "render")
+    @mock.patch.object(NoneGenerator, "normalize_packages")
+    def test_write_with_ruff_failure(
+        self, mock_normalize_packages, mock_render, mock_ruff_files
+    ):
+        mock_ruff_files.side_effect = CodeGenerationError("Ruff failed")
+        with TemporaryDirectory() as tmpdir:
+            a = Path(f"{tmpdir}/a.py")
+            a.write_text("aAa")
+            mock_render.return_value = [GeneratorResult(a, "file", "bBb")]
+
+            with self.assertRaises(CodeGenerationError):
+                self.writer.write([])
+
+            self.assertEqual(["a.py"], os.listdir(tmpdir))
+            self.assertEqual("aAa", a.read_text())
+
+    @mock.patch.object(CodeWriter, "prune_modules")
+    @mock.patch.object(CodeWriter, "ruff_files")
+    @mock.patch.object(NoneGenerator, "render")
+    @mock.patch.object(NoneGenerator, "normalize_packages")
+    def test_write_skips_unchanged_files(
+        self, mock_normalize_packages, mock_render, mock_ruff_files, mock_prune
+    ):
+        with TemporaryDirectory() as tmpdir:
+            a = Path(f"{tmpdir}/a.py")
+            b = Path(f"{tmpdir}/b.py")
+            a.write_text("aAa")
+            b.write_text("bBb")
+            os.utime(a, ns=(0, 0))
+            os.utime(b, ns=(0, 0))
+
+            mock_render.return_value = [
+                GeneratorResult(a, "file", "aAa"),
+                GeneratorResult(b, "file", "bbb"),
+            ]
+            with mock.patch.object(Path, "cwd", return_value=Path(tmpdir)):
+                self.writer.write([])
+
+            self.assertEqual(0, a.stat().st_mtime_ns)
+            self.assertNotEqual(0, b.stat().st_mtime_ns)
+            self.assertEqual("bbb", b.read_text())
+            self.assertEqual(0, mock_prune.call_count)
+
+            self.writer.generator.config.output.prune_modules = True
+            with mock.patch.object(Path, "cwd", return_value=Path(tmpdir)):
+                self.writer.write([])
+
+            mock_prune.assert_called_once_with([a, b])
+
+    def test_prune_modules(self):
+        self.writer.generator.config.output.package = "foo.bar"
+        with TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir).joinpath("foo", "bar")
+            manifest = root.joinpath(CodeWriter.manifest_name)
+            paths = [
+                Path(tmpdir).joinpath("foo", "__init__.py"),
+                root.joinpath("__init__.py"),
+                root.joinpath("a.py"),
+                root.joinpath("sub", "b.py"),
+                root.joinpath("c.py"),
+            ]
+            for path in paths:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text(path.name)
+
+            with mock.patch.object(Path, "cwd", return_value=Path(tmpdir)):
+                self.writer.prune_modules(paths)
+
+                self.assertEqual(
+                    ["__init__.py", "a.py", "c.py", "sub/b.py"],
+                    list(json.loads(manifest.read_text())),
+                )
+
+                os.utime(manifest, ns=(0, 0))
+                self.writer.prune_modules(paths)
+                self.assertEqual(0, manifest.stat().st_mtime_ns)
+
+                paths[4].write_text("modified")
+                self.writer.prune_modules(paths[:2])
+
+            self.assertTrue(all(path.exists() for path in paths[:2]))
+            self.assertFalse(paths[2].exists())
+            self.assertFalse(paths[3].parent.exists())
+            self.assertTrue(paths[4].exists())
+            self.assertEqual(["__init__.py"], list(json.loads(manifest.read_text())))
+
+    def test_prune_modules_ignores_entries_outside_the_package(self):
+        self.writer.generator.config.output.package = "foo.bar"
+        with TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir).joinpath("foo", "bar")
+            root.mkdir(parents=True)
+            outside = Path(tmpdir).joinpath("x.py")
+            absolute = Path(tmpdir).joinpath("y.py")
+            for path in (outside, absolute):
+                path.write_text(path.name)
+
+            manifest = root.joinpath(CodeWriter.manifest_name)
+            entries = {
+                "../../x.py": CodeWriter.hash_file(outside),
+                str(absolute): CodeWriter.hash_file(absolute),
+            }
+            manifest.write_text(json.dumps(entries))
+
+            with mock.patch.object(
+                Path, "cwd", return_value=Path(tmpdir)
+            ), self.assertLogs("xsdata.logger", level="WARNING") as cm:
+                self.writer.prune_modules([])
+
+            self.assertTrue(outside.exists())
+            self.assertTrue(absolute.exists())
+            self.assertEqual(2, len(cm.output))
+            self.assertEqual({}, json.loads(manifest.read_text()))
+
+    @mock.patch.object(CodeWriter, "ruff_files")
+    @mock.patch.object(NoneGenerator, "render")
+    @mock.patch.object(NoneGenerator, "normalize_packages")
+    def test_write_outside_of_cwd(
+        self, mock_normalize_packages, mock_render, mock_ruff_files
+    ):
+        with TemporaryDirectory() as cwd, TemporaryDirectory() as tmpdir:
+            mock_render.return_value = [
+                GeneratorResult(Path(f"{tmpdir}/foo/a.py"), "file", "aAa"),
+            ]
+            with mock.patch.object(Path, "cwd", return_value=Path(cwd)):
+                self.writer.write([])
+
+            self.assertEqual("aAa", Path(f"{tmpdir}/foo/a.py").read_text())
+            self.assertEqual([], os.listdir(cwd))
+            staged = mock_ruff_files.call_args[0][0]
+            self.assertEqual(Path(f"{tmpdir}/foo"), staged[0].parent)
+
     @mock.patch.object(CodeWriter, "ruff_code")
     @mock.patch.object(NoneGenerator, "render_header")
     @mock.patch.object(NoneGenerator, "render")
@@ -117,6 +262,49 @@ class CodeWriterTests(FactoryTestCase):
         )
         self.assertEqual(expected, actual)
 
+    def test_ruff_files(self):
+        src_code = "import sys\n@dataclass\n\nclass MyType:\n    value: str=field(default=None)\n"
+        expected = (
+            "import sys\n"
+            "\n"
+            "\n"
+            "@dataclass\n"
+            "class MyType:\n"
+            "    value: str = field(default=None)\n"
+        )
+
+        with TemporaryDirectory() as tmpdir, mock.patch.object(
+            CodeWriter, "ruff_batch_size", 1
+        ):
+            paths = [Path(tmpdir).joinpath(f"{name}.py") for name in "ab"]
+            for path in paths:
+                path.write_text(src_code)
+
+            self.writer.ruff_files(paths)
+            self.assertEqual([expected, expected], [x.read_text() for x in paths])
+
+            paths[1].write_text('a = "1')
+            with self.assertRaises(CodeGenerationError) as cm:
+                self.writer.ruff_files(paths)
+
+            self.assertIn("Ruff failed", str(cm.exception))
+
+    @mock.patch.object(NoneGenerator, "render")
+    @mock.patch.object(NoneGenerator, "normalize_packages")
+    def test_write_with_destination_ruff_config(
+        self, mock_normalize_packages, mock_render
+    ):
+        with TemporaryDirectory() as cwd, TemporaryDirectory() as tmpdir:
+            Path(tmpdir).joinpath("ruff.toml").write_text(
+                '[format]\nquote-style = "single"\n'
+            )
+            path = Path(tmpdir).joinpath("a.py")
+            mock_render.return_value = [GeneratorResult(path, "file", 'a = "b"\n')]
+            with mock.patch.object(Path, "cwd", return_value=Path(cwd)):
+                self.writer.write([])
+
+            self.assertEqual("a = 'b'\n", path.read_text())
+
     def test_format_with_invalid_code(self):
         src_code = """a = "1"""
         file_path = Path(__file__)
@@ -1,3 +1,4 @@
+from unittest import mock
 from unittest.case import TestCase
 
 from lxml import etree
@@ -5,9 +6,14 @@ from lxml import etree
 from tests import fixtures_dir
 from tests.fixtures.books import BookForm, Books
 from tests.fixtures.books.fixtures import books, events, events_default_ns
+from tests.fixtures.models import Paragraph, Span
 from xsdata.exceptions import ParserError, XmlHandlerError
+from xsdata.formats.dataclass.parsers import TreeParser
 from xsdata.formats.dataclass.parsers.bases import RecordParser
-from xsdata.formats.dataclass.parsers.handlers import LxmlEventHandler
+from xsdata.formats.dataclass.parsers.handlers import (
+    LxmlEventHandler,
+    LxmlTargetHandler,
+)
 
 
 class LxmlEventHandlerTests(TestCase):
@@ -26,6 +32,29 @@ class LxmlEventHandlerTests(TestCase):
         self.assertEqual({None: "urn:books"}, self.parser.ns_map)
         self.assertEqual(events_default_ns, self.parser.events)
 
+    def test_feed(self):
+        data = fixtures_dir.joinpath("books/books.xml").read_bytes()
+        for i in range(0, len(data), 7):
+            self.parser.feed(data[i : i + 7], Books)
+
+        self.assertEqual(books, self.parser.close())
+        self.assertEqual({"brk": "urn:books"}, self.parser.ns_map)
+        self.assertEqual(events, self.parser.events)
+
+    def test_feed_with_mixed_content(self):
+        xml = (
+            b'<a:mixed xmlns:a="urn:a">lead <!-- ignored -->text'
+            b'<b xmlns="urn:b">one</b>tail one<c><d/>inner tail</c>tail two'
+            b"</a:mixed>"
+        )
+        parser = TreeParser(handler=self.parser.handler)
+        expected = parser.from_bytes(xml)
+
+        for i in range(len(xml)):
+            parser.feed(xml[i : i + 1])
+
+        self.assertEqual(expected, parser.close())
+
     def test_parse_with_element_or_tree(self):
         path = fixtures_dir.joinpath("books/books.xml")
         tree = etree.parse(str(path))
@@ -37,6 +66,29 @@ class LxmlEventHandlerTests(TestCase):
         result = self.parser.parse(tree.find(".//book"), BookForm)
         self.assertEqual(books.book[0], result)
 
+    def test_parse_with_namespace_scopes(self):
+        def start(*args):
+            records.append(args[-1])
+            return original(parser, *args)
+
+        xml = (
+            '<a:root xmlns:a="urn:a"><a:item><b:item xmlns:b="urn:b"><c/></b:item>'
+            "</a:item></a:root>"
+        )
+        original = TreeParser.start
+        records = []
+        parser = TreeParser(handler=self.parser.handler)
+        with mock.patch.object(TreeParser, "start", side_effect=start):
+            parser.from_string(xml)
+            tree = etree.fromstring(xml)
+            parser.parse(tree[0][0])
+
+        a = {"a": "urn:a"}
+        ab = {"a": "urn:a", "b": "urn:b"}
+        self.assertEqual([a, a, ab, ab, ab, ab], records)
+        self.assertIs(records[0], records[1])
+        self.assertIs(records[2], records[3])
+
     def test_parse_with_xinclude(self):
         path = fixtures_dir.joinpath("books/books-xinclude.xml")
         ns_map = {"brk": "urn:books", "xi": "http://www.w3.org/2001/XInclude"}
@@ -65,3 +117,39 @@ class LxmlEventHandlerTests(TestCase):
     def test_parse_with_xml_syntax_error(self):
         with self.assertRaises(ParserError):
             self.parser.from_string("<", Books)
+
+
+class LxmlTargetHandlerTests(LxmlEventHandlerTests):
+    def setUp(self) -> None:
+        self.parser = RecordParser(handler=LxmlTargetHandler)
+
+    def test_parse_with_mixed_content(self):
+        xml = (
+            '<a:mixed xmlns:a="urn:a">'
+            "lead <!-- ignored -->text"
+            '<b xmlns="urn:b">one</b>tail one'
+            "<c><d/>inner tail</c>"
+            "tail two"
+            "</a:mixed>"
+        )
+        expected = TreeParser(handler=LxmlEventHandler)
+        actual = TreeParser(handler=LxmlTargetHandler)
+
+        obj = actual.from_string(xml)
+        self.assertEqual(expected.from_string(xml), obj)
+        self.assertEqual(expected.ns_map, actual.ns_map)
+        self.assertEqual("lead text", obj.text)
+        self.assertEqual("tail one", obj.children[0].tail)
+        self.assertEqual("inner tail", obj.children[1].children[0].tail)
+        self.assertEqual("tail two", obj.children[1].tail)
+
+    def test_parse_with_mixed_content_model(self):
+        xml = "<p>a<!-- -->b<span>c</span>d<span>e</span>f</p>"
+        actual = self.parser.from_string(xml, Paragraph)
+        self.assertEqual(["ab", Span("c"), "d", Span("e"), "f"], actual.content)
+
+    def test_parse_with_callback_error(self):
+        with self.assertRaises(ParserError) as cm:
+            self.parser.from_string("<books><unknown/></books>", Books)
+
+        self.assertIn("Unknown property", str(cm.exception))
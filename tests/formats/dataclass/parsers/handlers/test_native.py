@@ -7,9 +7,11 @@ import pytest
 from tests import fixtures_dir
 from tests.fixtures.books import BookForm, Books
 from tests.fixtures.books.fixtures import books, events, events_default_ns
+from tests.fixtures.models import Paragraph, Span
 from xsdata.exceptions import ParserError, XmlHandlerError
+from xsdata.formats.dataclass.parsers import TreeParser
 from xsdata.formats.dataclass.parsers.bases import RecordParser
-from xsdata.formats.dataclass.parsers.handlers import XmlEventHandler
+from xsdata.formats.dataclass.parsers.handlers import ExpatHandler, XmlEventHandler
 from xsdata.formats.dataclass.parsers.handlers.native import get_base_url
 
 
@@ -42,6 +44,29 @@ class XmlEventHandlerTests(TestCase):
         with self.assertRaises(ParserError):
             self.parser.from_string("<", Books)
 
+    def test_feed(self):
+        data = fixtures_dir.joinpath("books/books.xml").read_bytes()
+        for i in range(0, len(data), 7):
+            self.parser.feed(data[i : i + 7], Books)
+
+        self.assertEqual(books, self.parser.close())
+        self.assertEqual({"brk": "urn:books"}, self.parser.ns_map)
+        self.assertEqual(events, self.parser.events)
+
+    def test_feed_with_mixed_content(self):
+        xml = (
+            b'<a:mixed xmlns:a="urn:a">lead <!-- ignored -->text'
+            b'<b xmlns="urn:b">one</b>tail one<c><d/>inner tail</c>tail two'
+            b"</a:mixed>"
+        )
+        parser = TreeParser(handler=self.parser.handler)
+        expected = parser.from_bytes(xml)
+
+        for i in range(len(xml)):
+            parser.feed(xml[i : i + 1])
+
+        self.assertEqual(expected, parser.close())
+
     def test_parse_with_element_or_tree(self):
         path = fixtures_dir.joinpath("books/books.xml")
         tree = etree.ElementTree.parse(str(path))
@@ -76,3 +101,39 @@ class XmlEventHandlerTests(TestCase):
         self.assertIsNone(get_base_url(None, None))
         self.assertIsNone(get_base_url(None, None))
         self.assertEqual("config/", get_base_url("config/", "/tmp/foo.xml"))
+
+
+class ExpatHandlerTests(XmlEventHandlerTests):
+    def setUp(self):
+        self.parser = RecordParser(handler=ExpatHandler)
+
+    def test_parse_with_mixed_content(self):
+        xml = (
+            '<a:mixed xmlns:a="urn:a" xml:lang="en" a:x="1">'
+            "lead <!-- ignored -->text"
+            '<b xmlns="urn:b">one</b>tail one'
+            "<c><d/>inner tail</c>"
+            "tail two"
+            "</a:mixed>"
+        )
+        expected = TreeParser(handler=XmlEventHandler)
+        actual = TreeParser(handler=ExpatHandler)
+
+        obj = actual.from_string(xml)
+        self.assertEqual(expected.from_string(xml), obj)
+        self.assertEqual({"a": "urn:a", None: "urn:b"}, actual.ns_map)
+        self.assertEqual("lead text", obj.text)
+        self.assertEqual("tail one", obj.children[0].tail)
+        self.assertEqual("inner tail", obj.children[1].children[0].tail)
+        self.assertEqual("tail two", obj.children[1].tail)
+
+    def test_parse_with_mixed_content_model(self):
+        xml = "<p>a<!-- -->b<span>c</span>d<span>e</span>f</p>"
+        actual = self.parser.from_string(xml, Paragraph)
+        self.assertEqual(["ab", Span("c"), "d", Span("e"), "f"], actual.content)
+
+    def test_parse_with_xml_syntax_error(self):
+        with self.assertRaises(ParserError) as cm:
+            self.parser.from_string("<books>", Books)
+
+        self.assertIn("no element found: line 1, column 7", str(cm.exception))
@@ -193,6 +193,15 @@ class ElementNodeTests(FactoryTestCase):
         expected = {"attrs": {"extended": "attr", "{what}ever": "qname"}, "index": 0}
         self.assertEqual(expected, params)
 
+    def test_bind_attrs_with_projection(self):
+        self.node.meta = self.context.build(AttrsType)
+        self.node.projection = {"index": None}
+        self.node.attrs = {"index": "0", "{what}ever": "qname"}
+
+        params = {}
+        self.node.bind_attrs(params)
+        self.assertEqual({"index": 0}, params)
+
     def test_bind_attrs_with_fail_on_unknown_attributes(self):
         self.node.meta = self.context.build(AttrsType)
         self.node.config.fail_on_unknown_attributes = True
@@ -298,6 +307,9 @@ class ElementNodeTests(FactoryTestCase):
         actual = self.node.prepare_generic_value("a", fixture("foo"), var)
         self.assertEqual(fixture("foo"), actual)
 
+        actual = self.node.prepare_generic_value("a", {"content": "foo"}, var)
+        self.assertEqual({"content": "foo"}, actual)
+
     def test_child(self):
         var = XmlVarFactory.create(xml_type=XmlType.ELEMENT, qname="a", types=(TypeC,))
         attrs = {"a": "b"}
@@ -311,6 +323,90 @@ class ElementNodeTests(FactoryTestCase):
         self.assertEqual(ns_map, actual.ns_map)
         self.assertEqual(position, actual.position)
 
+    def test_child_with_projection(self):
+        var = XmlVarFactory.create(xml_type=XmlType.ELEMENT, qname="a", types=(TypeC,))
+        self.meta.elements[var.qname] = [var]
+        self.node.config.fail_on_unknown_properties = True
+
+        self.node.projection = {"b": None}
+        actual = self.node.child("a", {}, {}, 1)
+        self.assertIsInstance(actual, SkipNode)
+
+        self.node.projection = {var.name: {"x": None}}
+        actual = self.node.child("a", {}, {}, 1)
+        self.assertIsInstance(actual, ElementNode)
+        self.assertEqual({"x": None}, actual.projection)
+
+        self.node.projection = {var.name: None}
+        actual = self.node.child("a", {}, {}, 1)
+        self.assertIsNone(actual.projection)
+
+    def test_child_when_rejected(self):
+        var = XmlVarFactory.create(xml_type=XmlType.ELEMENT, qname="a", types=(TypeC,))
+        self.meta.elements[var.qname] = [var]
+        self.node.rejected = True
+
+        actual = self.node.child("a", {}, {}, 1)
+        self.assertIsInstance(actual, SkipNode)
+
+    def test_child_with_predicates(self):
+        self.node.meta = self.context.build(Books)
+        self.node.predicates = {"book": {"id": lambda x: x == "bk001"}}
+
+        actual = self.node.child("book", {"id": "bk001"}, {}, 0)
+        self.assertIsInstance(actual, ElementNode)
+        self.assertEqual(self.node.predicates["book"], actual.predicates)
+
+        actual = self.node.child("book", {"id": "bk002"}, {}, 0)
+        self.assertIsInstance(actual, SkipNode)
+
+        actual = self.node.child("book", {}, {}, 0)
+        self.assertIsInstance(actual, SkipNode)
+
+    def test_accepts(self):
+        self.node.meta = self.context.build(SequentialType)
+        self.node.predicates = {"x4": lambda x: x > 0, "x1": lambda x: False}
+
+        self.assertTrue(self.node.accepts("x4", 1))
+        self.assertFalse(self.node.accepts("x4", 0))
+        self.assertTrue(self.node.accepts("x1", 1))
+        self.assertTrue(self.node.accepts("x2", 1))
+
+    def test_accepts_params(self):
+        self.node.meta = self.context.build(SequentialType)
+        self.node.predicates = {
+            "x0": lambda x: x is not None,
+            "x1": bool,
+            "x4": lambda x: x is not None,
+        }
+
+        self.assertTrue(self.node.accepts_params({"x0": 0, "x1": [1], "x4": None}))
+        self.assertFalse(self.node.accepts_params({"x0": None, "x1": [1], "x4": 1}))
+        self.assertFalse(self.node.accepts_params({"x0": 0, "x1": [], "x4": 1}))
+        self.assertFalse(self.node.accepts_params({"x0": 0, "x1": [1]}))
+
+    def test_bind_with_predicates(self):
+        self.node.meta = self.context.build(SequentialType)
+        self.node.position = 1
+        self.node.predicates = {"x1": bool}
+
+        objects = [("x0", 0), ("x1", 1)]
+        self.assertTrue(self.node.bind("foo", None, None, objects))
+        self.assertEqual([("x0", 0), ("foo", SequentialType(x1=[1]))], objects)
+
+        objects = [("x0", 0), ("x2", 2)]
+        self.assertFalse(self.node.bind("foo", None, None, objects))
+        self.assertEqual([("x0", 0)], objects)
+
+        objects = [("x0", 0), ("x1", 1)]
+        self.node.reject(objects)
+        self.assertTrue(self.node.rejected)
+        self.assertEqual([("x0", 0)], objects)
+
+        objects.append(("x1", 1))
+        self.assertFalse(self.node.bind("foo", None, None, objects))
+        self.assertEqual([("x0", 0)], objects)
+
     def test_child_with_unique_element(self):
         single = XmlVarFactory.create(
             index=1, xml_type=XmlType.ELEMENT, qname="cc", types=(TypeC,)
@@ -318,8 +414,12 @@ class ElementNodeTests(FactoryTestCase):
         wildcard = XmlVarFactory.create(
             index=2, xml_type=XmlType.WILDCARD, qname="cc", types=(object,)
         )
-        self.meta.elements[single.qname] = [single]
-        self.meta.wildcards.append(wildcard)
+        self.node.meta = XmlMetaFactory.create(
+            clazz=TypeC,
+            qname="foo",
+            elements={single.qname: [single]},
+            wildcards=[wildcard],
+        )
 
         attrs = {"a": "b"}
         ns_map = {"ns0": "xsdata"}
@@ -339,8 +439,12 @@ class ElementNodeTests(FactoryTestCase):
         element = XmlVarFactory.create(xml_type=XmlType.ELEMENT, qname="a")
         wildcard = XmlVarFactory.create(xml_type=XmlType.WILDCARD, qname="a")
 
-        self.meta.elements[element.qname] = [element]
-        self.meta.wildcards.append(wildcard)
+        self.node.meta = XmlMetaFactory.create(
+            clazz=TypeC,
+            qname="foo",
+            elements={element.qname: [element]},
+            wildcards=[wildcard],
+        )
 
         with self.assertRaises(ParserError) as cm:
             self.node.child("a", {}, {}, 0)
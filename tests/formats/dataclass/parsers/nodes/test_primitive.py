@@ -16,7 +16,7 @@ class PrimitiveNodeTests(TestCase):
             xml_type=XmlType.TEXT, name="foo", qname="foo", types=(int,), format="Nope"
         )
         ns_map = {"foo": "bar"}
-        node = PrimitiveNode(var, ns_map, False, DerivedElement)
+        node = PrimitiveNode(var, ns_map, False, DerivedElement, True)
         objects = []
 
         self.assertTrue(node.bind("foo", "13", "Impossible", objects))
@@ -29,6 +29,7 @@ class PrimitiveNodeTests(TestCase):
             ns_map=ns_map,
             tokens_factory=var.tokens_factory,
             format=var.format,
+            array_tokens=True,
         )
 
     def test_bind_derived_mode(self):
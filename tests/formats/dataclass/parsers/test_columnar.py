@@ -0,0 +1,147 @@
+import io
+import sys
+from array import array
+from decimal import Decimal
+from unittest import TestCase, mock
+
+from tests import fixtures_dir
+from tests.fixtures.books import BookForm, Books
+from tests.fixtures.models import ExtendedListType, TypeD
+from tests.fixtures.primer import PurchaseOrder
+from xsdata.exceptions import ParserError
+from xsdata.formats.dataclass.parsers.columnar import Column, ColumnarParser
+from xsdata.formats.dataclass.parsers.handlers import XmlEventHandler
+from xsdata.models.datatype import XmlDate
+
+
+class ColumnTests(TestCase):
+    def test_append(self):
+        column = Column("x", "q")
+        column.append(1)
+        column.append(None)
+        column.append(3)
+
+        self.assertEqual(3, len(column))
+        self.assertEqual(array("q", [1, 0, 3]), column.values)
+        self.assertEqual(array("b", [1, 0, 1]), column.mask)
+
+        column = Column("y")
+        column.append("a")
+        column.append(None)
+
+        self.assertEqual(["a", None], column.values)
+        self.assertEqual(array("b", [1, 0]), column.mask)
+
+    def test_append_with_invalid_array_values(self):
+        column = Column("x", "q")
+        column.append(1)
+        column.append(None)
+        column.append(2**64)
+
+        self.assertIsNone(column.typecode)
+        self.assertEqual([1, None, 2**64], column.values)
+        self.assertEqual(array("b", [1, 0, 1]), column.mask)
+
+        column = Column("y", "d")
+        column.append(1.5)
+        column.append("abc")
+        column.append(2.5)
+
+        self.assertIsNone(column.typecode)
+        self.assertEqual([1.5, "abc", 2.5], column.values)
+        self.assertEqual(array("b", [1, 1, 1]), column.mask)
+
+    def test_to_numpy(self):
+        column = Column("x", "d")
+        column.append(1.5)
+        column.append(None)
+
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            with self.assertRaises(ParserError) as cm:
+                column.to_numpy()
+
+            self.assertEqual(
+                "Column.to_numpy requires numpy to run.", str(cm.exception)
+            )
+        else:
+            actual = column.to_numpy()
+            self.assertEqual([1.5, None], actual.tolist())
+
+        with mock.patch.dict(sys.modules, {"numpy": None}), self.assertRaises(
+            ParserError
+        ):
+            column.to_numpy()
+
+
+class ColumnarParserTests(TestCase):
+    def setUp(self):
+        self.parser = ColumnarParser(handler=XmlEventHandler)
+
+    def test_parse_columns(self):
+        path = fixtures_dir.joinpath("books/books.xml")
+        paths = ["id", "price", "pub_date"]
+        columns = self.parser.parse_columns(str(path), BookForm, paths, Books)
+
+        self.assertEqual(paths, list(columns))
+        self.assertEqual(["bk001", "bk002"], columns["id"].values)
+        self.assertEqual(array("d", [44.95, 33.95]), columns["price"].values)
+        self.assertEqual(
+            [XmlDate(2000, 10, 1), XmlDate(2001, 1, 10)], columns["pub_date"].values
+        )
+        self.assertIsNone(self.parser.record)
+        self.assertIsNone(self.parser.projection)
+        self.assertEqual([], self.parser.columns)
+
+    def test_parse_columns_with_missing_values(self):
+        xml = (
+            '<books xmlns="urn:books">'
+            '<book xmlns="" id="1"><price>1.5</price></book>'
+            '<book xmlns=""><title>foo</title></book>'
+            "</books>"
+        )
+        paths = ["id", "price", "title"]
+        source = io.BytesIO(xml.encode())
+        columns = self.parser.parse_columns(source, BookForm, paths, Books)
+
+        self.assertEqual(["1", None], columns["id"].values)
+        self.assertEqual(array("b", [1, 0]), columns["id"].mask)
+        self.assertEqual(array("d", [1.5, 0]), columns["price"].values)
+        self.assertEqual(array("b", [1, 0]), columns["price"].mask)
+        self.assertEqual([None, "foo"], columns["title"].values)
+        self.assertEqual(array("b", [0, 1]), columns["title"].mask)
+
+    def test_parse_columns_with_nested_paths(self):
+        path = fixtures_dir.joinpath("primer/sample.xml")
+        paths = ["bill_to.zip", "comment"]
+        columns = self.parser.parse_columns(str(path), PurchaseOrder, paths)
+
+        self.assertEqual([Decimal("95819")], columns["bill_to.zip"].values)
+        self.assertEqual(["Hurry, my lawn is going wild!"], columns["comment"].values)
+
+    def test_build_column(self):
+        column = self.parser.build_column(TypeD, "x")
+        self.assertEqual("x", column.path)
+        self.assertEqual("q", column.typecode)
+
+        self.assertEqual("b", self.parser.build_column(TypeD, "z").typecode)
+        self.assertIsNone(self.parser.build_column(TypeD, "y").typecode)
+        self.assertIsNone(
+            self.parser.build_column(ExtendedListType, "wildcard").typecode
+        )
+
+        with self.assertRaises(ParserError) as cm:
+            self.parser.build_column(TypeD, "a")
+
+        self.assertEqual("Unknown field `a` of `TypeD`", str(cm.exception))
+
+        with self.assertRaises(ParserError) as cm:
+            self.parser.build_column(PurchaseOrder, "bill_to")
+
+        self.assertEqual("Field `bill_to` is not a leaf field", str(cm.exception))
+
+        with self.assertRaises(ParserError) as cm:
+            self.parser.build_column(Books, "book.id")
+
+        self.assertEqual("Field `book.id` is not a leaf field", str(cm.exception))
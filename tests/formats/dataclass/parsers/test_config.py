@@ -0,0 +1,59 @@
+from unittest import TestCase
+
+from tests import fixtures_dir
+from tests.fixtures.books import BookForm, Books
+from tests.fixtures.models import TypeC
+from xsdata.formats.dataclass.parsers import JsonParser, XmlParser
+from xsdata.formats.dataclass.parsers.config import (
+    ParserConfig,
+    dict_class_factory,
+    namedtuple_class_factory,
+    namedtuple_type,
+)
+from xsdata.models.datatype import XmlDate
+
+
+class ClassFactoriesTests(TestCase):
+    def test_dict_class_factory(self):
+        params = {"x": 1, "y": "a"}
+        self.assertIs(params, dict_class_factory(TypeC, params))
+
+    def test_namedtuple_class_factory(self):
+        actual = namedtuple_class_factory(TypeC, {"x": 1, "y": "a"})
+        self.assertEqual(("x", "y", "z"), actual._fields)
+        self.assertEqual((1, "a", None), actual)
+        self.assertEqual("TypeC", type(actual).__name__)
+        self.assertIs(namedtuple_type(TypeC), type(actual))
+
+        actual = namedtuple_class_factory(BookForm, {"id": "bk001"})
+        self.assertEqual("bk001", actual.id)
+        self.assertIsNone(actual.title)
+        self.assertNotIn("lang", actual._fields)
+
+    def test_parse_with_dict_class_factory(self):
+        config = ParserConfig(class_factory=dict_class_factory)
+        path = fixtures_dir.joinpath("books/books.xml")
+        books = XmlParser(config=config).from_path(path, Books)
+        expected = {
+            "author": "Nagata, Suanne",
+            "title": "Becoming Somebody",
+            "genre": "Biography",
+            "price": 33.95,
+            "pub_date": XmlDate(2001, 1, 10),
+            "review": "A masterpiece of the fine art of gossiping.",
+            "id": "bk002",
+        }
+        self.assertEqual(2, len(books["book"]))
+        self.assertEqual(expected, books["book"][1])
+
+        path = fixtures_dir.joinpath("books/books.json")
+        books = JsonParser(config=config).from_path(path, Books)
+        self.assertEqual("bk002", books["book"][1]["id"])
+
+    def test_parse_with_namedtuple_class_factory(self):
+        config = ParserConfig(class_factory=namedtuple_class_factory)
+        path = fixtures_dir.joinpath("books/books.xml")
+        books = XmlParser(config=config).from_path(path, Books)
+        self.assertEqual(2, len(books.book))
+        self.assertEqual("Becoming Somebody", books.book[1].title)
+        self.assertEqual(XmlDate(2001, 1, 10), books.book[1].pub_date)
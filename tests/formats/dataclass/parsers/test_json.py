@@ -1,3 +1,4 @@
+import asyncio
 import json
 from dataclasses import asdict, make_dataclass
 from typing import List, Optional, Union
@@ -64,6 +65,33 @@ class JsonParserTests(FactoryTestCase):
             books.book[1],
         )
 
+    def test_parse_with_fields(self):
+        path = fixtures_dir.joinpath("books/books.json")
+        self.parser.config.fields = ["book.title", "book.id"]
+        books = self.parser.from_path(path, Books)
+
+        expected = [
+            BookForm(title="The First Book", id="bk001"),
+            BookForm(title="Becoming Somebody", id="bk002"),
+        ]
+        self.assertEqual(expected, books.book)
+
+        self.parser.config.fields = ["book.titl"]
+        with self.assertRaises(ParserError) as cm:
+            self.parser.from_path(path, Books)
+
+        self.assertEqual("Unknown field `book.titl` of `Books`", str(cm.exception))
+
+    def test_parse_async(self):
+        async def chunks():
+            yield data[:100]
+            yield data[100:]
+
+        path = fixtures_dir.joinpath("books/books.json")
+        data = path.read_bytes()
+        actual = asyncio.run(self.parser.parse_async(chunks(), Books))
+        self.assertEqual(self.parser.from_path(path, Books), actual)
+
     def test_parse_empty_document(self):
         self.assertEqual(BookForm(), self.parser.from_string("{}", BookForm))
         self.assertEqual([], self.parser.from_string("[]", List[BookForm]))
@@ -1,8 +1,10 @@
+import asyncio
 from dataclasses import make_dataclass
 from typing import Any
 from unittest import mock
 from unittest.case import TestCase
 
+from tests import fixtures_dir
 from tests.fixtures.books import BookForm, Books
 from tests.fixtures.models import TypeA
 from xsdata.exceptions import ParserError
@@ -51,6 +53,93 @@ class NodeParserTests(TestCase):
             str(cm.exception),
         )
 
+    def test_parse_with_fields(self):
+        path = fixtures_dir.joinpath("books/books.xml")
+        parser = NodeParser(handler=XmlEventHandler)
+        parser.config.fields = ["book.title", "book.id"]
+        books = parser.from_path(path, Books)
+
+        expected = [
+            BookForm(title="The First Book", id="bk001"),
+            BookForm(title="Becoming Somebody", id="bk002"),
+        ]
+        self.assertEqual(expected, books.book)
+
+        parser.config.fields = ["book.titl"]
+        with self.assertRaises(ParserError) as cm:
+            parser.from_path(path, Books)
+
+        self.assertEqual("Unknown field `book.titl` of `Books`", str(cm.exception))
+
+    def test_parse_with_predicates(self):
+        path = fixtures_dir.joinpath("books/books.xml")
+        parser = NodeParser(handler=XmlEventHandler)
+        parser.config.predicates = {"book.genre": lambda x: x == "Biography"}
+        books = parser.from_path(path, Books)
+        self.assertEqual(["bk002"], [book.id for book in books.book])
+
+        parser.config.predicates = {"book.id": lambda x: x == "bk001"}
+        parser.config.fields = ["book.title"]
+        books = parser.from_path(path, Books)
+        self.assertEqual([BookForm(title="The First Book", id="bk001")], books.book)
+
+        parser.config.fields = None
+        parser.config.predicates = {"book.price": lambda x: x is None}
+        books = parser.from_path(path, Books)
+        self.assertEqual([], books.book)
+
+        parser.config.predicates = {"book": lambda x: len(x) > 2}
+        with self.assertRaises(ParserError):
+            parser.from_path(path, Books)
+
+        parser.config.predicates = {"book.genr": lambda x: x == "Biography"}
+        with self.assertRaises(ParserError) as cm:
+            parser.from_path(path, Books)
+
+        self.assertEqual("Unknown field `book.genr` of `Books`", str(cm.exception))
+
+    def test_parse_async(self):
+        async def chunks(*args):
+            for arg in args:
+                yield arg
+
+        parser = NodeParser(handler=XmlEventHandler)
+        source = chunks(b"<books><bo", b'ok id="1"/></books>')
+        actual = asyncio.run(parser.parse_async(source, Books))
+        self.assertEqual(Books(book=[BookForm(id="1")]), actual)
+        self.assertIsNone(parser.feed_handler)
+
+        with self.assertRaises(ParserError):
+            asyncio.run(parser.parse_async(chunks(b"<books></book>"), Books))
+
+    def test_feed_and_close(self):
+        parser = NodeParser(handler=XmlEventHandler)
+        with self.assertRaises(ParserError) as cm:
+            parser.close()
+
+        self.assertEqual("The incremental parser has not been fed", str(cm.exception))
+
+        parser.feed(b"<books><book", Books)
+        handler = parser.feed_handler
+        parser.feed(b' id="1"/></books>', TypeA)
+        self.assertIs(handler, parser.feed_handler)
+        self.assertEqual(Books(book=[BookForm(id="1")]), parser.close())
+        self.assertIsNone(parser.feed_handler)
+
+        parser.feed(b"<books>", Books)
+        with self.assertRaises(ParserError):
+            parser.feed(b"</book>")
+
+        self.assertIsNone(parser.feed_handler)
+
+        parser.feed(b"", Books)
+        with self.assertRaises(ParserError):
+            parser.close()
+
+    def test_feed_with_unsupported_handler(self):
+        with self.assertRaises(NotImplementedError):
+            self.parser.feed(b"<books/>", Books)
+
     def test_start(self):
         queue = []
         objects = []
@@ -1,6 +1,11 @@
+import warnings
+from array import array
 from unittest import mock
 
-from xsdata.formats.converter import ConverterFactory
+from tests.fixtures.books import Books
+from tests.fixtures.models import ChoiceType, ExtendedType, UnionType
+from xsdata.exceptions import ParserError
+from xsdata.formats.converter import ConverterFactory, FloatConverter, converter
 from xsdata.formats.dataclass.context import XmlContext
 from xsdata.formats.dataclass.parsers.utils import ParserUtils
 from xsdata.models.enums import Namespace, QNames
@@ -51,6 +56,50 @@ class ParserUtilsTests(FactoryTestCase):
         actual = ParserUtils.parse_value(None, [int], lambda: [1, 2, 3], None, list)
         self.assertEqual([1, 2, 3], actual)
 
+    def test_parse_value_with_array_tokens(self):
+        actual = ParserUtils.parse_value(" 1 2 3", [int], None, None, list, None, True)
+        self.assertEqual(array("q", [1, 2, 3]), actual)
+
+        actual = ParserUtils.parse_value(
+            [1.5, "2"], [float], None, None, list, None, True
+        )
+        self.assertEqual(array("d", [1.5, 2.0]), actual)
+
+        actual = ParserUtils.parse_value("", [float], None, None, list, None, True)
+        self.assertEqual(array("d"), actual)
+
+        actual = ParserUtils.parse_value("1 2", [float], None, None, tuple, None, True)
+        self.assertEqual((1.0, 2.0), actual)
+
+        actual = ParserUtils.parse_value("1 2", [str], None, None, list, None, True)
+        self.assertEqual(["1", "2"], actual)
+
+        actual = ParserUtils.parse_value(
+            "1 2", [int, str], None, None, list, None, True
+        )
+        self.assertEqual([1, 2], actual)
+
+        actual = ParserUtils.parse_value(
+            f"1 {2**64}", [int], None, None, list, None, True
+        )
+        self.assertEqual([1, 2**64], actual)
+
+        with warnings.catch_warnings(record=True) as w:
+            actual = ParserUtils.parse_value("1 a", [int], None, None, list, None, True)
+
+        self.assertEqual([1, "a"], actual)
+        self.assertEqual(1, len(w))
+
+    def test_parse_value_with_array_tokens_and_custom_converter(self):
+        converter.register_converter(float, lambda x: float(x) * 2)
+        try:
+            actual = ParserUtils.parse_value(
+                "1.5 2", [float], None, None, list, None, True
+            )
+            self.assertEqual([3.0, 4.0], actual)
+        finally:
+            converter.register_converter(float, FloatConverter())
+
     @mock.patch.object(ConverterFactory, "deserialize", return_value=2)
     def test_parse_value_with_ns_map(self, mock_to_python):
         ns_map = {"a": 1}
@@ -75,6 +124,63 @@ class ParserUtilsTests(FactoryTestCase):
             " 1 2 3", [str], ns_map=None, format="Nope"
         )
 
+    def test_projection(self):
+        self.assertIsNone(ParserUtils.projection(None))
+        self.assertEqual({}, ParserUtils.projection([]))
+
+        actual = ParserUtils.projection(["id", "book.title", "book.author"])
+        expected = {"id": None, "book": {"title": None, "author": None}}
+        self.assertEqual(expected, actual)
+
+        actual = ParserUtils.projection(["a", "a.b", "c.d", "c"])
+        self.assertEqual({"a": None, "c": None}, actual)
+
+        actual = ParserUtils.projection(["a.b"], {"a.c": len})
+        self.assertEqual({"a": {"b": None, "c": None}}, actual)
+
+    def test_verify_paths(self):
+        context = XmlContext()
+        ParserUtils.verify_paths(context, Books, ["book.title", "book"])
+        ParserUtils.verify_paths(context, UnionType, ["element.y"])
+        ParserUtils.verify_paths(context, ChoiceType, ["choice.y"])
+        ParserUtils.verify_paths(context, ExtendedType, ["wildcard.foo", "any.bar"])
+
+        paths = [
+            ("book.titl", Books),
+            ("books", Books),
+            ("book.title.foo", Books),
+            ("element.w", UnionType),
+            ("choice.z", ChoiceType),
+            ("a.y", ExtendedType),
+        ]
+        for path, clazz in paths:
+            with self.assertRaises(ParserError) as cm:
+                ParserUtils.verify_paths(context, clazz, [path])
+
+            self.assertEqual(
+                f"Unknown field `{path}` of `{clazz.__name__}`", str(cm.exception)
+            )
+
+    def test_predicates(self):
+        self.assertIsNone(ParserUtils.predicates(None))
+        self.assertIsNone(ParserUtils.predicates({}))
+
+        actual = ParserUtils.predicates({"id": len, "book.genre": str, "book.id": int})
+        expected = {"id": len, "book": {"genre": str, "id": int}}
+        self.assertEqual(expected, actual)
+
+    def test_predicates_with_conflicting_paths(self):
+        message = "Predicate `book.id` conflicts with predicate `book`"
+        with self.assertRaises(ParserError) as cm:
+            ParserUtils.predicates({"book": len, "book.id": int})
+
+        self.assertEqual(message, str(cm.exception))
+
+        with self.assertRaises(ParserError) as cm:
+            ParserUtils.predicates({"book.id": int, "book": len})
+
+        self.assertEqual(message, str(cm.exception))
+
     def test_parse_any_attributes(self):
         attrs = {QNames.XSI_TYPE: "xsd:string", "a": "b"}
         ns_map = {"xsi": Namespace.XSI.uri, "xsd": Namespace.XS.uri}
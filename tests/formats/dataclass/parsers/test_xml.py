@@ -1,3 +1,5 @@
+from dataclasses import dataclass
+from typing import Any
 from unittest import mock
 
 from tests.fixtures.books import Books
@@ -52,9 +54,36 @@ class UserXmlParserTests(FactoryTestCase):
 
     def test_emit_event(self):
         mock_func = mock.Mock()
-        self.parser.foo_bar_el = mock_func
 
-        self.parser.emit_event("foo", "{tns}BarEl", a=1, b=2)
+        @dataclass
+        class FooParser(UserXmlParser):
+            def foo_bar_el(self, **kwargs: Any):
+                mock_func(**kwargs)
+
+            @staticmethod
+            def foo_static(**kwargs: Any) -> None:
+                mock_func(static=True, **kwargs)
+
+        parser = FooParser()
+        parser.emit_event("foo", "{tns}BarEl", a=1, b=2)
+        parser.emit_event("foo", "{tns}Missing", a=1, b=2)
 
         mock_func.assert_called_once_with(a=1, b=2)
-        self.assertEqual({("foo", "{tns}BarEl"): mock_func}, self.parser.emit_cache)
+        expected = {
+            ("foo", "{tns}BarEl"): ("foo_bar_el", FooParser.foo_bar_el),
+            ("foo", "{tns}Missing"): ("foo_missing", None),
+        }
+        self.assertEqual(expected, parser.emit_cache)
+        self.assertIs(parser.emit_cache, FooParser().emit_cache)
+        self.assertIsNot(parser.emit_cache, self.parser.emit_cache)
+
+        parser.emit_event("foo", "{tns}Static", a=1)
+        mock_func.assert_called_with(static=True, a=1)
+
+        other = FooParser()
+        other.foo_missing = mock.Mock()
+        other.emit_event("foo", "{tns}Missing", a=1)
+        other.foo_missing.assert_called_once_with(a=1)
+
+        parser.emit_event("foo", "{tns}Missing", a=1)
+        self.assertEqual(1, other.foo_missing.call_count)
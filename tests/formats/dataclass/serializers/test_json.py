@@ -1,7 +1,9 @@
+import asyncio
 import json
 import warnings
+from array import array
 from unittest.case import TestCase
-from unittest.mock import ANY, Mock, call
+from unittest.mock import ANY, AsyncMock, Mock, call
 
 from tests.fixtures.books import BookForm, Books
 from tests.fixtures.datatypes import Telephone
@@ -65,6 +67,14 @@ class JsonSerializerTests(TestCase):
 
         self.assertEqual(self.expected, json.loads(actual))
 
+    def test_write_async(self):
+        serializer = JsonSerializer(dict_factory=DictFactory.FILTER_NONE)
+        sink = Mock(drain=AsyncMock())
+        asyncio.run(serializer.write_async(sink, self.books))
+
+        self.assertEqual(self.expected, json.loads(sink.write.call_args[0][0]))
+        self.assertEqual(1, sink.drain.call_count)
+
     def test_render_a_none_dataclass_object(self):
         with self.assertRaises(XmlContextError):
             JsonSerializer().render(1)
@@ -87,6 +97,11 @@ class JsonSerializerTests(TestCase):
         actual = serializer.convert(Telephone(30, 234, 56783), var)
         self.assertEqual("30-234-56783", actual)
 
+    def test_convert_array(self):
+        var = XmlVarFactory.create(types=(float,), tokens=True)
+        actual = JsonSerializer().convert(array("d", [1.5, 2.0]), var)
+        self.assertEqual([1.5, 2.0], actual)
+
     def test_indent_deprecation(self):
         dump_factory = Mock(json.dump)
 
@@ -1,10 +1,13 @@
+import asyncio
 import re
+from array import array
 from dataclasses import dataclass, field, make_dataclass
 from typing import Generator, List
-from unittest import TestCase
+from unittest import TestCase, mock
 from xml.etree.ElementTree import QName
 
 from tests.fixtures.books import BookForm
+from tests.fixtures.books.fixtures import books
 from tests.fixtures.datatypes import Telephone
 from tests.fixtures.models import Paragraph, SequentialType, Span, TypeA
 from xsdata.exceptions import SerializerError, XmlContextError
@@ -12,6 +15,10 @@ from xsdata.formats.dataclass.models.elements import XmlType
 from xsdata.formats.dataclass.models.generics import AnyElement, DerivedElement
 from xsdata.formats.dataclass.serializers import XmlSerializer
 from xsdata.formats.dataclass.serializers.mixins import XmlWriterEvent
+from xsdata.formats.dataclass.serializers.writers import (
+    LxmlEventWriter,
+    XmlEventWriter,
+)
 from xsdata.models.enums import DataType, QNames
 from xsdata.utils.testing import XmlVarFactory
 
@@ -72,6 +79,19 @@ class XmlSerializerTests(TestCase):
         expected = '<NamespaceWrapper xmlns:foo="ns"><foo:Items><foo:item>a</foo:item><foo:item>b</foo:item></foo:Items></NamespaceWrapper>'
         self.assertIsNotNone(re.search(expected, xml))
 
+    @mock.patch.object(XmlSerializer, "batch_size", 10)
+    def test_write_async(self):
+        self.serializer.config.pretty_print = True
+        for writer, writes in ((XmlEventWriter, 5), (LxmlEventWriter, 2)):
+            self.serializer.writer = writer
+            sink = mock.Mock(drain=mock.AsyncMock())
+            asyncio.run(self.serializer.write_async(sink, books, {"brk": "urn:books"}))
+
+            result = b"".join(call[0][0] for call in sink.write.call_args_list)
+            expected = self.serializer.render(books, {"brk": "urn:books"})
+            self.assertEqual(expected, result.decode())
+            self.assertEqual(writes, sink.write.call_count)
+
     def test_write_object_with_derived_element(self):
         book = BookForm(id="123")
         obj = DerivedElement(qname="item", value=book)
@@ -220,6 +240,18 @@ class XmlSerializerTests(TestCase):
         result = self.serializer.write_value([[1, 2, 3], [4, 5, 6]], var, "xsdata")
         self.assertEqual(expected, list(result))
 
+        expected = [
+            (XmlWriterEvent.START, "a"),
+            (XmlWriterEvent.DATA, "1 2"),
+            (XmlWriterEvent.END, "a"),
+            (XmlWriterEvent.START, "a"),
+            (XmlWriterEvent.DATA, "3"),
+            (XmlWriterEvent.END, "a"),
+        ]
+        value = [array("q", [1, 2]), array("q", [3])]
+        result = self.serializer.write_value(value, var, "xsdata")
+        self.assertEqual(expected, list(result))
+
         var = XmlVarFactory.create(
             xml_type=XmlType.ELEMENT, qname="a", tokens=True, nillable=True
         )
@@ -1,3 +1,4 @@
+from collections import namedtuple
 from unittest import TestCase
 
 from tests.fixtures.models import TypeA, TypeC
@@ -17,6 +18,12 @@ class ClassTypeTests(TestCase):
         self.assertEqual(1.0, class_type.score_object("a"))
         self.assertEqual(1.5, class_type.score_object(2.9))
 
+        self.assertEqual(2.5, class_type.score_object({"x": 1, "y": "1", "z": None}))
+
+        fixture = namedtuple("Fixture", ["x", "y"])
+        self.assertEqual(2.5, class_type.score_object(fixture(1, "1")))
+        self.assertEqual(1.5, class_type.score_object((1, "1")))
+
 
 class DataclassesTests(TestCase):
     def test_is_model(self):
@@ -1,12 +1,25 @@
 import copy
-from dataclasses import make_dataclass
+import gc
+from dataclasses import dataclass, field, make_dataclass
+from enum import Enum
 from pathlib import Path
+from typing import Dict
 from unittest import mock
 
 from tests.fixtures.artists import Artist, BeginArea
 from tests.fixtures.books import BookForm, BooksForm
-from tests.fixtures.models import BaseType, ChoiceType, UnionType
+from tests.fixtures.books import books as books_module
+from tests.fixtures.models import (
+    BaseA,
+    BaseB,
+    BaseC,
+    BaseType,
+    ChoiceType,
+    UnionType,
+)
+from xsdata.formats.converter import converter
 from xsdata.formats.dataclass.context import XmlContext
+from xsdata.formats.dataclass.models.builders import XmlMetaBuilder
 from xsdata.models.enums import DataType
 from xsdata.utils.testing import FactoryTestCase, XmlMetaFactory
 
@@ -133,3 +146,104 @@ class XmlContextTests(FactoryTestCase):
 
         self.ctx.build_recursive(UnionType)
         self.assertEqual(8, len(self.ctx.cache))
+
+    @mock.patch("xsdata.formats.dataclass.context.gc")
+    def test_freeze(self, mock_gc):
+        class Color(Enum):
+            RED = "red"
+
+        @dataclass
+        class Root:
+            class Meta:
+                namespace = "foo"
+
+            color: Color = field(metadata={"type": "Element"})
+            attrs: Dict[str, str] = field(
+                default_factory=dict,
+                metadata={"type": "Attributes", "namespace": "##any"},
+            )
+            wildcard: object = field(
+                default=None,
+                metadata={"type": "Wildcard", "namespace": "##other"},
+            )
+
+        converter.cache.clear()
+        self.ctx.build(Root)
+        self.ctx.freeze()
+
+        self.assertTrue(self.ctx.frozen)
+        self.assertEqual(0, mock_gc.freeze.call_count)
+        self.assertIn(Color, converter.cache)
+
+        with mock.patch.object(XmlContext, "get_subclasses") as mock_get_subclasses:
+            self.ctx.sys_modules = 0
+            self.ctx.build_xsi_cache()
+            self.assertEqual(0, mock_get_subclasses.call_count)
+
+        self.ctx.freeze(gc_freeze=True)
+        mock_gc.collect.assert_called_once_with()
+        mock_gc.freeze.assert_called_once_with()
+
+        self.ctx.reset()
+        self.assertFalse(self.ctx.frozen)
+
+    def test_build_recursive_with_subclasses(self):
+        self.ctx.build_recursive(BaseType, include_subclasses=True)
+        expected = {BaseType, BaseA, BaseB, BaseC}
+        self.assertEqual(expected, set(self.ctx.cache))
+
+    def test_warmup(self):
+        # Drop the model subclasses left behind by other tests
+        gc.collect()
+        build = XmlMetaBuilder.build
+        with mock.patch.object(
+            XmlMetaBuilder, "build", autospec=True, side_effect=build
+        ) as mock_build:
+            result = self.ctx.warmup("tests.fixtures.books", workers=2)
+
+        built = [call[0][1] for call in mock_build.call_args_list]
+        self.assertEqual(len(built), len(set(built)))
+        self.assertEqual(len(built), result.built)
+        self.assertEqual(3, result.modules)
+        self.assertEqual(3, result.models)
+        self.assertEqual(3, result.built)
+        self.assertEqual(0, result.failed)
+        self.assertIn(BookForm, self.ctx.cache)
+        self.assertIn(BooksForm, self.ctx.cache)
+        self.assertTrue(self.ctx.xsi_cache)
+
+        result = self.ctx.warmup(books_module, include_subclasses=False)
+        self.assertEqual(1, result.modules)
+        self.assertEqual(3, result.models)
+        self.assertEqual(0, result.built)
+
+    def test_warmup_with_workers_and_failures(self):
+        build = XmlMetaBuilder.build
+
+        def side_effect(builder, clazz, parent_ns):
+            if clazz is BookForm:
+                raise NameError("foo")
+
+            return build(builder, clazz, parent_ns)
+
+        with mock.patch.object(
+            XmlMetaBuilder, "build", autospec=True, side_effect=side_effect
+        ), self.assertLogs("xsdata.logger", level="WARNING"):
+            result = self.ctx.warmup(books_module, workers=2)
+
+        self.assertEqual(3, result.models)
+        self.assertEqual(3, result.failed)
+        self.assertEqual(2, result.built)
+        self.assertNotIn(BookForm, self.ctx.cache)
+
+    @mock.patch.object(XmlContext, "build_recursive", side_effect=NameError("foo"))
+    def test_warmup_with_failures(self, mock_build_recursive):
+        with self.assertLogs("xsdata.logger", level="WARNING"):
+            result = self.ctx.warmup(books_module, include_subclasses=False)
+
+        self.assertEqual(3, result.failed)
+        self.assertEqual(0, result.built)
+        self.assertEqual(0, len(self.ctx.xsi_cache))
+        mock_build_recursive.assert_any_call(
+            BookForm, globalns=None, include_subclasses=False
+        )
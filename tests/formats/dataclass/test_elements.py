@@ -1,5 +1,4 @@
 from dataclasses import make_dataclass
-from unittest import mock
 from unittest.case import TestCase
 from xml.etree.ElementTree import QName
 
@@ -15,7 +14,14 @@ from tests.fixtures.models import (
     UnionType,
 )
 from xsdata.formats.dataclass.context import XmlContext
-from xsdata.formats.dataclass.models.elements import XmlType, XmlVar
+from xsdata.formats.dataclass.models.elements import (
+    EMPTY_MATCHER,
+    EMPTY_URIS,
+    NamespaceMatcher,
+    XmlType,
+    build_matcher,
+    compile_namespaces,
+)
 from xsdata.utils.testing import XmlMetaFactory, XmlVarFactory
 
 
@@ -67,19 +73,23 @@ class XmlValTests(TestCase):
         self.assertEqual("a", var.find_choice("{a}a").name)
         self.assertEqual("b", var.find_choice("b").name)
 
-        var.elements.clear()
-        var.wildcards = [
-            XmlVarFactory.create(
-                xml_type=XmlType.WILDCARD,
-                name="target",
-                namespaces=("foo",),
-            ),
-            XmlVarFactory.create(
-                xml_type=XmlType.WILDCARD,
-                name="other",
-                namespaces=("!foo",),
-            ),
-        ]
+        var = XmlVarFactory.create(
+            xml_type=XmlType.ELEMENTS,
+            name="foo",
+            qname="foo",
+            wildcards=[
+                XmlVarFactory.create(
+                    xml_type=XmlType.WILDCARD,
+                    name="target",
+                    namespaces=("foo",),
+                ),
+                XmlVarFactory.create(
+                    xml_type=XmlType.WILDCARD,
+                    name="other",
+                    namespaces=("!foo",),
+                ),
+            ],
+        )
 
         self.assertEqual(var.wildcards[1], var.find_choice("{a}a"))
         self.assertEqual(var.wildcards[0], var.find_choice("{foo}a"))
@@ -137,10 +147,30 @@ class XmlValTests(TestCase):
             xml_type=XmlType.WILDCARD, name="foo", namespaces=("!tns",)
         )
         self.assertTrue(var.match_namespace("{foo}a"))
+        self.assertTrue(var.match_namespace("a"))
         self.assertFalse(var.match_namespace("{tns}a"))
 
-        var.namespace_matches["{tns}cached"] = True
-        self.assertTrue(var.match_namespace("{tns}cached"))
+        var = XmlVarFactory.create(
+            xml_type=XmlType.WILDCARD, name="foo", namespaces=("!tns", "!foo")
+        )
+        self.assertTrue(var.match_namespace("{foo}a"))
+        self.assertTrue(var.match_namespace("{tns}a"))
+
+        var = XmlVarFactory.create(
+            xml_type=XmlType.WILDCARD, name="foo", namespaces=("!tns", "tns")
+        )
+        self.assertTrue(var.match_namespace("{tns}a"))
+
+    def test_compile_namespaces(self):
+        self.assertEqual((frozenset({None}), None), compile_namespaces(()))
+        self.assertEqual((frozenset({None}), None), compile_namespaces(("",)))
+        self.assertEqual((frozenset({"a", None}), None), compile_namespaces(("a", "")))
+        self.assertEqual(
+            (frozenset({"a"}), frozenset({"b"})), compile_namespaces(("a", "!b"))
+        )
+        self.assertEqual((frozenset(), frozenset()), compile_namespaces(("a", "##any")))
+        self.assertEqual((frozenset(), frozenset()), compile_namespaces(("!a", "!b")))
+        self.assertEqual((frozenset(), frozenset()), compile_namespaces(("!a", "a")))
 
 
 class XmlMetaTests(TestCase):
@@ -171,7 +201,10 @@ class XmlMetaTests(TestCase):
             "any_attributes=[], "
             "wrappers={}, "
             "namespace=None, "
-            "mixed_content=False)"
+            "mixed_content=False, "
+            "wildcards_matcher=NamespaceMatcher(uris={None: None}, default=None), "
+            "any_attributes_matcher=NamespaceMatcher(uris={None: None}, default=None), "
+            "child_vars={})"
         )
         self.assertEqual(expected, repr(self.meta))
 
@@ -189,22 +222,21 @@ class XmlMetaTests(TestCase):
         self.assertEqual(a, self.meta.find_attribute("a"))
         self.assertEqual(b, self.meta.find_attribute("b"))
 
-    @mock.patch.object(XmlVar, "match_namespace")
-    def test_find_any_attributes(self, mock_match_namespace):
-        mock_match_namespace.side_effect = [False, False, False, True]
-
+    def test_find_any_attributes(self):
         attributes = [
-            XmlVarFactory.create(xml_type=XmlType.ATTRIBUTES, qname="any", name="any"),
             XmlVarFactory.create(
-                xml_type=XmlType.ATTRIBUTES, qname="other", name="any"
+                xml_type=XmlType.ATTRIBUTES, name="a", namespaces=("a",)
+            ),
+            XmlVarFactory.create(
+                xml_type=XmlType.ATTRIBUTES, name="b", namespaces=("!a",)
             ),
         ]
-        self.meta.any_attributes = attributes
-
         self.assertIsNone(self.meta.find_any_attributes("a"))
-        self.assertEqual(attributes[1], self.meta.find_any_attributes("a"))
 
-        mock_match_namespace.assert_has_calls([mock.call("a") for _ in range(4)])
+        meta = XmlMetaFactory.create(clazz=TypeA, any_attributes=attributes)
+        self.assertEqual(attributes[0], meta.find_any_attributes("{a}a"))
+        self.assertEqual(attributes[1], meta.find_any_attributes("{b}a"))
+        self.assertEqual(attributes[1], meta.find_any_attributes("a"))
 
     def test_find_wildcard(self):
         wildcards = [
@@ -222,14 +254,51 @@ class XmlMetaTests(TestCase):
         ]
 
         self.assertIsNone(self.meta.find_wildcard("a"))
-        self.meta.wildcards = wildcards
+        meta = XmlMetaFactory.create(clazz=TypeA, wildcards=wildcards)
+
+        self.assertIs(wildcards[0], meta.find_wildcard("{a}root"))
+        self.assertIs(wildcards[1], meta.find_wildcard("{b}root"))
+        self.assertIs(wildcards[2].elements["{c}root"], meta.find_wildcard("{c}root"))
+        self.assertIs(wildcards[2], meta.find_wildcard("{c}random"))
+        self.assertIs(wildcards[2], meta.find_wildcard("random"))
+
+    def test_namespace_matcher(self):
+        wildcards = [
+            XmlVarFactory.create(xml_type=XmlType.WILDCARD, namespaces=("a",)),
+            XmlVarFactory.create(xml_type=XmlType.WILDCARD, namespaces=("!b",)),
+            XmlVarFactory.create(xml_type=XmlType.WILDCARD, namespaces=("b", "")),
+        ]
+        matcher = NamespaceMatcher(wildcards)
 
-        self.assertIs(wildcards[0], self.meta.find_wildcard("{a}root"))
-        self.assertIs(wildcards[1], self.meta.find_wildcard("{b}root"))
-        self.assertIs(
-            wildcards[2].elements["{c}root"], self.meta.find_wildcard("{c}root")
+        self.assertEqual(
+            {"a": wildcards[0], "b": wildcards[2], None: wildcards[1]},
+            matcher.uris,
         )
-        self.assertIs(wildcards[2], self.meta.find_wildcard("{c}random"))
+        self.assertIs(wildcards[1], matcher.default)
+        self.assertIs(wildcards[0], matcher.find("{a}a"))
+        self.assertIs(wildcards[2], matcher.find("{b}a"))
+        self.assertIs(wildcards[1], matcher.find("{c}a"))
+        self.assertIs(wildcards[1], matcher.find("a"))
+
+        matcher = NamespaceMatcher(wildcards[:1])
+        self.assertEqual({"a": wildcards[0], None: None}, matcher.uris)
+        self.assertIsNone(matcher.default)
+        self.assertIsNone(matcher.find("{c}a"))
+
+    def test_build_matcher(self):
+        wildcard = XmlVarFactory.create(xml_type=XmlType.WILDCARD)
+        element = XmlVarFactory.create(xml_type=XmlType.ELEMENT, namespaces=("a",))
+
+        self.assertIs(EMPTY_MATCHER, build_matcher([]))
+        self.assertIsNot(EMPTY_MATCHER, build_matcher([wildcard]))
+        self.assertIs(EMPTY_MATCHER, wildcard.wildcards_matcher)
+        self.assertEqual(frozenset({None}), wildcard.namespace_uris)
+        self.assertIs(EMPTY_URIS, element.namespace_uris)
+        self.assertIsNone(element.namespace_excludes)
+
+        meta = self.context.build(TypeA)
+        self.assertIs(EMPTY_MATCHER, meta.wildcards_matcher)
+        self.assertIs(EMPTY_MATCHER, meta.any_attributes_matcher)
 
     def test_find_any_wildcard(self):
         meta = self.context.build(TypeDuplicate)
@@ -256,3 +325,21 @@ class XmlMetaTests(TestCase):
         meta = self.context.build(Paragraph)
         self.assertEqual("content", next(meta.find_children("404")).qname)
         self.assertTrue(next(meta.find_children("content")).is_wildcard)
+
+    def test_find_child_vars(self):
+        meta = self.context.build(TypeDuplicate)
+        self.assertEqual({"x"}, set(meta.child_vars))
+        self.assertEqual((), meta.find_child_vars("a"))
+        self.assertEqual(["x", "x1"], [el.name for el in meta.find_child_vars("x")])
+        self.assertIs(meta.child_vars["x"], meta.find_child_vars("x"))
+
+        meta = self.context.build(ChoiceType)
+        self.assertEqual(set(meta.choices[0].elements), set(meta.child_vars))
+        self.assertEqual(("a",), tuple(v.qname for v in meta.find_child_vars("a")))
+
+        meta = self.context.build(Paragraph)
+        self.assertEqual(["span"], list(meta.child_vars))
+        self.assertEqual("span", meta.find_child_vars("span")[0].qname)
+        self.assertEqual(
+            ["content"], [var.qname for var in meta.find_child_vars("{a}404")]
+        )
@@ -0,0 +1,136 @@
+import logging
+import threading
+from unittest import TestCase, mock
+
+from tests import fixtures_dir
+from tests.fixtures.books import Books
+from xsdata.exceptions import ConverterError, ConverterWarning
+from xsdata.formats.converter import ConverterFactory, converter
+from xsdata.formats.dataclass.instrumentation import (
+    Instrumentation,
+    Operation,
+    Record,
+    type_name,
+)
+from xsdata.formats.dataclass.parsers import XmlParser
+from xsdata.formats.dataclass.parsers.bases import NodeParser
+from xsdata.formats.dataclass.serializers import XmlSerializer
+from xsdata.logger import logger
+
+
+class InstrumentationTests(TestCase):
+    def setUp(self):
+        self.path = fixtures_dir.joinpath("books/books.xml")
+
+    def test_enable_and_disable(self):
+        start = NodeParser.__dict__["start"]
+        deserialize = ConverterFactory.__dict__["deserialize"]
+        instrumentation = Instrumentation()
+
+        instrumentation.enable()
+        instrumentation.enable()
+        self.assertTrue(instrumentation.enabled)
+        self.assertIsNot(start, NodeParser.__dict__["start"])
+        self.assertIsNot(deserialize, ConverterFactory.__dict__["deserialize"])
+        self.assertEqual(8, len(instrumentation.patcher.originals))
+
+        with self.assertRaises(ValueError):
+            Instrumentation().enable()
+
+        instrumentation.disable()
+        instrumentation.disable()
+        self.assertFalse(instrumentation.enabled)
+        self.assertIs(start, NodeParser.__dict__["start"])
+        self.assertIs(deserialize, ConverterFactory.__dict__["deserialize"])
+
+    def test_parse_and_serialize(self):
+        callback = mock.Mock()
+        with Instrumentation(callback=callback) as instrumentation:
+            books = XmlParser().from_path(self.path, Books)
+            XmlSerializer().render(books)
+
+        counters = instrumentation.counters
+        self.assertEqual(2, counters[(Operation.START, "book")])
+        self.assertEqual(2, counters[(Operation.END, "book")])
+        self.assertEqual(2, counters[(Operation.BIND, "BookForm")])
+        self.assertEqual(1, counters[(Operation.BIND, "Books")])
+        self.assertEqual(2, counters[(Operation.CONVERTER_HIT, "float")])
+        self.assertEqual(2, counters[(Operation.WRITE_VALUE, "price")])
+        self.assertEqual(
+            self.path.stat().st_size, counters[(Operation.BYTES, "XmlParser")]
+        )
+
+        records = instrumentation.records()
+        callback.assert_called_once_with(records)
+        self.assertIsInstance(records[0], Record)
+        self.assertEqual(sorted(records, key=lambda x: -x.seconds), records)
+
+        instrumentation.reset()
+        self.assertEqual([], instrumentation.records())
+
+    def test_converter_miss(self):
+        with Instrumentation() as instrumentation:
+            self.assertEqual(2, converter.deserialize("2", [bool, int]))
+            XmlParser().from_bytes(self.path.read_bytes(), Books)
+
+            with self.assertWarns(ConverterWarning):
+                self.assertEqual("a", converter.deserialize("a", [int]))
+
+        counters = instrumentation.counters
+        self.assertEqual(1, counters[(Operation.CONVERTER_MISS, "bool")])
+        self.assertEqual(1, counters[(Operation.CONVERTER_MISS, "int")])
+        self.assertEqual(1, counters[(Operation.CONVERTER_HIT, "int")])
+        self.assertEqual(2, counters[(Operation.CONVERTER_HIT, "float")])
+        self.assertEqual(1, counters[(Operation.DESERIALIZE, "bool|int")])
+        self.assertEqual(1, counters[(Operation.DESERIALIZE, "int")])
+        self.assertEqual(
+            self.path.stat().st_size, counters[(Operation.BYTES, "XmlParser")]
+        )
+
+    def test_log(self):
+        instrumentation = Instrumentation()
+        instrumentation.add(Operation.BIND, "Books", seconds=0.5)
+        instrumentation.add(Operation.BIND, "Books", seconds=0.25)
+        instrumentation.add(Operation.START, "book", count=2, seconds=1.0)
+
+        with mock.patch.object(logger, "log") as mock_log:
+            instrumentation.log(logging.DEBUG, limit=1)
+
+        mock_log.assert_called_once_with(
+            logging.DEBUG,
+            "%s %s: counter=%d, seconds=%.6f",
+            Operation.START,
+            "book",
+            2,
+            1.0,
+        )
+
+    def test_add_from_threads(self):
+        instrumentation = Instrumentation()
+
+        def target():
+            for _ in range(1000):
+                instrumentation.add(Operation.START, "book", seconds=0.5)
+
+        threads = [threading.Thread(target=target) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(8000, instrumentation.counters[(Operation.START, "book")])
+        self.assertEqual(4000.0, instrumentation.timers[(Operation.START, "book")])
+
+    def test_deserialize_without_type_name(self):
+        instrumentation = Instrumentation()
+        original = mock.Mock(side_effect=ConverterError)
+        deserialize = instrumentation.wrap_deserialize(original)
+        alias = mock.Mock(spec=[])
+
+        with self.assertRaises(ConverterError):
+            deserialize(converter, "1", [alias, int])
+
+        name = f"{alias!r}|int"
+        self.assertEqual(1, instrumentation.counters[(Operation.DESERIALIZE, name)])
+        self.assertEqual(repr(alias), type_name(alias))
+        self.assertEqual("int", type_name(int))
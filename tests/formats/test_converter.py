@@ -1,5 +1,6 @@
 import sys
 import warnings
+from array import array
 from datetime import date, datetime, time
 from decimal import Decimal
 from enum import Enum
@@ -11,7 +12,12 @@ import pytest
 
 from tests.fixtures.datatypes import Telephone
 from xsdata.exceptions import ConverterError
-from xsdata.formats.converter import Converter, ProxyConverter, converter
+from xsdata.formats.converter import (
+    Converter,
+    FloatConverter,
+    ProxyConverter,
+    converter,
+)
 from xsdata.models.datatype import XmlDuration, XmlPeriod
 from xsdata.models.enums import UseType
 
@@ -39,6 +45,20 @@ class ConverterFactoryTests(TestCase):
         self.assertEqual("optional", converter.serialize(UseType.OPTIONAL))
         self.assertEqual("0.0000000877683", converter.serialize(Decimal("8.77683E-8")))
         self.assertEqual("8.77683E-08", converter.serialize(float("8.77683E-8")))
+        self.assertEqual("1 -2", converter.serialize(array("q", [1, -2])))
+        self.assertEqual(
+            "1.5 INF", converter.serialize(array("d", [1.5, float("inf")]))
+        )
+        self.assertEqual("", converter.serialize(array("d")))
+        self.assertEqual("1 2", converter.serialize(array("B", [1, 2])))
+        self.assertEqual("a b", converter.serialize(array("u", "ab")))
+
+    def test_serialize_array_with_custom_converter(self):
+        converter.register_converter(float, lambda x: f"{x:.1f}")
+        try:
+            self.assertEqual("1.5 2.0", converter.serialize(array("d", [1.5, 2])))
+        finally:
+            converter.register_converter(float, FloatConverter())
 
     def test_test(self):
         self.assertTrue(converter.test("1", [int]))
@@ -69,6 +89,23 @@ class ConverterFactoryTests(TestCase):
 
         self.assertEqual(f"No converter registered for `{B}`", str(w[-1].message))
 
+    def test_type_converter_caches_mro_matches(self):
+        class Number(int):
+            pass
+
+        instance = converter.type_converter(Number)
+        self.assertIs(converter.registry[int], instance)
+        self.assertIs(instance, converter.cache[Number])
+        self.assertIs(instance, converter.type_converter(Number))
+
+        converter.register_converter(Number, lambda x: int(x) - 1)
+        self.assertNotIn(Number, converter.cache)
+        self.assertEqual(1, converter.deserialize("2", [Number]))
+
+        converter.unregister_converter(Number)
+        self.assertEqual(2, converter.deserialize("2", [Number]))
+        self.assertIn(Number, converter.cache)
+
     def test_register_converter(self):
         class MinusOneInt(int):
             pass
@@ -182,6 +219,12 @@ class FloatConverterTests(TestCase):
         self.assertEqual("NaN", self.converter.serialize(float("nan")))
         self.assertEqual("8.77683E-08", self.converter.serialize(float("8.77683E-8")))
 
+    def test_serialize_tokens(self):
+        values = [2.1, float("inf"), float("-inf"), float("nan"), 8.77683e-8, 1e20]
+        expected = " ".join(self.converter.serialize(value) for value in values)
+        self.assertEqual(expected, self.converter.serialize_tokens(values))
+        self.assertEqual("", self.converter.serialize_tokens([]))
+
 
 class BytesConverterTests(TestCase):
     def setUp(self):
@@ -0,0 +1,27 @@
+import tracemalloc
+
+import pytest
+
+from tests import root
+from xsdata.codegen.transformer import SchemaTransformer
+from xsdata.models.config import GeneratorConfig
+
+schema = root.joinpath("xsdata/schemas/mathml3.xsd")
+
+
+def analyze(uri: str):
+    transformer = SchemaTransformer(print=True, config=GeneratorConfig())
+    transformer.process_sources([uri])
+    transformer.analyze_classes(transformer.classes)
+
+
+@pytest.mark.benchmark(disable_gc=True, group="Codegen")
+def test_analyze(benchmark):
+    tracemalloc.start()
+    try:
+        benchmark.pedantic(analyze, args=(schema.as_uri(),), rounds=1)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    benchmark.extra_info["peak_memory"] = peak
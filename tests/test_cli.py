@@ -10,6 +10,7 @@ from click.testing import CliRunner
 from tests import fixtures_dir
 from xsdata import __version__
 from xsdata.cli import cli, resolve_source
+from xsdata.codegen.profiler import Profiler
 from xsdata.codegen.transformer import SchemaTransformer
 from xsdata.codegen.writer import CodeWriter
 from xsdata.formats.dataclass.generator import DataclassGenerator
@@ -42,6 +43,8 @@ class CliTests(TestCase):
 
         self.assertIsNone(result.exception)
         self.assertFalse(mock_init.call_args[1]["print"])
+        self.assertEqual(0, mock_init.call_args[1]["workers"])
+        self.assertIsNone(mock_init.call_args[1]["loader"].cache_dir)
         self.assertEqual("foo", config.output.package)
         self.assertEqual("dataclasses", config.output.format.value)
         self.assertFalse(config.output.relative_imports)
@@ -85,6 +88,65 @@ class CliTests(TestCase):
         self.assertEqual([source.as_uri()], mock_process.call_args[0][0])
         self.assertTrue(mock_init.call_args[1]["print"])
 
+    @mock.patch.object(SchemaTransformer, "process")
+    @mock.patch.object(SchemaTransformer, "__init__", return_value=None)
+    def test_generate_with_workers(self, mock_init, mock_process):
+        source = fixtures_dir.joinpath("defxmlschema/chapter03.xsd")
+        result = self.runner.invoke(cli, [str(source), "--workers", "4"])
+
+        self.assertIsNone(result.exception)
+        self.assertEqual(4, mock_init.call_args[1]["workers"])
+
+    @mock.patch.object(SchemaTransformer, "process")
+    @mock.patch.object(SchemaTransformer, "__init__", return_value=None)
+    def test_generate_with_resource_cache(self, mock_init, mock_process):
+        source = fixtures_dir.joinpath("defxmlschema/chapter03.xsd")
+        env = {"XSDATA_RESOURCE_CACHE": "cache"}
+        result = self.runner.invoke(cli, [str(source), "--offline"], env=env)
+
+        self.assertIsNone(result.exception)
+        loader = mock_init.call_args[1]["loader"]
+        self.assertEqual(Path("cache").resolve(), loader.cache_dir)
+        self.assertTrue(loader.offline)
+
+    @mock.patch.object(Profiler, "dump")
+    @mock.patch.object(Profiler, "log")
+    @mock.patch.object(Profiler, "disable")
+    @mock.patch.object(Profiler, "enable")
+    @mock.patch.object(Profiler, "__init__", return_value=None)
+    @mock.patch.object(SchemaTransformer, "process")
+    @mock.patch.object(SchemaTransformer, "__init__", return_value=None)
+    def test_generate_with_profile(
+        self,
+        mock_init,
+        mock_process,
+        mock_profiler_init,
+        mock_enable,
+        mock_disable,
+        mock_log,
+        mock_dump,
+    ):
+        source = fixtures_dir.joinpath("defxmlschema/chapter03.xsd")
+        result = self.runner.invoke(cli, [str(source)])
+
+        self.assertIsNone(result.exception)
+        self.assertEqual(1, mock_process.call_count)
+        self.assertEqual(0, mock_profiler_init.call_count)
+        self.assertEqual(0, mock_enable.call_count)
+        self.assertEqual(0, mock_disable.call_count)
+
+        result = self.runner.invoke(
+            cli, [str(source), "--profile", "--profile-json", "profile.json"]
+        )
+
+        self.assertIsNone(result.exception)
+        mock_enable.assert_called_once_with()
+        mock_log.assert_called_once_with()
+        mock_dump.assert_called_once_with(Path("profile.json"))
+        mock_profiler_init.assert_called_once_with()
+        mock_disable.assert_called_once_with()
+        self.assertEqual(2, mock_process.call_count)
+
     @mock.patch.object(SchemaTransformer, "process")
     @mock.patch.object(SchemaTransformer, "__init__", return_value=None)
     def test_generate_with_debug_mode(self, *args):
@@ -153,18 +215,41 @@ class CliTests(TestCase):
         result = self.runner.invoke(cli, ["download", uri])
 
         self.assertIsNone(result.exception)
-        mock_init.assert_called_once_with(output=Path.cwd())
+        mock_init.assert_called_once_with(output=Path.cwd(), loader=mock.ANY, workers=8)
         mock_wget.assert_called_once_with(uri)
 
+        loader = mock_init.call_args[1]["loader"]
+        self.assertIsNone(loader.cache_dir)
+        self.assertFalse(loader.offline)
+
+    @mock.patch.object(Downloader, "wget")
+    @mock.patch.object(Downloader, "__init__", return_value=None)
+    def test_download_with_resource_cache(self, mock_init, mock_wget):
+        uri = "http://www.w3.org/2009/01/xml.xsd"
+        result = self.runner.invoke(cli, ["download", uri, "--offline"])
+        self.assertIn("The offline mode requires a resource cache", result.output)
+        self.assertEqual(0, mock_init.call_count)
+
+        args = ["download", uri, "--offline", "--resource-cache", "cache"]
+        result = self.runner.invoke(cli, args)
+
+        self.assertIsNone(result.exception)
+        loader = mock_init.call_args[1]["loader"]
+        self.assertEqual(Path("cache").resolve(), loader.cache_dir)
+        self.assertTrue(loader.offline)
+
     @mock.patch.object(Downloader, "wget")
     @mock.patch.object(Downloader, "__init__", return_value=None)
     def test_download_with_custom_output(self, mock_init, mock_wget):
         uri = "http://www.w3.org/2009/01/xml.xsd"
 
-        result = self.runner.invoke(cli, ["download", uri, "--output", "here/schemas"])
+        args = ["download", uri, "--output", "here/schemas", "--workers", "2"]
+        result = self.runner.invoke(cli, args)
 
         self.assertIsNone(result.exception)
-        mock_init.assert_called_once_with(output=Path("here/schemas").resolve())
+        mock_init.assert_called_once_with(
+            output=Path("here/schemas").resolve(), loader=mock.ANY, workers=2
+        )
         mock_wget.assert_called_once_with(uri)
 
     def test_resolve_source(self):
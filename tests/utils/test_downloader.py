@@ -1,5 +1,9 @@
+import functools
 import tempfile
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
+from typing import Any
 from unittest import TestCase, mock
 from urllib.request import urlopen
 
@@ -32,13 +36,70 @@ class DownloaderTests(TestCase):
         self.downloader.wget(wsdl)
         mock_write_file.assert_has_calls(
             [
-                mock.call(xsd, "hello.xsd", urlopen(xsd).read().decode()),
                 mock.call(wsdl, None, urlopen(wsdl).read().decode()),
+                mock.call(xsd, "hello.xsd", urlopen(xsd).read().decode()),
             ]
         )
 
-    @mock.patch.object(Downloader, "wget")
-    def test_wget_included(self, mock_wget):
+    def test_wget_over_http(self):
+        files = {
+            "main.wsdl": (
+                '<definitions xmlns="http://schemas.xmlsoap.org/wsdl/">'
+                '<import location="a.xsd"/>'
+                '<import location="b.wsdl"/>'
+                "</definitions>"
+            ),
+            "b.wsdl": (
+                '<definitions xmlns="http://schemas.xmlsoap.org/wsdl/">'
+                '<import location="{base}/common/c.xsd"/>'
+                '<import location="{base}/a.xsd"/>'
+                "</definitions>"
+            ),
+            "a.xsd": (
+                '<schema xmlns="http://www.w3.org/2001/XMLSchema">'
+                '<include schemaLocation="common/c.xsd"/>'
+                "</schema>"
+            ),
+            "common/c.xsd": (
+                '<schema xmlns="http://www.w3.org/2001/XMLSchema">'
+                '<include schemaLocation="../a.xsd"/>'
+                "</schema>"
+            ),
+        }
+
+        requests = []
+
+        class Handler(SimpleHTTPRequestHandler):
+            def log_message(self, *args: Any):
+                requests.append(self.path)
+
+        with tempfile.TemporaryDirectory() as source, tempfile.TemporaryDirectory() as output:
+            handler = functools.partial(Handler, directory=source)
+            with ThreadingHTTPServer(("127.0.0.1", 0), handler) as server:
+                base = f"http://127.0.0.1:{server.server_address[1]}"
+                for name, content in files.items():
+                    path = Path(source).joinpath(name)
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    path.write_text(content.format(base=base))
+
+                thread = threading.Thread(target=server.serve_forever)
+                thread.start()
+                try:
+                    downloader = Downloader(Path(output), workers=2)
+                    downloader.wget(f"{base}/main.wsdl")
+                finally:
+                    server.shutdown()
+                    thread.join()
+
+            self.assertEqual(4, len(requests))
+            self.assertEqual(["/main.wsdl"], requests[:1])
+            self.assertEqual({"/a.xsd", "/b.wsdl"}, set(requests[1:3]))
+            self.assertEqual(["/common/c.xsd"], requests[3:])
+            for name, content in files.items():
+                content = content.replace("{base}/", "")
+                self.assertEqual(content, Path(output).joinpath(name).read_text())
+
+    def test_find_included(self):
         schema = Schema(
             imports=[
                 Import(location="foo.xsd"),
@@ -47,14 +108,9 @@ class DownloaderTests(TestCase):
             ]
         )
 
-        self.downloader.wget_included(schema)
-        mock_wget.assert_has_calls(
-            [
-                mock.call(schema.imports[0].location, None),
-                mock.call(
-                    schema.imports[2].location, schema.imports[2].schema_location
-                ),
-            ]
+        self.assertEqual(
+            [("foo.xsd", None), ("foo.xsd", "../foo.xsd")],
+            list(self.downloader.find_included(schema)),
         )
 
     def test_adjust_base_path(self):
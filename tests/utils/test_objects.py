@@ -1,6 +1,10 @@
+import pickle
+from dataclasses import dataclass, field, replace
 from types import SimpleNamespace
+from typing import List
 from unittest import TestCase
 
+from xsdata.codegen.models import Restrictions
 from xsdata.utils import objects
 
 
@@ -15,3 +19,25 @@ class ObjectsTests(TestCase):
         objects.update(obj, **kwargs)
         self.assertEqual(1, obj.foo.bar)
         self.assertEqual(2, obj.bar)
+
+    def test_add_slots(self):
+        @objects.add_slots
+        @dataclass(unsafe_hash=True)
+        class Foo:
+            a: int
+            b: List[int] = field(default_factory=list, hash=False)
+            c: str = field(default="c")
+
+        obj = Foo(1)
+        self.assertEqual(("a", "b", "c"), Foo.__slots__)
+        self.assertEqual("Foo", Foo.__name__)
+        self.assertFalse(hasattr(obj, "__dict__"))
+        self.assertEqual(Foo(1, [], "c"), obj)
+        self.assertEqual(hash(Foo(1)), hash(obj))
+        self.assertEqual(Foo(2), replace(obj, a=2))
+
+        restrictions = Restrictions(min_occurs=1, path=[("s", 1, 1, 1)])
+        self.assertEqual(restrictions, pickle.loads(pickle.dumps(restrictions)))
+
+        with self.assertRaises(AttributeError):
+            obj.d = 1
@@ -0,0 +1,60 @@
+from unittest import TestCase
+
+from xsdata.utils.patches import MethodPatcher
+
+
+class Target:
+    def method(self) -> str:
+        return "method"
+
+    @classmethod
+    def factory(cls) -> str:
+        return "factory"
+
+
+def upper(original):
+    def wrapper(*args):
+        return original(*args).upper()
+
+    return wrapper
+
+
+class MethodPatcherTests(TestCase):
+    def test_apply_and_restore(self):
+        method = Target.__dict__["method"]
+        factory = Target.__dict__["factory"]
+        patcher = MethodPatcher()
+
+        patcher.apply([(Target, "method", upper), (Target, "factory", upper)])
+        self.assertTrue(patcher.active)
+        self.assertEqual("METHOD", Target().method())
+        self.assertEqual("FACTORY", Target.factory())
+        self.assertIsInstance(Target.__dict__["factory"], classmethod)
+        self.assertEqual("method", Target.method.__name__)
+
+        patcher.restore()
+        self.assertFalse(patcher.active)
+        self.assertIs(method, Target.__dict__["method"])
+        self.assertIs(factory, Target.__dict__["factory"])
+        self.assertEqual({}, MethodPatcher.registry)
+
+    def test_apply_with_patched_methods(self):
+        first = MethodPatcher()
+        second = MethodPatcher()
+        first.apply([(Target, "method", upper)])
+
+        with self.assertRaises(ValueError) as cm:
+            second.apply([(Target, "factory", upper), (Target, "method", upper)])
+
+        self.assertEqual("Method `Target.method` is already patched", str(cm.exception))
+        self.assertFalse(second.active)
+        self.assertEqual("factory", Target.factory())
+
+        with self.assertRaises(ValueError):
+            second.apply([(Target, "factory", upper), (Target, "factory", upper)])
+
+        self.assertFalse(second.active)
+        first.restore()
+        second.apply([(Target, "method", upper)])
+        self.assertEqual("METHOD", Target().method())
+        second.restore()
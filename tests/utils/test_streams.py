@@ -0,0 +1,49 @@
+import asyncio
+from io import StringIO
+from unittest import TestCase, mock
+
+from xsdata.utils import streams
+
+
+async def chunks(*args: bytes):
+    for arg in args:
+        yield arg
+
+
+class StreamsTests(TestCase):
+    def test_iter_chunks(self):
+        async def collect(source):
+            return [chunk async for chunk in streams.iter_chunks(source, 2)]
+
+        async def read_stream():
+            reader = asyncio.StreamReader()
+            reader.feed_data(b"abcde")
+            reader.feed_eof()
+            return await collect(reader)
+
+        self.assertEqual([b"ab", b"cd", b"e"], asyncio.run(read_stream()))
+        self.assertEqual(
+            [b"ab", b"c", b"de", b"f"], asyncio.run(collect(chunks(b"abc", b"def")))
+        )
+
+    def test_read_all(self):
+        actual = asyncio.run(streams.read_all(chunks(b"abc", b"", b"def")))
+        self.assertEqual(b"abcdef", actual)
+
+    def test_write(self):
+        sink = mock.Mock(drain=mock.AsyncMock())
+        asyncio.run(streams.write(sink, "aäbc", "utf-8", 2))
+
+        sink.write.assert_has_calls([mock.call("aä".encode()), mock.call(b"bc")])
+        self.assertEqual(2, sink.drain.call_count)
+
+    def test_flush(self):
+        sink = mock.Mock(drain=mock.AsyncMock())
+        buffer = StringIO()
+        asyncio.run(streams.flush(sink, buffer, "utf-8"))
+        self.assertEqual(0, sink.write.call_count)
+
+        buffer.write("abc")
+        asyncio.run(streams.flush(sink, buffer, "utf-8"))
+        sink.write.assert_called_once_with(b"abc")
+        self.assertEqual("", buffer.getvalue())
@@ -3,12 +3,14 @@ import platform
 import sys
 import warnings
 from pathlib import Path
-from typing import Any, Iterator
+from typing import Any, Callable, Iterator, Optional
 
 import click
 from click_default_group import DefaultGroup
 
 from xsdata import __version__
+from xsdata.codegen.profiler import Profiler
+from xsdata.codegen.resources import ResourceLoader
 from xsdata.codegen.transformer import SchemaTransformer
 from xsdata.logger import logger
 from xsdata.models.config import GeneratorConfig, GeneratorOutput
@@ -84,6 +86,30 @@ def init_config(**kwargs: Any):
     handler.emit_warnings()
 
 
+def resource_options(func: Callable) -> Callable:
+    """Add the remote resources cache options to the given command."""
+    func = click.option(
+        "--offline",
+        is_flag=True,
+        default=False,
+        help="Load the remote resources only from the resource cache",
+    )(func)
+    return click.option(
+        "--resource-cache",
+        type=click.Path(file_okay=False),
+        envvar="XSDATA_RESOURCE_CACHE",
+        help="Cache the remote resources in the given directory",
+    )(func)
+
+
+def resource_loader(resource_cache: Optional[str], offline: bool) -> ResourceLoader:
+    if offline and not resource_cache:
+        raise click.UsageError("The offline mode requires a resource cache.")
+
+    cache_dir = Path(resource_cache).resolve() if resource_cache else None
+    return ResourceLoader(cache_dir=cache_dir, offline=offline)
+
+
 @cli.command("download")
 @click.argument("source", required=True)
 @click.option(
@@ -93,9 +119,19 @@ def init_config(**kwargs: Any):
     default="./",
     help="Output directory, default cwd",
 )
-def download(source: str, output: str):
+@click.option(
+    "--workers",
+    type=int,
+    default=8,
+    help="The number of concurrent downloads",
+)
+@resource_options
+def download(source: str, output: str, workers: int, **kwargs: Any):
     """Download a schema or a definition locally with all its dependencies."""
-    downloader = Downloader(output=Path(output).resolve())
+    loader = resource_loader(**kwargs)
+    downloader = Downloader(
+        output=Path(output).resolve(), loader=loader, workers=workers
+    )
     downloader.wget(source)
 
     handler.emit_warnings()
@@ -112,7 +148,27 @@ def download(source: str, output: str):
 )
 @click.option("-c", "--config", default=".xsdata.xml", help="Project configuration")
 @click.option("-pp", "--print", is_flag=True, default=False, help="Print output")
-@click.option("--cache", is_flag=True, default=False, help="Cache sources loading")
+@click.option(
+    "--cache", is_flag=True, default=False, help="Cache the parsed schemas by content"
+)
+@click.option(
+    "--workers",
+    type=int,
+    default=0,
+    help="Parse and map the sources in a pool of worker processes",
+)
+@click.option(
+    "--profile",
+    is_flag=True,
+    default=False,
+    help="Print the wall time of the code generation phases and handlers",
+)
+@click.option(
+    "--profile-json",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Write the code generation profile to a json file",
+)
+@resource_options
 @click.option("--debug", is_flag=True, default=False, help="Show debug messages")
 @model_options(GeneratorOutput)
 def generate(**kwargs: Any):
@@ -131,6 +187,10 @@ def generate(**kwargs: Any):
     source = kwargs.pop("source")
     stdout = kwargs.pop("print")
     cache = kwargs.pop("cache")
+    workers = kwargs.pop("workers")
+    loader = resource_loader(kwargs.pop("resource_cache"), kwargs.pop("offline"))
+    profile = kwargs.pop("profile")
+    profile_json = kwargs.pop("profile_json")
     recursive = kwargs.pop("recursive")
     config_file = Path(kwargs.pop("config")).resolve()
 
@@ -138,9 +198,21 @@ def generate(**kwargs: Any):
     config = GeneratorConfig.read(config_file)
     config.output.update(**params)
 
-    transformer = SchemaTransformer(config=config, print=stdout)
+    transformer = SchemaTransformer(
+        config=config, print=stdout, workers=workers, loader=loader
+    )
     uris = sorted(resolve_source(source, recursive=recursive))
-    transformer.process(uris, cache=cache)
+    if profile or profile_json:
+        with Profiler() as profiler:
+            transformer.process(uris, cache=cache)
+
+        if profile:
+            profiler.log()
+
+        if profile_json:
+            profiler.dump(Path(profile_json))
+    else:
+        transformer.process(uris, cache=cache)
 
     handler.emit_warnings()
 
@@ -26,7 +26,7 @@ from xsdata.codegen.mixins import ContainerInterface
 from xsdata.codegen.models import Class, Status
 from xsdata.codegen.utils import ClassUtils
 from xsdata.models.config import GeneratorConfig
-from xsdata.utils import collections
+from xsdata.utils import collections, namespaces, text
 from xsdata.utils.constants import return_true
 
 
@@ -39,7 +39,7 @@ class Steps:
 
 
 class ClassContainer(ContainerInterface):
-    __slots__ = ("data", "processors", "step")
+    __slots__ = ("data", "names", "processors", "step")
 
     def __init__(self, config: GeneratorConfig):
         """Initialize a class container instance with its processors based on
@@ -47,7 +47,8 @@ class ClassContainer(ContainerInterface):
         super().__init__(config)
 
         self.step: int = 0
-        self.data: Dict = {}
+        self.data: Dict[str, List[Class]] = {}
+        self.names: Dict[str, List[Class]] = {}
 
         self.processors: Dict[int, List] = {
             Steps.UNGROUP: [
@@ -104,6 +105,11 @@ class ClassContainer(ContainerInterface):
 
         return inner
 
+    def find_by_name(self, name: str) -> List[Class]:
+        """Search by local name for all the classes with the same name slug,
+        the lower case alphanumerical version of the name."""
+        return self.names.get(text.alnum(name), [])
+
     def first(self, qname: str) -> Class:
         classes = self.data.get(qname)
         if not classes:
@@ -158,13 +164,19 @@ class ClassContainer(ContainerInterface):
     def add(self, item: Class):
         """Add class item to the container."""
         self.data.setdefault(item.qname, []).append(item)
+        self.names.setdefault(item.slug, []).append(item)
 
     def reset(self, item: Class, qname: str):
+        """Update the indexes after the given class qualified name has
+        changed, the class references remain the same."""
         self.data[qname].remove(item)
-        self.add(item)
+        self.names[text.alnum(namespaces.local_name(qname))].remove(item)
+        self.data.setdefault(item.qname, []).append(item)
+        self.names.setdefault(item.slug, []).append(item)
 
     def set(self, items: List[Class]):
         self.data.clear()
+        self.names.clear()
         self.extend(items)
 
     def extend(self, items: List[Class]):
@@ -1,6 +1,6 @@
-from typing import List
+from typing import Dict, List
 
-from xsdata.codegen.mixins import ContainerHandlerInterface
+from xsdata.codegen.mixins import ContainerHandlerInterface, ContainerInterface
 from xsdata.codegen.models import Attr, Class, get_location, get_name, get_qname
 from xsdata.models.config import StructureStyle
 from xsdata.utils import collections, namespaces, text
@@ -9,15 +9,24 @@ REQUIRE_UNIQUE_NAMES = (StructureStyle.SINGLE_PACKAGE, StructureStyle.CLUSTERS)
 
 
 class RenameDuplicateClasses(ContainerHandlerInterface):
-    """Resolve class name conflicts depending on the output structure style."""
+    """
+    Resolve class name conflicts depending on the output structure style.
 
-    __slots__ = ()
+    :ivar dependants: The reverse dependencies index of the active run
+    """
+
+    __slots__ = ("dependants",)
+
+    def __init__(self, container: ContainerInterface):
+        super().__init__(container)
+        self.dependants: Dict[int, List[Class]] = {}
 
     def run(self):
         """Search for conflicts either by qualified name or local name
         depending on the configuration and start renaming classes and
         dependencies."""
 
+        self.dependants = self.build_dependants()
         use_name = self.should_use_names()
         getter = get_name if use_name else get_qname
         groups = collections.group_by(self.container, lambda x: text.alnum(getter(x)))
@@ -26,6 +35,16 @@ class RenameDuplicateClasses(ContainerHandlerInterface):
             if len(classes) > 1:
                 self.rename_classes(classes, use_name)
 
+    def build_dependants(self) -> Dict[int, List[Class]]:
+        """Map the class references to the classes that depend on them,
+        through their attrs, extensions or inner classes."""
+        result: Dict[int, List[Class]] = {}
+        for obj in self.container:
+            for reference in set(obj.references):
+                result.setdefault(reference, []).append(obj)
+
+        return result
+
     def should_use_names(self) -> bool:
         """
         Determine if we should be using names or qualified names to detect
@@ -64,7 +83,7 @@ class RenameDuplicateClasses(ContainerHandlerInterface):
         target.meta_name = name
         self.container.reset(target, qname)
 
-        for item in self.container:
+        for item in self.dependants.get(target.ref, []):
             self.rename_class_dependencies(item, id(target), target.qname)
 
     def next_qname(self, namespace: str, name: str, use_name: bool) -> str:
@@ -72,18 +91,17 @@ class RenameDuplicateClasses(ContainerHandlerInterface):
         local name."""
         index = 0
 
-        if use_name:
-            reserved = {text.alnum(obj.name) for obj in self.container}
-        else:
-            reserved = {text.alnum(obj.qname) for obj in self.container}
-
         while True:
             index += 1
             new_name = f"{name}_{index}"
             qname = namespaces.build_qname(namespace, new_name)
-            cmp = text.alnum(new_name if use_name else qname)
+            matches = self.container.find_by_name(new_name)
+
+            if not use_name:
+                cmp = text.alnum(qname)
+                matches = [obj for obj in matches if text.alnum(obj.qname) == cmp]
 
-            if cmp not in reserved:
+            if not matches:
                 return qname
 
     def rename_class_dependencies(self, target: Class, reference: int, replace: str):
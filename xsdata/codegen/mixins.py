@@ -29,6 +29,11 @@ class ContainerInterface(abc.ABC):
     def find_inner(self, source: Class, qname: str) -> Class:
         """Search by qualified name for a specific inner class or fail."""
 
+    @abc.abstractmethod
+    def find_by_name(self, name: str) -> List[Class]:
+        """Search by local name for all the classes with the same name
+        slug."""
+
     @abc.abstractmethod
     def first(self, qname: str) -> Class:
         """Search by qualified name for a specific class and return the first
@@ -10,6 +10,7 @@ from xsdata.formats.dataclass.models.elements import XmlType
 from xsdata.models.enums import DataType, Namespace, Tag
 from xsdata.models.mixins import ElementBase
 from xsdata.utils import namespaces, text
+from xsdata.utils.objects import add_slots
 
 xml_type_map = {
     Tag.ANY: XmlType.WILDCARD,
@@ -23,6 +24,7 @@ SIMPLE_TYPES = (Tag.EXTENSION, Tag.LIST, Tag.SIMPLE_TYPE, Tag.UNION)
 GLOBAL_TYPES = (Tag.ELEMENT, Tag.BINDING_OPERATION, Tag.BINDING_MESSAGE, Tag.MESSAGE)
 
 
+@add_slots
 @dataclass
 class Restrictions:
     """Model representation of a dataclass field validation and type
@@ -158,6 +160,7 @@ class AttrCategory(IntEnum):
     EXTERNAL = 2
 
 
+@add_slots
 @dataclass(unsafe_hash=True)
 class AttrType:
     """Model representation for the typing information for fields and
@@ -193,6 +196,7 @@ class AttrType:
         return replace(self)
 
 
+@add_slots
 @dataclass
 class Attr:
     """Model representation for a dataclass field."""
@@ -342,6 +346,7 @@ class Attr:
         return self.xml_type not in (Tag.ATTRIBUTE, None)
 
 
+@add_slots
 @dataclass(unsafe_hash=True)
 class Extension:
     """Model representation of a dataclass base class."""
@@ -373,6 +378,7 @@ class Status(IntEnum):
     FINALIZED = 51
 
 
+@add_slots
 @dataclass
 class Class:
     """Model representation of a dataclass with fields, base/inner classes and
@@ -566,6 +572,7 @@ class Class:
         return any(inner.has_forward_ref() for inner in self.inner)
 
 
+@add_slots
 @dataclass
 class Import:
     """
@@ -1,19 +1,35 @@
+import functools
 import sys
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Type, Union
 from urllib.parse import urljoin
 
 from xsdata.formats.bindings import T
+from xsdata.formats.dataclass.context import XmlContext
 from xsdata.formats.dataclass.parsers.bases import Parsed
 from xsdata.formats.dataclass.parsers.mixins import XmlNode
 from xsdata.formats.dataclass.parsers.xml import UserXmlParser
-from xsdata.models import xsd
+from xsdata.models import wsdl, xsd
 from xsdata.models.enums import FormType, Mode, Namespace
 from xsdata.models.mixins import ElementBase
 
 OPEN_CONTENT_ELEMENT = Union[xsd.ComplexType, xsd.Restriction, xsd.Extension]
 
 
+@functools.lru_cache(maxsize=None)
+def schema_context() -> XmlContext:
+    """
+    Return the shared xml context of the schema and definitions parsers.
+
+    The binding metadata are built from the root models, most xsd models
+    inherit their namespace from their parents.
+    """
+    context = XmlContext()
+    context.build_recursive(xsd.Schema)
+    context.build_recursive(wsdl.Definitions)
+    return context
+
+
 @dataclass
 class SchemaParser(UserXmlParser):
     """
@@ -23,6 +39,7 @@ class SchemaParser(UserXmlParser):
     The parser is as a dummy as possible, but it will try to normalize
     certain things like apply parent properties to children.
 
+    :param context: Model context provider, shared by all the instances
     :param location:
     :param element_form:
     :param attribute_form:
@@ -31,6 +48,7 @@ class SchemaParser(UserXmlParser):
     :param default_open_content:
     """
 
+    context: XmlContext = field(default_factory=schema_context)
     index: int = field(default_factory=int)
     indices: List[int] = field(default_factory=list)
     location: Optional[str] = field(default=None)
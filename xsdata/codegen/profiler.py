@@ -0,0 +1,295 @@
+import json
+import logging
+from pathlib import Path
+from time import perf_counter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from xsdata.codegen.container import ClassContainer, Steps
+from xsdata.codegen.transformer import SchemaTransformer
+from xsdata.codegen.writer import CodeWriter
+from xsdata.logger import logger
+from xsdata.models.config import GeneratorConfig
+from xsdata.utils.patches import MethodPatcher
+
+
+class Phase:
+    """Profiled phase names."""
+
+    TRANSFORMER = "transformer"
+    STEP = "step"
+    HANDLER = "handler"
+    WRITER = "writer"
+
+
+class ProfileRecord(NamedTuple):
+    """
+    Profiler record.
+
+    :param phase: The profiled phase
+    :param name: The phase, step or handler name
+    :param calls: The number of calls
+    :param classes: The number of distinct classes touched
+    :param seconds: The total wall time
+    """
+
+    phase: str
+    name: str
+    calls: int
+    classes: int
+    seconds: float
+
+
+class Profiler:
+    """
+    Collect timers, call counters and touched classes for the code
+    generation pipeline.
+
+    The transformer parse/map/analyze phases, the container steps and
+    handlers and the writer render/format phases are wrapped only while
+    the profiler is enabled, one profiler can be enabled at a time.
+
+    The handlers trigger the processing of their dependencies on demand,
+    their timers exclude the nested handler calls, in order to point to
+    the actual slow handler. The steps and phases timers are inclusive.
+    The sources parsed and mapped in worker processes are not profiled.
+
+    Example::
+
+        with Profiler() as profiler:
+            transformer.process(uris)
+
+        profiler.log()
+
+    """
+
+    __slots__ = ("counters", "timers", "classes", "patcher", "stack", "step")
+
+    def __init__(self):
+        self.counters: Dict[Tuple[str, str], int] = {}
+        self.timers: Dict[Tuple[str, str], float] = {}
+        self.classes: Dict[Tuple[str, str], Set[int]] = {}
+        self.patcher = MethodPatcher()
+        self.stack: List[float] = []
+        self.step: Optional[str] = None
+
+    def __enter__(self) -> "Profiler":
+        self.enable()
+        return self
+
+    def __exit__(self, *args: Any):
+        self.disable()
+
+    @property
+    def enabled(self) -> bool:
+        return self.patcher.active
+
+    def enable(self):
+        """
+        Install the profiler hooks.
+
+        :raises ValueError: If another profiler is already enabled
+        """
+        if self.enabled:
+            return
+
+        patches = [
+            (SchemaTransformer, "parse_schema_source", self.wrap_phase("parse")),
+            (SchemaTransformer, "parse_definitions", self.wrap_phase("parse")),
+            (SchemaTransformer, "generate_classes", self.wrap_phase("map")),
+            (SchemaTransformer, "convert_definitions", self.wrap_phase("map")),
+            (SchemaTransformer, "map_xml_document", self.wrap_phase("map")),
+            (SchemaTransformer, "analyze_classes", self.wrap_phase("analyze")),
+            (ClassContainer, "process_classes", self.wrap_process_classes),
+            (ClassContainer, "filter_classes", self.wrap_step("FILTER")),
+            (ClassContainer, "designate_classes", self.wrap_step("DESIGNATE")),
+            (CodeWriter, "ruff_files", self.wrap_format),
+            (CodeWriter, "ruff_code", self.wrap_format),
+        ]
+        for generator in set(CodeWriter.generators.values()):
+            patches.append((generator, "render", self.wrap_render))
+
+        container = ClassContainer(GeneratorConfig())
+        handlers = {
+            type(processor)
+            for processors in container.processors.values()
+            for processor in processors
+        }
+        for clazz in handlers:
+            patches.append((clazz, "process", self.wrap_handler(clazz.__name__)))
+
+        self.patcher.apply(patches)
+
+    def disable(self):
+        """Remove the profiler hooks."""
+        self.patcher.restore()
+
+    def reset(self):
+        """Clear all the collected counters, timers and classes."""
+        self.counters.clear()
+        self.timers.clear()
+        self.classes.clear()
+
+    def add(
+        self,
+        phase: str,
+        name: str,
+        seconds: float,
+        count: int = 1,
+        classes: Iterable[Any] = (),
+    ):
+        """Increase the counter, the timer and the touched classes of the
+        phase/name pair."""
+        key = (phase, name)
+        self.counters[key] = self.counters.get(key, 0) + count
+        self.timers[key] = self.timers.get(key, 0.0) + seconds
+        self.classes.setdefault(key, set()).update(id(obj) for obj in classes)
+
+    def records(self) -> List[ProfileRecord]:
+        """Return the collected records grouped by phase and sorted by the
+        total time."""
+        phases = [Phase.TRANSFORMER, Phase.STEP, Phase.HANDLER, Phase.WRITER]
+        result = [
+            ProfileRecord(
+                phase,
+                name,
+                counter,
+                len(self.classes[(phase, name)]),
+                self.timers[(phase, name)],
+            )
+            for (phase, name), counter in self.counters.items()
+        ]
+        result.sort(key=lambda x: (phases.index(x.phase), -x.seconds, x.name))
+        return result
+
+    def table(self) -> str:
+        """Return a summary table of the collected records."""
+        header = ("Phase", "Name", "Calls", "Classes", "Seconds")
+        rows = [
+            (r.phase, r.name, str(r.calls), str(r.classes), f"{r.seconds:.6f}")
+            for r in self.records()
+        ]
+        widths = [max(len(row[i]) for row in [header, *rows]) for i in range(5)]
+        lines = [
+            "  ".join(
+                value.ljust(width) if i < 2 else value.rjust(width)
+                for i, (value, width) in enumerate(zip(row, widths))
+            )
+            for row in [header, *rows]
+        ]
+        lines.insert(1, "  ".join("-" * width for width in widths))
+        return "\n".join(lines)
+
+    def log(self, level: int = logging.INFO):
+        """Log the summary table of the collected records."""
+        logger.log(level, "Profile summary:\n%s\n", self.table())
+
+    def dump(self, path: Path):
+        """Write the collected records to the given path in json format."""
+        records = [record._asdict() for record in self.records()]
+        path.write_text(json.dumps(records, indent=2), encoding="utf-8")
+
+    def wrap_phase(self, name: str) -> Callable:
+        def wrap(original: Callable) -> Callable:
+            def phase(*args: Any, **kwargs: Any) -> Any:
+                begin = perf_counter()
+                result = None
+                try:
+                    result = original(*args, **kwargs)
+                    return result
+                finally:
+                    classes = result if isinstance(result, list) else ()
+                    seconds = perf_counter() - begin
+                    self.add(Phase.TRANSFORMER, name, seconds, classes=classes)
+
+            return phase
+
+        return wrap
+
+    def wrap_step(self, name: str) -> Callable:
+        def wrap(original: Callable) -> Callable:
+            def step(container: ClassContainer):
+                begin = perf_counter()
+                try:
+                    original(container)
+                finally:
+                    seconds = perf_counter() - begin
+                    self.add(Phase.STEP, name, seconds, classes=container)
+
+            return step
+
+        return wrap
+
+    def wrap_process_classes(self, original: Callable) -> Callable:
+        names = {
+            value: name for name, value in vars(Steps).items() if isinstance(value, int)
+        }
+
+        def process_classes(container: ClassContainer, step: int):
+            self.step = names.get(step, str(step))
+            begin = perf_counter()
+            try:
+                original(container, step)
+            finally:
+                self.add(Phase.STEP, self.step, perf_counter() - begin)
+                self.step = None
+
+        return process_classes
+
+    def wrap_handler(self, name: str) -> Callable:
+        def wrap(original: Callable) -> Callable:
+            def process(handler: Any, target: Any):
+                self.stack.append(0.0)
+                begin = perf_counter()
+                try:
+                    original(handler, target)
+                finally:
+                    elapsed = perf_counter() - begin
+                    nested = self.stack.pop()
+                    if self.stack:
+                        self.stack[-1] += elapsed
+
+                    seconds = elapsed - nested
+                    self.add(Phase.HANDLER, name, seconds, classes=(target,))
+                    if self.step:
+                        self.add(Phase.STEP, self.step, 0.0, 0, classes=(target,))
+
+            return process
+
+        return wrap
+
+    def wrap_render(self, original: Callable) -> Callable:
+        def render(generator: Any, classes: List) -> Iterator:
+            elapsed = 0.0
+            begin = perf_counter()
+            try:
+                for result in original(generator, classes):
+                    elapsed += perf_counter() - begin
+                    yield result
+                    begin = perf_counter()
+
+                elapsed += perf_counter() - begin
+            finally:
+                self.add(Phase.WRITER, "render", elapsed, classes=classes)
+
+        return render
+
+    def wrap_format(self, original: Callable) -> Callable:
+        def ruff(*args: Any, **kwargs: Any) -> Any:
+            begin = perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                self.add(Phase.WRITER, "format", perf_counter() - begin)
+
+        return ruff
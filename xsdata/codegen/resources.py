@@ -0,0 +1,181 @@
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.error import HTTPError, URLError
+from urllib.request import Request
+
+from xsdata.codegen import opener
+from xsdata.logger import logger
+
+
+class ResourceLoader:
+    """
+    Load the contents of local and remote resources.
+
+    With a cache directory the remote resources are stored by their
+    content hash and every uri keeps a reference to its contents along
+    with the ETag and Last-Modified response headers. The cached
+    resources are revalidated with conditional requests and if the
+    server is unreachable or fails with a server error the cached
+    contents are used instead.
+
+    The file uri resources are always read from their location but
+    they are also mirrored in the cache directory, which serves them
+    when the location is no longer readable, e.g. an unmounted shared
+    schemas volume.
+
+    In offline mode the remote resources are only loaded from the cache
+    directory.
+
+    :param cache_dir: The resources cache directory
+    :param offline: Do not fetch any remote resources
+    """
+
+    __slots__ = ("cache_dir", "offline")
+
+    def __init__(self, cache_dir: Optional[Path] = None, offline: bool = False):
+        self.cache_dir = cache_dir
+        self.offline = offline
+
+    def load(self, uri: str) -> bytes:
+        """
+        Return the contents of the given uri.
+
+        :param uri: The resource location
+        :raises OSError: If the resource is not found or not cached in
+            offline mode.
+        """
+        if uri.startswith("file://"):
+            return self.load_file(uri)
+
+        if not uri.startswith(("http://", "https://")):
+            return opener.open(uri).read()  # nosec
+
+        ref = self.read_ref(uri)
+        if self.offline:
+            if ref is None:
+                raise URLError(f"Resource is not cached: {uri}")
+
+            return ref["content"]
+
+        if self.cache_dir is None:
+            return opener.open(uri).read()  # nosec
+
+        request = Request(uri)
+        if ref and ref["etag"]:
+            request.add_header("If-None-Match", ref["etag"])
+        if ref and ref["last_modified"]:
+            request.add_header("If-Modified-Since", ref["last_modified"])
+
+        try:
+            with opener.open(request) as response:  # nosec
+                content = response.read()
+                headers = response.headers
+        except HTTPError as e:
+            if ref is None or (e.code != 304 and e.code < 500):
+                raise
+
+            if e.code == 304:
+                logger.debug("Resource not modified %s", uri)
+            else:
+                logger.warning("Using cached resource %s, %s", uri, e)
+
+            return ref["content"]
+        except URLError as e:
+            if ref is None:
+                raise
+
+            logger.warning("Using cached resource %s, %s", uri, e.reason)
+            return ref["content"]
+
+        self.write_ref(uri, content, headers.get("ETag"), headers.get("Last-Modified"))
+        return content
+
+    def load_file(self, uri: str) -> bytes:
+        """
+        Return the contents of the given file uri and mirror them in the
+        cache directory, if enabled.
+
+        :param uri: The file uri
+        :raises OSError: If the file is not readable and not mirrored
+        """
+        try:
+            content = opener.open(uri).read()  # nosec
+        except OSError as e:
+            ref = self.read_ref(uri)
+            if ref is None:
+                raise
+
+            logger.warning("Using mirrored resource %s, %s", uri, e)
+            return ref["content"]
+
+        if self.cache_dir is not None:
+            self.write_ref(uri, content, None, None)
+
+        return content
+
+    def read_ref(self, uri: str) -> Optional[Dict]:
+        """Return the cached reference of the given uri with its contents, if
+        any."""
+        if self.cache_dir is None:
+            return None
+
+        ref_path = self.ref_path(uri)
+        if not ref_path.exists():
+            return None
+
+        ref = json.loads(ref_path.read_text(encoding="utf-8"))
+        blob_path = self.blob_path(ref["digest"])
+        if not blob_path.exists():
+            return None
+
+        ref["content"] = blob_path.read_bytes()
+        return ref
+
+    def write_ref(
+        self,
+        uri: str,
+        content: bytes,
+        etag: Optional[str],
+        last_modified: Optional[str],
+    ):
+        """Store the given contents and the uri reference with the response
+        validators, unless they are already stored."""
+        digest = hashlib.sha256(content).hexdigest()
+        blob_path = self.blob_path(digest)
+        if not blob_path.exists():
+            self.write_file(blob_path, content)
+
+        ref = {
+            "uri": uri,
+            "digest": digest,
+            "etag": etag,
+            "last_modified": last_modified,
+        }
+        ref_path = self.ref_path(uri)
+        data = json.dumps(ref, indent=2).encode()
+        if not ref_path.exists() or ref_path.read_bytes() != data:
+            self.write_file(ref_path, data)
+
+    def ref_path(self, uri: str) -> Path:
+        assert self.cache_dir is not None
+        key = hashlib.sha256(uri.encode()).hexdigest()
+        return self.cache_dir.joinpath("refs", f"{key}.json")
+
+    def blob_path(self, digest: str) -> Path:
+        assert self.cache_dir is not None
+        return self.cache_dir.joinpath("blobs", digest[:2], digest)
+
+    @classmethod
+    def write_file(cls, path: Path, content: bytes):
+        """Write the file contents atomically, the cache directory might be
+        shared by concurrent processes."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+
+        os.replace(tmp, path)
@@ -1,14 +1,16 @@
 import hashlib
 import io
+import itertools
 import json
 import os
 import pickle
 import tempfile
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+from typing import Callable, Dict, List, NamedTuple, Optional, Set, Tuple
 
-from xsdata.codegen import opener
+from xsdata import __version__
 from xsdata.codegen.analyzer import ClassAnalyzer
 from xsdata.codegen.container import ClassContainer
 from xsdata.codegen.mappers.definitions import DefinitionsMapper
@@ -20,6 +22,7 @@ from xsdata.codegen.models import Class
 from xsdata.codegen.parsers.definitions import DefinitionsParser
 from xsdata.codegen.parsers.dtd import DtdParser
 from xsdata.codegen.parsers.schema import SchemaParser
+from xsdata.codegen.resources import ResourceLoader
 from xsdata.codegen.utils import ClassUtils
 from xsdata.codegen.writer import CodeWriter
 from xsdata.exceptions import CodeGenerationError
@@ -46,6 +49,19 @@ class SupportedType(NamedTuple):
     match_content: Callable
 
 
+class MappedSchema(NamedTuple):
+    """
+    The codegen classes of a single schema.
+
+    :param includes: The locations and the parent target namespaces of
+        the included, imported and overridden schemas
+    :param classes: The schema codegen classes
+    """
+
+    includes: List[Tuple[str, Optional[str]]]
+    classes: List[Class]
+
+
 supported_types = [
     SupportedType(
         id=TYPE_DEFINITION,
@@ -87,29 +103,57 @@ class SchemaTransformer:
 
     :param print: Print to stdout the generated output
     :param config: Generator configuration
+    :param workers: The number of processes to parse and map schemas
+        and documents, zero to disable parallel processing
+    :param loader: The resources loader
+    :param cache_dir: The directory of the schemas cache, if enabled
+    :param mapped: The mapped schemas by location and parent namespace
     """
 
-    __slots__ = ("print", "config", "classes", "processed", "preloaded")
-
-    def __init__(self, print: bool, config: GeneratorConfig):
+    __slots__ = (
+        "print",
+        "config",
+        "workers",
+        "loader",
+        "classes",
+        "processed",
+        "preloaded",
+        "cache_dir",
+        "mapped",
+    )
+
+    def __init__(
+        self,
+        print: bool,
+        config: GeneratorConfig,
+        workers: int = 0,
+        loader: Optional[ResourceLoader] = None,
+    ):
         self.print = print
         self.config = config
+        self.workers = workers
+        self.loader = loader or ResourceLoader()
         self.classes: List[Class] = []
-        self.processed: List[str] = []
+        self.processed: Set[str] = set()
         self.preloaded: Dict = {}
+        self.cache_dir: Optional[Path] = None
+        self.mapped: Dict[Tuple[str, Optional[str]], Optional[MappedSchema]] = {}
 
     def process(self, uris: List[str], cache: bool = False):
-        cache_file = self.get_cache_file(uris) if cache else None
-        if cache_file and cache_file.exists():
-            logger.info(f"Loading from cache {cache_file}")
+        """
+        Process the given source uris and write or print the final output.
 
-            self.classes = pickle.loads(cache_file.read_bytes())
-        else:
-            self.process_sources(uris)
+        With the cache enabled, the mapped classes of every xsd resource
+        are stored in the temp directory, keyed by the resource contents,
+        and reused until the resource is modified.
 
-        if cache_file and not cache_file.exists():
-            cache_file.write_bytes(pickle.dumps(self.classes))
+        :param uris: The list of the source uris
+        :param cache: Enable the schemas cache
+        """
+        if cache:
+            self.cache_dir = self.get_cache_dir()
 
+        self.process_sources(uris)
         self.process_classes()
 
     def process_sources(self, uris: List[str]):
@@ -140,6 +184,9 @@ class SchemaTransformer:
 
     def process_schemas(self, uris: List[str]):
         """Process a list of xsd resources."""
+        if self.workers:
+            self.map_schemas([(uri, None) for uri in uris])
+
         for uri in uris:
             self.process_schema(uri)
 
@@ -159,24 +206,175 @@ class SchemaTransformer:
 
     def process_schema(self, uri: str, namespace: Optional[str] = None):
         """Parse and convert schema to codegen models."""
-        schema = self.parse_schema(uri, namespace)
-        if schema:
-            self.convert_schema(schema)
+        if self.cache_dir or self.workers:
+            self.process_mapped_schema(uri, namespace)
+        else:
+            schema = self.parse_schema(uri, namespace)
+            if schema:
+                self.convert_schema(schema)
+
+    def process_mapped_schema(self, uri: str, namespace: Optional[str]):
+        """
+        Parse and convert schema to codegen models, through the schemas
+        cache or the workers pool.
+
+        The schemas are mapped independently, the mapped includes are
+        processed recursively, in the same order as the sequential
+        process.
+        """
+        if uri in self.processed:
+            logger.debug("Skipping already processed: %s", uri)
+            return
+
+        self.processed.add(uri)
+        key = (uri, namespace)
+        if key not in self.mapped:
+            self.map_schemas([key])
+
+        result = self.mapped[key]
+        if result is None:
+            logger.warning("Resource not found %s", uri)
+            return
+
+        for location, target_namespace in result.includes:
+            self.process_schema(location, target_namespace)
+
+        self.classes.extend(result.classes)
+
+    def map_schemas(self, keys: List[Tuple[str, Optional[str]]]):
+        """
+        Map the given schemas.
+
+        With workers enabled the schemas and all their includes are
+        mapped in a process pool, one level of the includes graph at a
+        time.
+
+        :param keys: A list of schema locations and parent namespaces
+        """
+        if not self.workers:
+            for uri, namespace in keys:
+                input_stream = self.preloaded.pop(uri, None)
+                self.mapped[uri, namespace] = self.map_schema(
+                    uri, namespace, input_stream, self.cache_dir, self.loader
+                )
+            return
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            pending = list(dict.fromkeys(keys))
+            while pending:
+                futures = [
+                    executor.submit(
+                        self.map_schema,
+                        uri,
+                        namespace,
+                        self.preloaded.pop(uri, None),
+                        self.cache_dir,
+                        self.loader,
+                    )
+                    for uri, namespace in pending
+                ]
+
+                includes = []
+                for key, future in zip(pending, futures):
+                    result = future.result()
+                    self.mapped[key] = result
+                    if result:
+                        includes.extend(result.includes)
+
+                pending = [
+                    key for key in dict.fromkeys(includes) if key not in self.mapped
+                ]
+
+    @classmethod
+    def map_schema(
+        cls,
+        uri: str,
+        namespace: Optional[str],
+        input_stream: Optional[bytes],
+        cache_dir: Optional[Path],
+        loader: ResourceLoader,
+    ) -> Optional[MappedSchema]:
+        """
+        Load, parse and convert a single schema to codegen models.
+
+        The results are loaded from and stored to the cache directory,
+        if enabled, keyed by the schema contents. The cache entries are
+        written atomically and unreadable entries are treated as misses.
+
+        :param uri: The schema location
+        :param namespace: The parent target namespace
+        :param input_stream: The preloaded schema contents
+        :param cache_dir: The schemas cache directory
+        :param loader: The resources loader
+        :return: The mapped schema or None if the resource is not found.
+        """
+        if input_stream is None:
+            try:
+                input_stream = loader.load(uri)
+            except OSError:
+                return None
+
+        cache_file = None
+        if cache_dir:
+            cache_file = cls.get_cache_file(cache_dir, uri, namespace, input_stream)
+            if cache_file.exists():
+                try:
+                    cached = MappedSchema(*pickle.loads(cache_file.read_bytes()))
+                except (
+                    OSError,
+                    EOFError,
+                    pickle.UnpicklingError,
+                    AttributeError,
+                    ImportError,
+                    TypeError,
+                    ValueError,
+                ) as e:
+                    logger.warning("Ignoring invalid cache of schema %s: %s", uri, e)
+                else:
+                    logger.info("Loading schema %s from cache", uri)
+                    return cached
+
+        schema = cls.parse_schema_source(input_stream, uri, namespace)
+        includes = [
+            (sub.location, schema.target_namespace)
+            for sub in schema.included()
+            if sub.location
+        ]
+        result = MappedSchema(includes, cls.generate_classes(schema))
+
+        if cache_file:
+            ResourceLoader.write_file(cache_file, pickle.dumps(result))
+
+        return result
 
     def process_xml_documents(self, uris: List[str]):
         """Process a list of xml resources."""
-        classes = []
-        parser = TreeParser()
+        classes: List[Class] = []
         location = os.path.dirname(uris[0]) if uris else ""
+        sources = []
         for uri in uris:
             input_stream = self.load_resource(uri)
             if input_stream:
                 logger.info("Parsing document %s", uri)
-                any_element: AnyElement = parser.from_bytes(input_stream)
-                classes.extend(ElementMapper.map(any_element, location))
+                sources.append(input_stream)
+
+        locations = [location] * len(sources)
+        if self.workers and len(sources) > 1:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                results = executor.map(self.map_xml_document, sources, locations)
+                classes.extend(itertools.chain.from_iterable(results))
+        else:
+            for source in sources:
+                classes.extend(self.map_xml_document(source, location))
 
         self.classes.extend(ClassUtils.reduce_classes(classes))
 
+    @classmethod
+    def map_xml_document(cls, input_stream: bytes, location: str) -> List[Class]:
+        """Parse and convert a single xml document to codegen models."""
+        any_element: AnyElement = TreeParser().from_bytes(input_stream)
+        return ElementMapper.map(any_element, location)
+
     def process_json_documents(self, uris: List[str]):
         """Process a list of json resources."""
         classes = []
@@ -235,13 +433,14 @@ class SchemaTransformer:
         """Convert a definitions instance to codegen classes."""
         self.classes.extend(DefinitionsMapper.map(definitions))
 
-    def generate_classes(self, schema: Schema) -> List[Class]:
+    @classmethod
+    def generate_classes(cls, schema: Schema) -> List[Class]:
         """Convert the given schema tree to a list of classes."""
         uri = schema.location
         logger.info("Compiling schema %s", uri if uri else "...")
         classes = SchemaMapper.map(schema)
 
-        class_num, inner_num = self.count_classes(classes)
+        class_num, inner_num = cls.count_classes(classes)
         if class_num > 0:
             logger.info("Builder: %d main and %d inner classes", class_num, inner_num)
 
@@ -253,6 +452,14 @@ class SchemaTransformer:
         if input_stream is None:
             return None
 
+        return self.parse_schema_source(input_stream, uri, namespace)
+
+    @classmethod
+    def parse_schema_source(
+        cls, input_stream: bytes, uri: str, namespace: Optional[str]
+    ) -> Schema:
+        """Parse the given schema contents and return the schema tree
+        object."""
         logger.info("Parsing schema %s", uri)
         parser = SchemaParser(target_namespace=namespace, location=uri)
         return parser.from_bytes(input_stream, Schema)
@@ -288,8 +495,8 @@ class SchemaTransformer:
         """Read and return the contents of the given uri."""
         if uri not in self.processed:
             try:
-                self.processed.append(uri)
-                return self.preloaded.pop(uri, None) or opener.open(uri).read()  # nosec
+                self.processed.add(uri)
+                return self.preloaded.pop(uri, None) or self.loader.load(uri)
             except OSError:
                 logger.warning("Resource not found %s", uri)
         else:
@@ -326,17 +533,38 @@ class SchemaTransformer:
 
         return ClassAnalyzer.process(container)
 
-    def count_classes(self, classes: List[Class]) -> Tuple[int, int]:
+    @classmethod
+    def count_classes(cls, classes: List[Class]) -> Tuple[int, int]:
         """Return a tuple of counters for the main and inner classes."""
         main = len(classes)
         inner = 0
-        for cls in classes:
-            inner += sum(self.count_classes(cls.inner))
+        for item in classes:
+            inner += sum(cls.count_classes(item.inner))
 
         return main, inner
 
     @classmethod
-    def get_cache_file(cls, uris: List[str]) -> Path:
-        key = hashlib.md5("".join(uris).encode()).hexdigest()
-        tempdir = tempfile.gettempdir()
-        return Path(tempdir).joinpath(f"{key}.cache")
+    def get_cache_dir(cls) -> Path:
+        """Return the schemas cache directory, create it if necessary."""
+        cache_dir = Path(tempfile.gettempdir()).joinpath("xsdata-schemas")
+        cache_dir.mkdir(exist_ok=True)
+        return cache_dir
+
+    @classmethod
+    def get_cache_file(
+        cls,
+        cache_dir: Path,
+        uri: str,
+        namespace: Optional[str],
+        input_stream: bytes,
+    ) -> Path:
+        """Return the cache file path for the given schema, the key is a
+        hash of the schema contents, location, the parent target namespace
+        and the library version."""
+        digest = hashlib.sha256()
+        for part in (__version__, uri, namespace or ""):
+            digest.update(part.encode())
+            digest.update(b"\0")
+
+        digest.update(input_stream)
+        return cache_dir.joinpath(f"{digest.hexdigest()}.cache")
@@ -1,3 +1,6 @@
+import hashlib
+import json
+import os
 import subprocess
 from pathlib import Path
 from textwrap import indent
@@ -20,6 +23,9 @@ class CodeWriter:
 
     __slots__ = "generator"
 
+    ruff_batch_size: ClassVar[int] = 500
+    manifest_name: ClassVar[str] = ".xsdata-manifest.json"
+
     generators: ClassVar[Dict[str, Type[AbstractGenerator]]] = {
         "dataclasses": DataclassGenerator,
     }
@@ -28,18 +34,108 @@ class CodeWriter:
         self.generator = generator
 
     def write(self, classes: List[Class]):
-        """Iterate over the designated generator outputs and create the
-        necessary directories and files."""
+        """
+        Iterate over the designated generator outputs and create the
+        necessary directories and files.
+
+        The outputs are staged in hidden temporary files next to their
+        destinations, formatted in batches with a single ruff process per
+        batch and finally moved in place, unless the existing files are
+        identical. Ruff resolves the configuration of the destination
+        directories and the moves never cross filesystems.
+        """
 
         self.generator.normalize_packages(classes)
         header = self.generator.render_header()
+        staged: Dict[Path, Path] = {}
+        try:
+            for result in self.generator.render(classes):
+                if result.source.strip():
+                    logger.info("Generating package: %s", result.title)
+                    staged[result.path] = self.stage_file(
+                        result.path, header + result.source
+                    )
+
+            self.ruff_files(list(staged.values()))
+
+            for path, staged_path in staged.items():
+                if path.exists() and path.read_bytes() == staged_path.read_bytes():
+                    logger.debug("Skipping unchanged file: %s", path)
+                else:
+                    os.replace(staged_path, path)
+        finally:
+            for staged_path in staged.values():
+                if staged_path.exists():
+                    staged_path.unlink()
+
+        if self.generator.config.output.prune_modules:
+            self.prune_modules(list(staged))
 
-        for result in self.generator.render(classes):
-            if result.source.strip():
-                logger.info("Generating package: %s", result.title)
-                src_code = self.ruff_code(header + result.source, result.path)
-                result.path.parent.mkdir(parents=True, exist_ok=True)
-                result.path.write_text(src_code, encoding="utf-8")
+    @classmethod
+    def stage_file(cls, path: Path, src_code: str) -> Path:
+        """Write the source code to a hidden temporary file in the directory
+        of the given path and return the temporary file path."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.stem}.{os.getpid()}.xsdata{path.suffix}")
+        tmp.write_text(src_code, encoding="utf-8")
+        return tmp
+
+    def prune_modules(self, file_paths: List[Path]):
+        """
+        Delete the stale modules of the previous runs and update the
+        manifest of the generated modules.
+
+        The manifest is stored in the target package directory with the
+        hash of every generated file. Only the modules of the previous
+        manifest which were not generated again and have not been
+        modified since, are deleted. Entries that resolve outside of the
+        target package directory are ignored.
+
+        :param file_paths: The file paths of the current run
+        """
+        package = self.generator.config.output.package
+        root = Path.cwd().joinpath(*package.split("."))
+        manifest_path = root.joinpath(self.manifest_name)
+        previous: Dict[str, str] = {}
+        if manifest_path.exists():
+            previous = json.loads(manifest_path.read_text(encoding="utf-8"))
+
+        current = {}
+        for path in file_paths:
+            try:
+                name = path.relative_to(root).as_posix()
+            except ValueError:
+                continue
+
+            current[name] = self.hash_file(path)
+
+        resolved_root = root.resolve()
+        for name, digest in previous.items():
+            path = root.joinpath(name).resolve()
+            try:
+                path.relative_to(resolved_root)
+            except ValueError:
+                logger.warning("Skipping manifest entry outside the package: %s", name)
+                continue
+
+            if (
+                name not in current
+                and path.is_file()
+                and self.hash_file(path) == digest
+            ):
+                logger.info("Deleting stale module: %s", path)
+                path.unlink()
+                if not any(path.parent.iterdir()):
+                    path.parent.rmdir()
+
+        if previous != current:
+            root.mkdir(parents=True, exist_ok=True)
+            manifest = json.dumps(current, indent=2, sort_keys=True)
+            manifest_path.write_text(manifest, encoding="utf-8")
+
+    @classmethod
+    def hash_file(cls, path: Path) -> str:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
 
     def print(self, classes: List[Class]):
         """Iterate over the designated generator outputs and print them to the
@@ -69,6 +165,25 @@ class CodeWriter:
     def unregister_generator(cls, name: str):
         cls.generators.pop(name)
 
+    def ruff_files(self, file_paths: List[Path]):
+        """Run ruff format on the given files in place, in batches."""
+        command = [
+            "ruff",
+            "format",
+            "--no-cache",
+            "--line-length",
+            str(self.generator.config.output.max_line_length),
+            "--",
+        ]
+        size = self.ruff_batch_size
+        try:
+            for index in range(0, len(file_paths), size):
+                batch = [str(path) for path in file_paths[index : index + size]]
+                subprocess.run(command + batch, capture_output=True, check=True)
+        except subprocess.CalledProcessError as e:
+            error = indent(e.stderr.decode(), "  ")
+            raise CodeGenerationError(f"Ruff failed:\n{error}")
+
     def ruff_code(self, src_code: str, file_path: Path) -> str:
         """Run ruff format on the src code."""
         commands = [
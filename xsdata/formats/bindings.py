@@ -3,6 +3,8 @@ import io
 import pathlib
 from typing import Any, Optional, Type, TypeVar
 
+from xsdata.utils import streams
+
 T = TypeVar("T")
 
 
@@ -29,3 +31,9 @@ class AbstractParser(abc.ABC):
     def parse(self, source: Any, clazz: Optional[Type[T]] = None) -> T:
         """Parse the input stream or filename and return the resulting object
         tree."""
+
+    async def parse_async(self, source: Any, clazz: Optional[Type[T]] = None) -> T:
+        """Read the asyncio stream reader or async iterable of bytes and return
+        the resulting object tree."""
+        data = await streams.read_all(source)
+        return self.from_bytes(data, clazz)
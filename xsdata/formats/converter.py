@@ -3,6 +3,7 @@ import base64
 import binascii
 import math
 import warnings
+from array import array
 from datetime import date, datetime, time
 from decimal import Decimal, InvalidOperation
 from enum import Enum, EnumMeta
@@ -10,6 +11,7 @@ from typing import (
     Any,
     Callable,
     Dict,
+    Iterable,
     List,
     Optional,
     Sequence,
@@ -32,6 +34,8 @@ from xsdata.models.datatype import (
 )
 from xsdata.utils import collections, namespaces, text
 
+ARRAY_TYPES = {**dict.fromkeys("bBhHiIlLqQ", int), **dict.fromkeys("fd", float)}
+
 
 class Converter(abc.ABC):
     """Abstract converter class."""
@@ -49,6 +53,10 @@ class Converter(abc.ABC):
     def serialize(self, value: Any, **kwargs: Any) -> str:
         """Convert value to string."""
 
+    def serialize_tokens(self, values: Iterable, **kwargs: Any) -> str:
+        """Convert the given values to a string of space separated tokens."""
+        return " ".join(self.serialize(value, **kwargs) for value in values)
+
     @classmethod
     def validate_input_type(cls, value: Any, tp: Type):
         if not isinstance(value, tp):
@@ -58,10 +66,11 @@ class Converter(abc.ABC):
 
 
 class ConverterFactory:
-    __slots__ = ("registry",)
+    __slots__ = ("registry", "cache")
 
     def __init__(self):
         self.registry: Dict[Type, Converter] = {}
+        self.cache: Dict[Type, Converter] = {}
 
     def deserialize(self, value: Any, types: Sequence[Type], **kwargs: Any) -> Any:
         """
@@ -88,12 +97,17 @@ class ConverterFactory:
         """
         Convert the given value to string, ignore None values.
 
-        If the value is a list assume the value is a list of tokens.
+        If the value is a list or an array assume the value is a list of
+        tokens, the int and float arrays are converted in bulk.
         """
         if value is None:
             return None
 
-        if isinstance(value, list):
+        if isinstance(value, array) and value.typecode in ARRAY_TYPES:
+            instance = self.type_converter(ARRAY_TYPES[value.typecode])
+            return instance.serialize_tokens(value, **kwargs)
+
+        if isinstance(value, (list, array)):
             return " ".join(self.serialize(val, **kwargs) for val in value)
 
         instance = self.value_converter(value)
@@ -141,6 +155,8 @@ class ConverterFactory:
         else:
             self.registry[data_type] = ProxyConverter(func)
 
+        self.cache.clear()
+
     def unregister_converter(self, data_type: Type):
         """
         Unregister the converter for the given data type.
@@ -148,6 +164,7 @@ class ConverterFactory:
         :raises KeyError: if the data type is not registered.
         """
         self.registry.pop(data_type)
+        self.cache.clear()
 
     def type_converter(self, datatype: Type) -> Converter:
         """
@@ -155,7 +172,8 @@ class ConverterFactory:
 
         Iterate over all but last mro items and check for registered
         converters, fall back to str and issue a warning if there are
-        not matches.
+        not matches. The mro matches are cached until the registry
+        changes.
         """
         try:
             # Quick in and out, without checking the whole mro.
@@ -163,10 +181,15 @@ class ConverterFactory:
         except KeyError:
             pass
 
+        instance = self.cache.get(datatype)
+        if instance:
+            return instance
+
         # We tested the first, ignore the object
         for mro in datatype.__mro__[1:-1]:
             if mro in self.registry:
-                return self.registry[mro]
+                instance = self.cache[datatype] = self.registry[mro]
+                return instance
 
         warnings.warn(f"No converter registered for `{datatype}`", ConverterWarning)
         return self.registry[str]
@@ -258,6 +281,9 @@ class IntConverter(Converter):
     def serialize(self, value: int, **kwargs: Any) -> str:
         return str(value)
 
+    def serialize_tokens(self, values: Iterable, **kwargs: Any) -> str:
+        return " ".join(map(str, values))
+
 
 class FloatConverter(Converter):
     INF = float("inf")
@@ -280,6 +306,12 @@ class FloatConverter(Converter):
 
         return repr(value).upper().replace("E+", "E")
 
+    def serialize_tokens(self, values: Iterable, **kwargs: Any) -> str:
+        """Convert the values in bulk, the repr of the special values is
+        inf, -inf and nan."""
+        result = " ".join(map(repr, values)).upper().replace("E+", "E")
+        return result.replace("NAN", "NaN")
+
 
 class BytesConverter(Converter):
     def deserialize(self, value: Any, **kwargs: Any) -> bytes:
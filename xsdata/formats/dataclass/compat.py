@@ -89,6 +89,13 @@ class ClassType(abc.ABC):
                 score(getattr(obj, var.name, None)) for var in self.get_fields(obj)
             )
 
+        # The dict and named tuple outputs of the parser class factories
+        if isinstance(obj, dict):
+            return sum(score(value) for value in obj.values())
+
+        if isinstance(obj, tuple) and hasattr(obj, "_fields"):
+            return sum(score(value) for value in obj)
+
         return score(obj)
 
 
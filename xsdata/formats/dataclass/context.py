@@ -1,16 +1,55 @@
+import gc
+import importlib
+import itertools
+import pkgutil
 import sys
+import time
+import warnings
 from collections import defaultdict
-from typing import Any, Callable, Dict, List, Optional, Set, Type
-
-from xsdata.exceptions import XmlContextError
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from types import ModuleType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Type,
+    Union,
+)
+
+from xsdata.exceptions import ConverterWarning, XmlContextError
 from xsdata.formats.bindings import T
+from xsdata.formats.converter import converter
 from xsdata.formats.dataclass.compat import class_types
 from xsdata.formats.dataclass.models.builders import XmlMetaBuilder
 from xsdata.formats.dataclass.models.elements import XmlMeta
+from xsdata.logger import logger
 from xsdata.models.enums import DataType
 from xsdata.utils.constants import return_input
 
 
+class WarmupResult(NamedTuple):
+    """
+    The warmup report.
+
+    :param modules: The number of imported modules
+    :param models: The number of binding models found in the modules
+    :param built: The number of new metadata instances in the cache
+    :param failed: The number of models that failed to build
+    :param seconds: The total wall time
+    """
+
+    modules: int
+    models: int
+    built: int
+    failed: int
+    seconds: float
+
+
 class XmlContext:
     """
     The service provider for binding operations' metadata.
@@ -29,6 +68,7 @@ class XmlContext:
         "xsi_cache",
         "sys_modules",
         "models_package",
+        "frozen",
     )
 
     def __init__(
@@ -46,11 +86,47 @@ class XmlContext:
         self.xsi_cache: Dict[str, List[Type]] = defaultdict(list)
         self.models_package = models_package
         self.sys_modules = 0
+        self.frozen = False
 
     def reset(self):
         self.cache.clear()
         self.xsi_cache.clear()
         self.sys_modules = 0
+        self.frozen = False
+
+    def freeze(self, gc_freeze: bool = False):
+        """
+        Finalize all the lazy caches of the current metadata.
+
+        Pre-fork servers share the memory of the master process with
+        the workers as copy-on-write, every lazy cache write in the
+        workers duplicates the underlying memory pages. Call this after
+        :meth:`warmup` and before forking.
+
+        - Build the xsi cache once and stop rebuilding it when new
+          modules are imported.
+        - Resolve the converters of every known data type.
+
+        Metadata for new classes can still be built after the freeze.
+
+        :param gc_freeze: Collect garbage and move all the objects to
+            the permanent generation of the garbage collector, see
+            :func:`gc.freeze`
+        """
+        self.build_xsi_cache()
+        self.frozen = True
+
+        for meta in list(self.cache.values()):
+            for var in meta.get_all_vars():
+                for tp in var.types:
+                    if tp is not object and not self.class_type.is_model(tp):
+                        with warnings.catch_warnings():
+                            warnings.simplefilter("ignore", ConverterWarning)
+                            converter.type_converter(tp)
+
+        if gc_freeze:
+            gc.collect()
+            gc.freeze()
 
     def get_builder(
         self, globalns: Optional[Dict[str, Callable]] = None
@@ -86,8 +162,13 @@ class XmlContext:
         return self.build(subclass, parent_ns) if subclass else meta
 
     def build_xsi_cache(self):
-        """Index all imported dataclasses by their xsi:type qualified name."""
-        if len(sys.modules) == self.sys_modules:
+        """
+        Index all imported dataclasses by their xsi:type qualified name.
+
+        The cache is rebuilt when new modules are imported, unless the
+        context is frozen.
+        """
+        if self.frozen or len(sys.modules) == self.sys_modules:
             return
 
         self.xsi_cache.clear()
@@ -202,16 +283,198 @@ class XmlContext:
             self.cache[clazz] = builder.build(clazz, parent_ns)
         return self.cache[clazz]
 
-    def build_recursive(self, clazz: Type, parent_ns: Optional[str] = None):
-        """Build the binding metadata for the given class and all of its
-        dependencies."""
-        if clazz not in self.cache:
-            meta = self.build(clazz, parent_ns)
-            for var in meta.get_all_vars():
-                types = var.element_types if var.elements else var.types
-                for tp in types:
-                    if self.class_type.is_model(tp):
-                        self.build_recursive(tp, meta.namespace)
+    def build_recursive(
+        self,
+        clazz: Type,
+        parent_ns: Optional[str] = None,
+        globalns: Optional[Dict[str, Callable]] = None,
+        include_subclasses: bool = False,
+    ):
+        """
+        Build the binding metadata for the given class and all of its
+        dependencies, including the choices of compound fields and
+        wildcards.
+
+        :param clazz: A dataclass type
+        :param parent_ns: The inherited parent namespace
+        :param globalns: Override the global variables for typing
+        :param include_subclasses: Build also the imported subclasses of
+            every dependency, the candidates of xsi:type substitutions
+        """
+        if clazz in self.cache:
+            return
+
+        meta = self.build(clazz, parent_ns, globalns)
+        for tp in self.dependencies(meta, include_subclasses):
+            self.build_recursive(tp, meta.namespace, globalns, include_subclasses)
+
+    def build_concurrently(
+        self,
+        models: List[Type],
+        globalns: Optional[Dict[str, Callable]] = None,
+        include_subclasses: bool = False,
+        workers: int = 1,
+    ) -> List[bool]:
+        """
+        Build the binding metadata for the given classes and all of their
+        dependencies in a thread pool.
+
+        Every class is submitted once, its dependencies are submitted as
+        soon as its metadata is built and the cache is only updated by
+        the calling thread.
+
+        :param models: The dataclass types
+        :param globalns: Override the global variables for typing
+        :param include_subclasses: Build also the imported subclasses of
+            every dependency
+        :param workers: The number of threads to use
+        :return: Whether every class and its dependencies were built
+        """
+        seen = set(self.cache)
+        failures: Set[Type] = set()
+        pending: Dict[Future, Type] = {}
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+
+            def submit(clazz: Type, parent_ns: Optional[str]):
+                if clazz not in seen:
+                    seen.add(clazz)
+                    builder = self.get_builder(globalns)
+                    pending[executor.submit(builder.build, clazz, parent_ns)] = clazz
+
+            for clazz in models:
+                submit(clazz, None)
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    clazz = pending.pop(future)
+                    try:
+                        meta = self.cache[clazz] = future.result()
+                    except (XmlContextError, NameError, TypeError) as e:
+                        logger.warning("Failed to build %s: %s", clazz.__qualname__, e)
+                        failures.add(clazz)
+                        continue
+
+                    for tp in self.dependencies(meta, include_subclasses):
+                        submit(tp, meta.namespace)
+
+        def is_complete(clazz: Type) -> bool:
+            stack = [clazz]
+            visited = set()
+            while stack:
+                tp = stack.pop()
+                if tp in failures:
+                    return False
+
+                if tp not in visited:
+                    visited.add(tp)
+                    stack.extend(self.dependencies(self.cache[tp], include_subclasses))
+
+            return True
+
+        return [not failures or is_complete(clazz) for clazz in models]
+
+    def dependencies(self, meta: XmlMeta, include_subclasses: bool) -> Iterator[Type]:
+        """
+        Yield the model types of the given metadata fields, including the
+        choices of compound fields and wildcards.
+
+        :param meta: The binding metadata
+        :param include_subclasses: Yield also the imported subclasses of
+            every model type
+        """
+        for var in meta.get_all_vars():
+            for tp in itertools.chain(var.types, var.element_types):
+                if not self.class_type.is_model(tp):
+                    continue
+
+                yield tp
+                if include_subclasses:
+                    for subclass in self.get_subclasses(tp):
+                        if self.is_binding_model(subclass):
+                            yield subclass
+
+    def warmup(
+        self,
+        package_or_module: Union[str, ModuleType],
+        include_subclasses: bool = True,
+        globalns: Optional[Dict[str, Callable]] = None,
+        workers: int = 0,
+    ) -> WarmupResult:
+        """
+        Import and build the binding metadata for every model in the given
+        package or module, in order to avoid the metadata construction cost
+        during the first binding operations.
+
+        :param package_or_module: A module instance or import path, packages
+            are imported recursively
+        :param include_subclasses: Build also the subclasses of the models
+            and their dependencies and index the xsi:type names
+        :param globalns: Override the global variables for typing
+        :param workers: The number of threads to use, zero means no threads
+        :return: The warmup report
+        """
+        start = time.perf_counter()
+        size = len(self.cache)
+        modules = list(self.import_modules(package_or_module))
+        models = [
+            clazz
+            for module in modules
+            for clazz in vars(module).values()
+            if isinstance(clazz, type)
+            and clazz.__module__ == module.__name__
+            and self.is_binding_model(clazz)
+        ]
+
+        if include_subclasses:
+            self.build_xsi_cache()
+
+        def build(clazz: Type) -> bool:
+            try:
+                self.build_recursive(
+                    clazz, globalns=globalns, include_subclasses=include_subclasses
+                )
+                return True
+            except (XmlContextError, NameError, TypeError) as e:
+                logger.warning("Failed to build %s: %s", clazz.__qualname__, e)
+                return False
+
+        if workers > 0:
+            results = self.build_concurrently(
+                models, globalns, include_subclasses, workers
+            )
+        else:
+            results = [build(clazz) for clazz in models]
+
+        result = WarmupResult(
+            modules=len(modules),
+            models=len(models),
+            built=len(self.cache) - size,
+            failed=results.count(False),
+            seconds=time.perf_counter() - start,
+        )
+        logger.debug("XmlContext warmup: %s", result)
+        return result
+
+    @classmethod
+    def import_modules(
+        cls, package_or_module: Union[str, ModuleType]
+    ) -> Iterator[ModuleType]:
+        """Import and yield the given module and all of its submodules if it's
+        a package."""
+        if isinstance(package_or_module, str):
+            module = importlib.import_module(package_or_module)
+        else:
+            module = package_or_module
+
+        yield module
+
+        path = getattr(module, "__path__", None)
+        if path:
+            prefix = f"{module.__name__}."
+            for info in pkgutil.walk_packages(path, prefix):
+                yield importlib.import_module(info.name)
 
     def local_names_match(self, names: Set[str], clazz: Type) -> bool:
         try:
@@ -0,0 +1,319 @@
+import logging
+import threading
+from time import perf_counter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+)
+
+from xsdata.exceptions import ConverterError
+from xsdata.formats.bindings import AbstractParser
+from xsdata.formats.converter import Converter, ConverterFactory
+from xsdata.formats.dataclass.models.elements import XmlVar
+from xsdata.formats.dataclass.parsers.bases import NodeParser
+from xsdata.formats.dataclass.parsers.nodes import ElementNode
+from xsdata.formats.dataclass.serializers.xml import XmlSerializer
+from xsdata.logger import logger
+from xsdata.utils.patches import MethodPatcher
+
+
+class Operation:
+    """Instrumented operation names."""
+
+    START = "NodeParser.start"
+    END = "NodeParser.end"
+    BIND = "ElementNode.bind"
+    DESERIALIZE = "ConverterFactory.deserialize"
+    CONVERTER_HIT = "converter.hit"
+    CONVERTER_MISS = "converter.miss"
+    WRITE_VALUE = "XmlSerializer.write_value"
+    BYTES = "bytes"
+
+
+class Record(NamedTuple):
+    """
+    Instrumentation record.
+
+    :param operation: The instrumented operation
+    :param name: The element qname, class, field or type name
+    :param counter: The number of calls or the number of bytes
+    :param seconds: The total wall time, nested calls are inclusive
+    """
+
+    operation: str
+    name: str
+    counter: int
+    seconds: float
+
+
+class Instrumentation:
+    """
+    Collect counters and timers for the binding hot paths.
+
+    The hooks are installed by patching the instrumented methods when
+    the instance is enabled and removed when it's disabled, which means
+    there is no overhead at all when instrumentation is not in use. The
+    patches are process wide, only one instance can be enabled at a
+    time, use it as a context manager to limit its scope. The counters
+    are updated under a lock, the hooks are shared by all threads.
+
+    Example::
+
+        with Instrumentation(callback=print) as stats:
+            parser.from_bytes(source, Books)
+
+        stats.log()
+
+    :param callback: Optional callable to receive the collected records
+        when the instance is disabled
+    """
+
+    __slots__ = ("callback", "counters", "timers", "patcher", "lock")
+
+    def __init__(self, callback: Optional[Callable[[List[Record]], Any]] = None):
+        self.callback = callback
+        self.counters: Dict[Tuple[str, str], int] = {}
+        self.timers: Dict[Tuple[str, str], float] = {}
+        self.patcher = MethodPatcher()
+        self.lock = threading.Lock()
+
+    def __enter__(self) -> "Instrumentation":
+        self.enable()
+        return self
+
+    def __exit__(self, *args: Any):
+        self.disable()
+
+    @property
+    def enabled(self) -> bool:
+        return self.patcher.active
+
+    def enable(self):
+        """
+        Install the instrumentation hooks.
+
+        :raises ValueError: If another instance is already enabled
+        """
+        if self.enabled:
+            return
+
+        self.patcher.apply(
+            [
+                (NodeParser, "start", self.wrap_start),
+                (NodeParser, "end", self.wrap_end),
+                (ElementNode, "bind", self.wrap_bind),
+                (ConverterFactory, "deserialize", self.wrap_deserialize),
+                (ConverterFactory, "type_converter", self.wrap_type_converter),
+                (XmlSerializer, "write_value", self.wrap_write_value),
+                (AbstractParser, "from_bytes", self.wrap_from_bytes),
+                (AbstractParser, "from_path", self.wrap_from_path),
+            ]
+        )
+
+    def disable(self):
+        """Remove the instrumentation hooks and export the collected records
+        to the callback, if any."""
+        if not self.enabled:
+            return
+
+        self.patcher.restore()
+        if self.callback:
+            self.callback(self.records())
+
+    def reset(self):
+        """Clear all the collected counters and timers."""
+        with self.lock:
+            self.counters.clear()
+            self.timers.clear()
+
+    def add(self, operation: str, name: str, count: int = 1, seconds: float = 0.0):
+        """Increase the counter and the timer of the operation/name pair."""
+        key = (operation, name)
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + count
+            self.timers[key] = self.timers.get(key, 0.0) + seconds
+
+    def records(self) -> List[Record]:
+        """Return the collected records sorted by the total time."""
+        with self.lock:
+            result = [
+                Record(operation, name, counter, self.timers[(operation, name)])
+                for (operation, name), counter in self.counters.items()
+            ]
+        result.sort(key=lambda x: (-x.seconds, x.operation, x.name))
+        return result
+
+    def log(self, level: int = logging.INFO, limit: Optional[int] = None):
+        """
+        Log a summary of the collected records.
+
+        :param level: The logging level
+        :param limit: Limit the number of records
+        """
+        for record in self.records()[:limit]:
+            logger.log(
+                level,
+                "%s %s: counter=%d, seconds=%.6f",
+                record.operation,
+                record.name,
+                record.counter,
+                record.seconds,
+            )
+
+    def wrap_start(self, original: Callable) -> Callable:
+        def start(
+            parser: NodeParser,
+            clazz: Optional[Type],
+            queue: List,
+            objects: List,
+            qname: str,
+            attrs: Dict,
+            ns_map: Dict,
+        ):
+            begin = perf_counter()
+            try:
+                return original(parser, clazz, queue, objects, qname, attrs, ns_map)
+            finally:
+                self.add(Operation.START, qname, seconds=perf_counter() - begin)
+
+        return start
+
+    def wrap_end(self, original: Callable) -> Callable:
+        def end(
+            parser: NodeParser,
+            queue: List,
+            objects: List,
+            qname: str,
+            text: Optional[str],
+            tail: Optional[str],
+        ) -> Any:
+            begin = perf_counter()
+            try:
+                return original(parser, queue, objects, qname, text, tail)
+            finally:
+                self.add(Operation.END, qname, seconds=perf_counter() - begin)
+
+        return end
+
+    def wrap_bind(self, original: Callable) -> Callable:
+        def bind(
+            node: ElementNode,
+            qname: str,
+            text: Optional[str],
+            tail: Optional[str],
+            objects: List,
+        ) -> bool:
+            begin = perf_counter()
+            try:
+                return original(node, qname, text, tail, objects)
+            finally:
+                name = node.meta.clazz.__qualname__
+                self.add(Operation.BIND, name, seconds=perf_counter() - begin)
+
+        return bind
+
+    def wrap_deserialize(self, original: Callable) -> Callable:
+        def deserialize(
+            factory: ConverterFactory, value: Any, types: Any, **kwargs: Any
+        ) -> Any:
+            begin = perf_counter()
+            try:
+                return original(factory, value, types, **kwargs)
+            finally:
+                name = "|".join(type_name(tp) for tp in types)
+                self.add(Operation.DESERIALIZE, name, seconds=perf_counter() - begin)
+
+        return deserialize
+
+    def wrap_type_converter(self, original: Callable) -> Callable:
+        def type_converter(factory: ConverterFactory, datatype: Type) -> Converter:
+            return CountingConverter(original(factory, datatype), datatype, self)
+
+        return type_converter
+
+    def wrap_write_value(self, original: Callable) -> Callable:
+        def write_value(
+            serializer: XmlSerializer, value: Any, var: XmlVar, namespace: Any
+        ) -> Generator:
+            elapsed = 0.0
+            begin = perf_counter()
+            try:
+                for event in original(serializer, value, var, namespace):
+                    elapsed += perf_counter() - begin
+                    yield event
+                    begin = perf_counter()
+
+                elapsed += perf_counter() - begin
+            finally:
+                self.add(Operation.WRITE_VALUE, var.qname, seconds=elapsed)
+
+        return write_value
+
+    def wrap_from_bytes(self, original: Callable) -> Callable:
+        def from_bytes(
+            parser: AbstractParser, source: bytes, clazz: Optional[Type] = None
+        ) -> Any:
+            self.add(Operation.BYTES, type(parser).__name__, count=len(source))
+            return original(parser, source, clazz)
+
+        return from_bytes
+
+    def wrap_from_path(self, original: Callable) -> Callable:
+        def from_path(
+            parser: AbstractParser, path: Any, clazz: Optional[Type] = None
+        ) -> Any:
+            size = path.stat().st_size
+            self.add(Operation.BYTES, type(parser).__name__, count=size)
+            return original(parser, path, clazz)
+
+        return from_path
+
+
+def type_name(tp: Any) -> str:
+    """Return the name of the given type or its repr for typing aliases."""
+    return getattr(tp, "__name__", repr(tp))
+
+
+class CountingConverter(Converter):
+    """
+    Converter proxy that counts the successful and the failed conversions
+    of the given data type.
+
+    :param converter: The actual converter
+    :param data_type: The target data type
+    :param instrumentation: The instrumentation to receive the counters
+    """
+
+    __slots__ = ("converter", "data_type", "instrumentation")
+
+    def __init__(
+        self, converter: Converter, data_type: Type, instrumentation: Instrumentation
+    ):
+        self.converter = converter
+        self.data_type = data_type
+        self.instrumentation = instrumentation
+
+    def deserialize(self, value: Any, **kwargs: Any) -> Any:
+        name = type_name(self.data_type)
+        try:
+            result = self.converter.deserialize(value, **kwargs)
+        except ConverterError:
+            self.instrumentation.add(Operation.CONVERTER_MISS, name)
+            raise
+
+        self.instrumentation.add(Operation.CONVERTER_HIT, name)
+        return result
+
+    def serialize(self, value: Any, **kwargs: Any) -> str:
+        return self.converter.serialize(value, **kwargs)
+
+    def serialize_tokens(self, values: Iterable, **kwargs: Any) -> str:
+        return self.converter.serialize_tokens(values, **kwargs)
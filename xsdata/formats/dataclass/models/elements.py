@@ -5,6 +5,7 @@ from typing import (
     Any,
     Callable,
     Dict,
+    FrozenSet,
     Iterator,
     List,
     Mapping,
@@ -109,7 +110,9 @@ class XmlVar(MetaMixin):
         "is_wildcard",
         "is_attribute",
         "is_attributes",
-        "namespace_matches",
+        "namespace_uris",
+        "namespace_excludes",
+        "wildcards_matcher",
         "is_clazz_union",
         "local_name",
     )
@@ -165,7 +168,7 @@ class XmlVar(MetaMixin):
         self.factory = factory
         self.tokens_factory = tokens_factory
 
-        self.namespace_matches: Optional[Dict[str, bool]] = None
+        self.wildcards_matcher = build_matcher(wildcards)
 
         self.is_clazz_union = self.clazz and len(types) > 1
         self.local_name = local_name(qname)
@@ -190,6 +193,13 @@ class XmlVar(MetaMixin):
         else:
             self.is_text = True
 
+        if self.is_wildcard or self.is_attributes:
+            self.namespace_uris, self.namespace_excludes = compile_namespaces(
+                namespaces
+            )
+        else:
+            self.namespace_uris, self.namespace_excludes = EMPTY_URIS, None
+
     @property
     def element_types(self) -> Set[Type]:
         return {tp for element in self.elements.values() for tp in element.types}
@@ -197,7 +207,7 @@ class XmlVar(MetaMixin):
     def find_choice(self, qname: str) -> Optional["XmlVar"]:
         """Match and return a choice field by its qualified name."""
         match = self.elements.get(qname)
-        return match or find_by_namespace(self.wildcards, qname)
+        return match or self.wildcards_matcher.find(qname)
 
     def find_value_choice(self, value: Any, is_class: bool) -> Optional["XmlVar"]:
         """
@@ -265,31 +275,95 @@ class XmlVar(MetaMixin):
 
     def match_namespace(self, qname: str) -> bool:
         """Match the given qname to the wildcard allowed namespaces."""
-        if self.namespace_matches is None:
-            self.namespace_matches = {}
+        return self.match_uri(target_uri(qname))
+
+    def match_uri(self, uri: Optional[str]) -> bool:
+        """Match the given namespace uri to the wildcard allowed namespaces."""
+        if uri in self.namespace_uris:
+            return True
+
+        excludes = self.namespace_excludes
+        return excludes is not None and uri not in excludes
+
+
+def compile_namespaces(
+    namespaces: Sequence[str],
+) -> Tuple[FrozenSet[Optional[str]], Optional[FrozenSet[Optional[str]]]]:
+    """
+    Compile the wildcard namespace constraints to a pair of sets.
+
+    A namespace uri matches the constraints if it's included in the first
+    set or if the second set is not None and the uri is not included in it.
+
+    :param namespaces: The wildcard namespace constraints
+    :return: The included uris and the excluded uris, if any
+    """
+    uris: Set[Optional[str]] = set()
+    negations: Set[str] = set()
+
+    if not namespaces:
+        uris.add(None)
+
+    for check in namespaces:
+        if check == NamespaceType.ANY_NS:
+            negations.add("")
+        elif check and check[0] == "!":
+            negations.add(check[1:])
+        else:
+            uris.add(check or None)
+
+    if not negations:
+        return frozenset(uris), None
+
+    if len(negations) > 1 or "" in negations or negations.issubset(uris):
+        return frozenset(), frozenset()
+
+    return frozenset(uris), frozenset(negations)
+
 
-        matches = self.namespace_matches.get(qname)
-        if matches is None:
-            matches = self._match_namespace(qname)
-            self.namespace_matches[qname] = matches
+class NamespaceMatcher(MetaMixin):
+    """
+    Precompiled namespace matcher of a list of wildcard vars.
+
+    Every namespace uri mentioned in the constraints is mapped to the
+    first var that matches it, all the other namespace uris resolve to
+    the first var that accepts foreign namespaces.
+
+    :param uris: Mapping of the known namespace uris to the winning var
+    :param default: The winning var of all the other namespace uris
+    """
+
+    __slots__ = ("uris", "default")
 
-        return matches
+    def __init__(self, xml_vars: Sequence[XmlVar]):
+        known: Set[Optional[str]] = {None}
+        for var in xml_vars:
+            known.update(var.namespace_uris)
+            if var.namespace_excludes:
+                known.update(var.namespace_excludes)
 
-    def _match_namespace(self, qname: str) -> bool:
+        self.uris: Dict[Optional[str], Optional[XmlVar]] = {
+            uri: collections.first(var for var in xml_vars if var.match_uri(uri))
+            for uri in known
+        }
+        self.default: Optional[XmlVar] = collections.first(
+            var for var in xml_vars if var.namespace_excludes is not None
+        )
+
+    def find(self, qname: str) -> Optional[XmlVar]:
+        """Return the first var that matches the namespace of the qname."""
         uri = target_uri(qname)
-        if not self.namespaces and uri is None:
-            return True
+        return self.uris.get(uri, self.default)
+
 
-        for check in self.namespaces:
-            if (
-                (not check and uri is None)
-                or check == uri
-                or check == NamespaceType.ANY_NS
-                or (check and check[0] == "!" and check[1:] != uri)
-            ):
-                return True
+EMPTY_URIS: FrozenSet[Optional[str]] = frozenset()
+EMPTY_MATCHER = NamespaceMatcher(())
 
-        return False
+
+def build_matcher(xml_vars: Sequence[XmlVar]) -> NamespaceMatcher:
+    """Create the namespace matcher of the given wildcard vars, all the vars
+    and metas without wildcards share the same empty matcher."""
+    return NamespaceMatcher(xml_vars) if xml_vars else EMPTY_MATCHER
 
 
 get_index = operator.attrgetter("index")
@@ -328,6 +402,9 @@ class XmlMeta(MetaMixin):
         # Calculated
         "namespace",
         "mixed_content",
+        "wildcards_matcher",
+        "any_attributes_matcher",
+        "child_vars",
     )
 
     def __init__(
@@ -358,6 +435,9 @@ class XmlMeta(MetaMixin):
         self.any_attributes = any_attributes
         self.mixed_content = any(wildcard.mixed for wildcard in self.wildcards)
         self.wrappers = wrappers
+        self.wildcards_matcher = build_matcher(wildcards)
+        self.any_attributes_matcher = build_matcher(any_attributes)
+        self.child_vars = self.build_child_vars()
 
     @property
     def element_types(self) -> Set[Type]:
@@ -400,12 +480,12 @@ class XmlMeta(MetaMixin):
         return self.attributes.get(qname)
 
     def find_any_attributes(self, qname: str) -> Optional[XmlVar]:
-        return find_by_namespace(self.any_attributes, qname)
+        return self.any_attributes_matcher.find(qname)
 
     def find_wildcard(self, qname: str) -> Optional[XmlVar]:
         """Match the given qualified name to a wildcard and optionally to one
         of its choice elements."""
-        wildcard = find_by_namespace(self.wildcards, qname)
+        wildcard = self.wildcards_matcher.find(qname)
 
         if wildcard and wildcard.elements:
             choice = wildcard.find_choice(qname)
@@ -421,23 +501,46 @@ class XmlMeta(MetaMixin):
         return None
 
     def find_children(self, qname: str) -> Iterator[XmlVar]:
-        elements = self.elements.get(qname)
-        if elements:
-            yield from elements
+        yield from self.find_child_vars(qname)
+
+    def find_child_vars(self, qname: str) -> Tuple[XmlVar, ...]:
+        """
+        Return all the candidate vars for the given child qualified name.
+
+        The candidates of all the known element names are resolved in
+        advance, the rest are matched against the choice and the element
+        wildcards.
+        """
+        result = self.child_vars.get(qname)
+        if result is None:
+            result = self.match_child_vars(qname)
 
+        return result
+
+    def match_child_vars(self, qname: str) -> Tuple[XmlVar, ...]:
+        """
+        Match the given qualified name to the element, choice and wildcard
+        vars.
+
+        The order of the candidates is: elements, compound choices and
+        finally the wildcard or one of its choice elements.
+        """
+        result = list(self.elements.get(qname, ()))
         for choice in self.choices:
             match = choice.find_choice(qname)
             if match:
-                yield match
+                result.append(match)
 
-        chd = self.find_wildcard(qname)
-        if chd:
-            yield chd
+        wildcard = self.find_wildcard(qname)
+        if wildcard:
+            result.append(wildcard)
 
+        return tuple(result)
 
-def find_by_namespace(xml_vars: Sequence[XmlVar], qname: str) -> Optional[XmlVar]:
-    for xml_var in xml_vars:
-        if xml_var.match_namespace(qname):
-            return xml_var
+    def build_child_vars(self) -> Dict[str, Tuple[XmlVar, ...]]:
+        """Build the candidate vars of all the known element names."""
+        qnames = set(self.elements)
+        for var in itertools.chain(self.choices, self.wildcards):
+            qnames.update(var.elements)
 
-    return None
+        return {qname: self.match_child_vars(qname) for qname in qnames}
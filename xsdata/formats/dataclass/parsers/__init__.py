@@ -1,5 +1,6 @@
+from xsdata.formats.dataclass.parsers.columnar import ColumnarParser
 from xsdata.formats.dataclass.parsers.json import JsonParser
 from xsdata.formats.dataclass.parsers.tree import TreeParser
 from xsdata.formats.dataclass.parsers.xml import UserXmlParser, XmlParser
 
-__all__ = ["JsonParser", "XmlParser", "UserXmlParser", "TreeParser"]
+__all__ = ["JsonParser", "XmlParser", "UserXmlParser", "TreeParser", "ColumnarParser"]
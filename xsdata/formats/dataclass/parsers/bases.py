@@ -1,7 +1,7 @@
 import copy
 import warnings
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple, Type, cast
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, cast
 
 from xsdata.exceptions import ConverterWarning, ParserError
 from xsdata.formats.bindings import T
@@ -15,6 +15,7 @@ from xsdata.formats.dataclass.parsers.mixins import (
 )
 from xsdata.formats.dataclass.parsers.utils import ParserUtils
 from xsdata.models.enums import EventType
+from xsdata.utils import streams
 
 Parsed = Tuple[Optional[str], Any]
 
@@ -28,27 +29,87 @@ class NodeParser(PushParser):
     :param context: Model context provider
     :param handler: Override default XmlHandler
     :ivar ms_map: Namespace registry of parsed prefix-URI mappings
+    :ivar feed_handler: The active XmlHandler of the incremental parsing
     """
 
     config: ParserConfig = field(default_factory=ParserConfig)
     context: XmlContext = field(default_factory=XmlContext)
     handler: Type[XmlHandler] = field(default=EventsHandler)
     ns_map: Dict = field(init=False, default_factory=dict)
+    feed_handler: Optional[XmlHandler] = field(
+        init=False, default=None, repr=False, compare=False
+    )
 
     def parse(self, source: Any, clazz: Optional[Type[T]] = None) -> T:
         """Parse the input stream or filename and return the resulting object
         tree."""
         handler = self.handler(clazz=clazz, parser=self)
+        result = self.invoke(handler.parse, source)
+        return self.verify(result, clazz)
 
+    async def parse_async(self, source: Any, clazz: Optional[Type[T]] = None) -> T:
+        """
+        Parse incrementally the asyncio stream reader or async iterable of
+        bytes and return the resulting object tree.
+
+        The chunks are bound as they arrive and the control is yielded
+        to the event loop after every chunk.
+
+        :param source: The stream reader or the async iterable of bytes
+        :param clazz: The target class
+        """
+        handler = self.handler(clazz=clazz, parser=self)
+        async for chunk in streams.iter_chunks(source):
+            self.invoke(handler.feed, chunk)
+
+        result = self.invoke(handler.finish)
+        return self.verify(result, clazz)
+
+    def feed(self, data: bytes, clazz: Optional[Type] = None):
+        """
+        Feed the next chunk of an XML document to the incremental parser.
+
+        The received elements are bound as soon as they are complete,
+        call :meth:`close` after the last chunk to get the resulting
+        object tree. The xinclude processing is not supported.
+
+        :param data: The next chunk of the XML document
+        :param clazz: The target class, only considered with the first
+            chunk
+        """
+        if self.feed_handler is None:
+            self.feed_handler = self.handler(clazz=clazz, parser=self)
+
+        try:
+            self.invoke(self.feed_handler.feed, data)
+        except ParserError:
+            self.feed_handler = None
+            raise
+
+    def close(self) -> Any:
+        """Close the incremental parser and return the resulting object
+        tree."""
+        handler, self.feed_handler = self.feed_handler, None
+        if handler is None:
+            raise ParserError("The incremental parser has not been fed")
+
+        result = self.invoke(handler.finish)
+        return self.verify(result, handler.clazz)
+
+    def invoke(self, func: Callable, *args: Any) -> Any:
+        """Call the handler function and convert the syntax and the converter
+        warnings to parser errors."""
         with warnings.catch_warnings():
             if self.config.fail_on_converter_warnings:
                 warnings.filterwarnings("error", category=ConverterWarning)
 
             try:
-                result = handler.parse(source)
+                return func(*args)
             except (ConverterWarning, SyntaxError) as e:
                 raise ParserError(e)
 
+    @classmethod
+    def verify(cls, result: Any, clazz: Optional[Type]) -> Any:
         if result is not None:
             return result
 
@@ -107,6 +168,13 @@ class NodeParser(PushParser):
                 derived_factory = self.context.class_type.derived_element
 
             xsi_nil = ParserUtils.xsi_nil(attrs)
+            if self.config.fields:
+                ParserUtils.verify_paths(self.context, meta.clazz, self.config.fields)
+
+            if self.config.predicates:
+                ParserUtils.verify_paths(
+                    self.context, meta.clazz, self.config.predicates
+                )
 
             child = ElementNode(
                 position=0,
@@ -118,7 +186,13 @@ class NodeParser(PushParser):
                 derived_factory=derived_factory,
                 xsi_type=xsi_type if derived_factory else None,
                 xsi_nil=xsi_nil,
+                projection=ParserUtils.projection(
+                    self.config.fields, self.config.predicates
+                ),
+                predicates=ParserUtils.predicates(self.config.predicates),
             )
+            if child.predicates and not child.accepts_attrs():
+                child.rejected = True
 
         queue.append(child)
 
@@ -136,6 +210,10 @@ class NodeParser(PushParser):
         Pop the last XmlNode from the queue and use it to build and
         return the resulting object tree with its text and tail content.
 
+        With field predicates, the parent element is rejected as soon
+        as one of its bound child values doesn't match and the child
+        object is discarded.
+
         :param queue: Xml nodes queue
         :param objects: List of parsed objects
         :param qname: Qualified name
@@ -143,7 +221,23 @@ class NodeParser(PushParser):
         :param tail: Tail content
         """
         item = queue.pop()
-        return item.bind(qname, text, tail, objects)
+        if not item.bind(qname, text, tail, objects):
+            return False
+
+        if self.config.predicates and queue:
+            from xsdata.formats.dataclass.parsers.nodes import ElementNode
+
+            parent = queue[-1]
+            if (
+                isinstance(parent, ElementNode)
+                and parent.predicates
+                and objects[-1][0] == qname
+                and not parent.accepts(qname, objects[-1][1])
+            ):
+                parent.reject(objects)
+                return False
+
+        return True
 
 
 @dataclass
@@ -0,0 +1,200 @@
+from array import array
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Type
+
+from xsdata.exceptions import ParserError
+from xsdata.formats.dataclass.models.elements import XmlVar
+from xsdata.formats.dataclass.parsers.bases import NodeParser, Parsed
+from xsdata.formats.dataclass.parsers.handlers import default_handler
+from xsdata.formats.dataclass.parsers.mixins import XmlHandler, XmlNode
+from xsdata.formats.dataclass.parsers.nodes import ElementNode
+from xsdata.formats.dataclass.parsers.utils import ParserUtils
+
+TYPECODES = {bool: "b", int: "q", float: "d"}
+
+
+class Column:
+    """
+    Column buffer of a record leaf field.
+
+    The numeric fields are stored in typed arrays, the rest in lists.
+    The mask holds one byte per record, 1 for a value and 0 for a
+    missing value, the missing values are stored as zero or None.
+
+    A typed column falls back to a list when a value doesn't fit in
+    the array, e.g. integers out of range or unconverted strings.
+
+    :param path: The dotted field path
+    :param typecode: The array typecode, None for a list of values
+    """
+
+    __slots__ = ("path", "typecode", "values", "mask")
+
+    def __init__(self, path: str, typecode: Optional[str] = None):
+        self.path = path
+        self.typecode = typecode
+        self.values: Any = array(typecode) if typecode else []
+        self.mask = array("b")
+
+    def __len__(self) -> int:
+        return len(self.mask)
+
+    def append(self, value: Any):
+        """Append a record value, None is recorded as a missing value."""
+        if value is None:
+            self.values.append(0 if self.typecode else None)
+            self.mask.append(0)
+        else:
+            try:
+                self.values.append(value)
+            except (OverflowError, TypeError):
+                self.to_list()
+                self.values.append(value)
+
+            self.mask.append(1)
+
+    def to_list(self):
+        """Convert the typed array to a list of values."""
+        self.values = [x if m else None for x, m in zip(self.values, self.mask)]
+        self.typecode = None
+
+    def to_numpy(self) -> Any:
+        """
+        Return the column as a numpy masked array.
+
+        :raises ParserError: If numpy is not installed
+        """
+        try:
+            import numpy
+        except ImportError:
+            raise ParserError("Column.to_numpy requires numpy to run.")
+
+        dtype = None if self.typecode else object
+        values = numpy.asarray(self.values, dtype=dtype)
+        mask = numpy.frombuffer(self.mask, dtype=numpy.int8) == 0
+        return numpy.ma.masked_array(values, mask=mask)
+
+
+@dataclass
+class ColumnarParser(NodeParser):
+    """
+    Bind repeated records directly to column buffers.
+
+    The records are bound to their selected leaf field values without
+    creating the record models and they are not included in the
+    resulting object tree.
+
+    :param config: Parser configuration
+    :param context: Model context provider
+    :param handler: Override default XmlHandler
+    :ivar record: The record class of the active parsing
+    :ivar columns: The column buffers of the active parsing
+    :ivar projection: The record fields projection of the active parsing
+    """
+
+    handler: Type[XmlHandler] = field(default=default_handler())
+    record: Optional[Type] = field(init=False, default=None, repr=False)
+    columns: List[Column] = field(init=False, default_factory=list, repr=False)
+    projection: Optional[Dict] = field(init=False, default=None, repr=False)
+
+    def parse_columns(
+        self,
+        source: Any,
+        record: Type,
+        paths: Sequence[str],
+        clazz: Optional[Type] = None,
+    ) -> Dict[str, Column]:
+        """
+        Parse the input stream or filename and return the record columns.
+
+        :param source: The input stream or filename
+        :param record: The record class
+        :param paths: The dotted leaf field paths of the record
+        :param clazz: The root class type
+        :raises ParserError: If a field path is not a record leaf field
+        """
+        self.columns = [self.build_column(record, path) for path in paths]
+        self.projection = ParserUtils.projection(paths)
+        self.record = record
+        try:
+            handler = self.handler(clazz=clazz, parser=self)
+            self.invoke(handler.parse, source)
+            return {column.path: column for column in self.columns}
+        finally:
+            self.record = None
+            self.projection = None
+            self.columns = []
+
+    def build_column(self, record: Type, path: str) -> Column:
+        """Resolve the field path from the record metadata and create the
+        column buffer with the matching typecode."""
+        clazz: Optional[Type] = record
+        var: Optional[XmlVar] = None
+        for name in path.split("."):
+            if clazz is None:
+                raise ParserError(f"Field `{path}` is not a leaf field")
+
+            meta = self.context.build(clazz)
+            var = next((x for x in meta.get_all_vars() if x.name == name), None)
+            if var is None:
+                raise ParserError(f"Unknown field `{path}` of `{record.__name__}`")
+
+            clazz = var.clazz if not var.list_element else None
+
+        assert var is not None
+        if var.clazz:
+            raise ParserError(f"Field `{path}` is not a leaf field")
+
+        typecode = None
+        if len(var.types) == 1 and not var.list_element and not var.tokens:
+            typecode = TYPECODES.get(var.types[0])
+
+        return Column(path, typecode)
+
+    def start(
+        self,
+        clazz: Optional[Type],
+        queue: List[XmlNode],
+        objects: List[Parsed],
+        qname: str,
+        attrs: Dict,
+        ns_map: Dict,
+    ):
+        """Queue the next xml node and apply the projection on the record
+        nodes."""
+        super().start(clazz, queue, objects, qname, attrs, ns_map)
+
+        item = queue[-1]
+        if isinstance(item, ElementNode) and item.meta.clazz is self.record:
+            item.projection = self.projection
+
+    def end(
+        self,
+        queue: List[XmlNode],
+        objects: List[Parsed],
+        qname: str,
+        text: Optional[str],
+        tail: Optional[str],
+    ) -> bool:
+        """Append the record values to the columns or bind the xml node to
+        an object."""
+        item = queue[-1]
+        if not isinstance(item, ElementNode) or item.meta.clazz is not self.record:
+            return super().end(queue, objects, qname, text, tail)
+
+        queue.pop()
+        params: Dict = {}
+        item.bind_attrs(params)
+        item.bind_content(params, text, tail, objects)
+
+        for column in self.columns:
+            value: Any = params
+            for name in column.path.split("."):
+                if isinstance(value, dict):
+                    value = value.get(name)
+                else:
+                    value = getattr(value, name, None)
+
+            column.append(value)
+
+        return False
@@ -1,4 +1,6 @@
-from typing import Callable, Dict, Optional, Type
+from collections import namedtuple
+from dataclasses import MISSING, fields
+from typing import Any, Callable, Dict, Optional, Sequence, Type
 
 from xsdata.formats.bindings import T
 
@@ -7,6 +9,44 @@ def default_class_factory(cls: Type[T], params: Dict) -> T:
     return cls(**params)  # type: ignore
 
 
+def dict_class_factory(cls: Type, params: Dict) -> Dict:
+    """
+    Return the bound field values instead of the model instance.
+
+    The missing fields are omitted, the model init, the default
+    factories and the post init hooks are skipped.
+    """
+    return params
+
+
+def namedtuple_class_factory(cls: Type, params: Dict) -> tuple:
+    """
+    Return a named tuple with the model init fields instead of the model
+    instance.
+
+    The missing fields get their plain default values or None, the
+    default factories and the post init hooks are skipped.
+    """
+    return namedtuple_type(cls)(**params)
+
+
+namedtuple_types: Dict[Type, Type] = {}
+
+
+def namedtuple_type(cls: Type) -> Type:
+    """Create and cache the named tuple type for the given model class."""
+    try:
+        return namedtuple_types[cls]
+    except KeyError:
+        init_fields = [f for f in fields(cls) if f.init]
+        result = namedtuple_types[cls] = namedtuple(
+            cls.__name__,
+            [f.name for f in init_fields],
+            defaults=[None if f.default is MISSING else f.default for f in init_fields],
+        )
+        return result
+
+
 class ParserConfig:
     """
     Parsing configuration options.
@@ -15,13 +55,23 @@ class ParserConfig:
         you need support for relative links e.g. xinclude
     :param load_dtd: Enable loading external dtd (lxml only)
     :param process_xinclude: Enable xinclude statements processing
-    :param class_factory: Override default object instantiation
+    :param class_factory: Override default object instantiation, use
+        the dict or the namedtuple class factories to skip the models
+        instantiation
     :param fail_on_unknown_properties: Skip unknown properties or fail
         with exception
     :param fail_on_unknown_attributes: Skip unknown XML attributes or
         fail with exception
     :param fail_on_converter_warnings: Turn converter warnings to
         exceptions
+    :param fields: Bind only the given dotted field paths, e.g.
+        ``book.title``, all the other fields are skipped and get their
+        default values
+    :param predicates: Skip the elements that don't match the given
+        field value predicates, the keys are dotted field paths, e.g.
+        ``book.genre``
+    :param array_tokens: Decode the int and float token lists in bulk
+        to ``array.array`` values instead of lists
     """
 
     __slots__ = (
@@ -32,6 +82,9 @@ class ParserConfig:
         "fail_on_unknown_properties",
         "fail_on_unknown_attributes",
         "fail_on_converter_warnings",
+        "fields",
+        "predicates",
+        "array_tokens",
     )
 
     def __init__(
@@ -43,6 +96,9 @@ class ParserConfig:
         fail_on_unknown_properties: bool = True,
         fail_on_unknown_attributes: bool = False,
         fail_on_converter_warnings: bool = False,
+        fields: Optional[Sequence[str]] = None,
+        predicates: Optional[Dict[str, Callable[[Any], bool]]] = None,
+        array_tokens: bool = False,
     ):
         self.base_url = base_url
         self.load_dtd = load_dtd
@@ -51,3 +107,6 @@ class ParserConfig:
         self.fail_on_unknown_properties = fail_on_unknown_properties
         self.fail_on_unknown_attributes = fail_on_unknown_attributes
         self.fail_on_converter_warnings = fail_on_converter_warnings
+        self.fields = fields
+        self.predicates = predicates
+        self.array_tokens = array_tokens
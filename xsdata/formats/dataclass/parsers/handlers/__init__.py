@@ -1,10 +1,16 @@
 from typing import Type
 
-from xsdata.formats.dataclass.parsers.handlers.native import XmlEventHandler
+from xsdata.formats.dataclass.parsers.handlers.native import (
+    ExpatHandler,
+    XmlEventHandler,
+)
 from xsdata.formats.dataclass.parsers.mixins import XmlHandler
 
 try:
-    from xsdata.formats.dataclass.parsers.handlers.lxml import LxmlEventHandler
+    from xsdata.formats.dataclass.parsers.handlers.lxml import (
+        LxmlEventHandler,
+        LxmlTargetHandler,
+    )
 
     def default_handler() -> Type[XmlHandler]:
         return LxmlEventHandler
@@ -16,7 +22,9 @@ except ImportError:  # pragma: no cover
 
 
 __all__ = [
+    "ExpatHandler",
     "LxmlEventHandler",
+    "LxmlTargetHandler",
     "XmlEventHandler",
     "default_handler",
 ]
@@ -1,9 +1,9 @@
-from typing import Any, Iterable
+from typing import Any, Dict, Iterable
 
 from lxml import etree
 
 from xsdata.exceptions import XmlHandlerError
-from xsdata.formats.dataclass.parsers.mixins import XmlHandler
+from xsdata.formats.dataclass.parsers.mixins import TargetHandler, XmlHandler
 from xsdata.models.enums import EventType
 
 EVENTS = (EventType.START, EventType.END, EventType.START_NS)
@@ -50,18 +50,52 @@ class LxmlEventHandler(XmlHandler):
 
         return self.process_context(ctx)
 
+    def feed(self, data: bytes):
+        """Feed the next chunk of an XML document to the
+        :class:`lxml.etree.XMLPullParser`."""
+        if self.feeder is None:
+            self.feeder = etree.XMLPullParser(
+                EVENTS,
+                recover=True,
+                remove_comments=True,
+                load_dtd=self.parser.config.load_dtd,
+            )
+
+        self.feeder.feed(data)
+        self.process_context(self.read_events(False))
+
+    def finish(self) -> Any:
+        """Close the pull parser and return the resulting object."""
+        if self.feeder is None:
+            return None
+
+        self.feeder.close()
+        return self.process_context(self.read_events(True))
+
     def process_context(self, context: Iterable) -> Any:
-        """Iterate context and push the events to main parser."""
+        """
+        Iterate context and push the events to main parser.
+
+        The namespace scope is tracked from the start-ns events and it's
+        only copied when an element declares new prefixes. The scope of
+        the root element is taken from the element itself, as it might
+        inherit prefixes from the ancestors of a walked element.
+        """
+        ns_map: Dict = {}
         for event, element in context:
             if event == EventType.START:
+                if not self.queue:
+                    ns_map = element.nsmap
+
                 self.parser.start(
                     self.clazz,
                     self.queue,
                     self.objects,
                     element.tag,
                     element.attrib,
-                    element.nsmap,
+                    self.merge_parent_namespaces(ns_map),
                 )
+                ns_map = {}
             elif event == EventType.END:
                 self.parser.end(
                     self.queue,
@@ -73,8 +107,48 @@ class LxmlEventHandler(XmlHandler):
                 element.clear()
             elif event == EventType.START_NS:
                 prefix, uri = element
-                self.parser.register_namespace(prefix or None, uri)
+                ns_map[prefix or None] = uri
             else:
                 raise XmlHandlerError(f"Unhandled event: `{event}`.")
 
         return self.objects[-1][1] if self.objects else None
+
+
+class LxmlTargetHandler(TargetHandler, LxmlEventHandler):
+    """
+    Event handler based on the lxml parser target interface.
+
+    The handler receives the start, end, data and start-ns callbacks
+    directly from the lxml parser, without building any elements.
+
+    Elements, trees and xinclude processing are delegated to the
+    :class:`LxmlEventHandler`.
+
+    :param parser: The parser instance to feed with events
+    :param clazz: The target binding model, auto located if omitted.
+    """
+
+    __slots__ = ()
+
+    def parse(self, source: Any) -> Any:
+        """
+        Parse an XML document from a system identifier or an InputSource.
+
+        The parser will ignore comments and recover from errors.
+        """
+        if (
+            isinstance(source, (etree._ElementTree, etree._Element))
+            or self.parser.config.process_xinclude
+        ):
+            return super().parse(source)
+
+        return etree.parse(source, parser=self.create_parser())  # nosec
+
+    def create_parser(self) -> Any:
+        """Return a new lxml parser with this instance as target."""
+        return etree.XMLParser(
+            target=self,
+            recover=True,
+            remove_comments=True,
+            load_dtd=self.parser.config.load_dtd,
+        )
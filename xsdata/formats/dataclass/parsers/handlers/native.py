@@ -1,15 +1,18 @@
 import functools
-from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, Literal, Optional, Tuple, cast
 from urllib.parse import urljoin
 from xml.etree import ElementInclude as xinclude
 from xml.etree import ElementTree as etree
 
 from xsdata.exceptions import XmlHandlerError
-from xsdata.formats.dataclass.parsers.mixins import XmlHandler
+from xsdata.formats.dataclass.parsers.mixins import TargetHandler, XmlHandler
 from xsdata.models.enums import EventType
 from xsdata.utils import namespaces
 
-EVENTS = (EventType.START, EventType.END, EventType.START_NS)
+EVENTS = cast(
+    Tuple[Literal["start", "end", "start-ns"], ...],
+    (EventType.START, EventType.END, EventType.START_NS),
+)
 
 
 class XmlEventHandler(XmlHandler):
@@ -53,6 +56,23 @@ class XmlEventHandler(XmlHandler):
 
         return self.process_context(ctx)
 
+    def feed(self, data: bytes):
+        """Feed the next chunk of an XML document to the
+        :class:`xml.etree.ElementTree.XMLPullParser`."""
+        if self.feeder is None:
+            self.feeder = etree.XMLPullParser(EVENTS)
+
+        self.feeder.feed(data)
+        self.process_context(self.read_events(False))
+
+    def finish(self) -> Any:
+        """Close the pull parser and return the resulting object."""
+        if self.feeder is None:
+            return None
+
+        self.feeder.close()
+        return self.process_context(self.read_events(True))
+
     def process_context(self, context: Iterable) -> Any:
         """Iterate context and push the events to main parser."""
         ns_map: Dict = {}
@@ -85,6 +105,42 @@ class XmlEventHandler(XmlHandler):
         return self.objects[-1][1] if self.objects else None
 
 
+class ExpatHandler(TargetHandler, XmlEventHandler):
+    """
+    Event handler based on the expat parser target interface.
+
+    The handler receives the start, end, data and start-ns callbacks
+    directly from the :class:`xml.etree.ElementTree.XMLParser`, without
+    building any elements.
+
+    Elements, trees and xinclude processing are delegated to the
+    :class:`XmlEventHandler`.
+
+    :param parser: The parser instance to feed with events
+    :param clazz: The target binding model, auto located if omitted.
+    """
+
+    __slots__ = ()
+
+    def parse(self, source: Any) -> Any:
+        """
+        Parse an XML document from a system identifier or an InputSource.
+
+        The parser will ignore comments and processing instructions.
+        """
+        if (
+            isinstance(source, (etree.ElementTree, etree.Element))
+            or self.parser.config.process_xinclude
+        ):
+            return super().parse(source)
+
+        return etree.ElementTree().parse(source, self.create_parser())  # nosec
+
+    def create_parser(self) -> Any:
+        """Return a new expat parser with this instance as target."""
+        return etree.XMLParser(target=self)
+
+
 def iterwalk(element: etree.Element, ns_map: Dict) -> Iterator[Tuple[str, Any]]:
     """
     Walk over the element tree structure and emit start-ns/start/end events.
@@ -36,6 +36,12 @@ class JsonParser(AbstractParser):
 
         data = self.load_json(source)
         tp = self.verify_type(clazz, data)
+        if self.config.fields is not None:
+            ParserUtils.verify_paths(self.context, tp, self.config.fields)
+
+        projection = ParserUtils.projection(self.config.fields)
+        if projection is not None:
+            data = self.project(data, tp, projection)
 
         with warnings.catch_warnings():
             if self.config.fail_on_converter_warnings:
@@ -83,6 +89,38 @@ class JsonParser(AbstractParser):
 
         return clazz  # type: ignore
 
+    def project(self, data: Any, clazz: Type, projection: Dict) -> Any:
+        """
+        Remove the values of the fields that are not selected by the
+        projection map.
+
+        The unknown keys and the derived or union values are left
+        intact for the binding process.
+        """
+        if isinstance(data, list):
+            return [self.project(item, clazz, projection) for item in data]
+
+        if (
+            not isinstance(data, dict)
+            or data.keys() == self.context.class_type.derived_keys
+        ):
+            return data
+
+        xml_vars = self.context.build(clazz).get_all_vars()
+        result = {}
+        for key, value in data.items():
+            var = self.find_var(xml_vars, key, collections.is_array(value))
+            if var is None:
+                result[key] = value
+            elif var.name in projection:
+                nested = projection[var.name]
+                if nested is not None and var.clazz and not var.is_clazz_union:
+                    value = self.project(value, var.clazz, nested)
+
+                result[key] = value
+
+        return result
+
     def detect_type(self, data: Union[Dict, List]) -> Type[T]:
         if not data:
             raise ParserError("Document is empty, can not detect type")
@@ -239,6 +277,7 @@ class JsonParser(AbstractParser):
             ns_map=EMPTY_MAP,
             tokens_factory=var.tokens_factory,
             format=var.format,
+            array_tokens=self.config.array_tokens,
         )
 
     def bind_complex_type(self, meta: XmlMeta, var: XmlVar, data: Dict) -> Any:
@@ -110,18 +110,46 @@ class XmlHandler:
     :param clazz: The target binding model, auto located if omitted.
     """
 
-    __slots__ = ("parser", "clazz", "queue", "objects")
+    __slots__ = ("parser", "clazz", "queue", "objects", "feeder", "held")
 
     def __init__(self, parser: PushParser, clazz: Optional[Type]):
         self.parser = parser
         self.clazz = clazz
         self.queue: List = []
         self.objects: List = []
+        self.feeder: Any = None
+        self.held: List = []
 
     def parse(self, source: Any) -> Any:
         """Parse an XML document from a system identifier or an InputSource."""
         raise NotImplementedError("This method must be implemented!")
 
+    def feed(self, data: bytes):
+        """Feed the next chunk of an XML document to the incremental
+        parser."""
+        raise NotImplementedError("This method must be implemented!")
+
+    def finish(self) -> Any:
+        """Close the incremental parser and return the resulting object."""
+        raise NotImplementedError("This method must be implemented!")
+
+    def read_events(self, final: bool) -> List:
+        """
+        Return the pending events of the incremental pull parser.
+
+        The element tail is only known after the next event, the last
+        end event is held back until more data arrive.
+
+        :param final: Whether the document is complete
+        """
+        events = self.held + list(self.feeder.read_events())
+        if not final and events and events[-1][0] == EventType.END:
+            self.held = [events.pop()]
+        else:
+            self.held = []
+
+        return events
+
     def merge_parent_namespaces(self, ns_map: Dict) -> Dict:
         """
         Merge and return the given prefix-URI map with the parent node.
@@ -180,3 +208,102 @@ class EventsHandler(XmlHandler):
                 raise XmlHandlerError(f"Unhandled event: `{event}`.")
 
         return self.objects[-1][1] if self.objects else None
+
+
+class TargetHandler(XmlHandler):
+    """
+    Abstract parser target content handler.
+
+    The start, end, data, start-ns and close callbacks are fed directly
+    by a push style xml parser. The end notifications are delayed until
+    the element tail is known and the namespace scope is only copied
+    when an element declares new prefixes.
+
+    :param parser: The parser instance to feed with events
+    :param clazz: The target binding model, auto located if omitted.
+    """
+
+    __slots__ = ("ns_map", "texts", "data_frames", "pending")
+
+    def __init__(self, parser: PushParser, clazz: Optional[Type]):
+        super().__init__(parser, clazz)
+        self.ns_map: Dict = {}
+        self.texts: List[NoneStr] = []
+        self.data_frames: List[str] = []
+        self.pending: Optional[Tuple[str, NoneStr]] = None
+
+    def create_parser(self) -> Any:
+        """Return a new xml parser with this instance as target."""
+        raise NotImplementedError("This method must be implemented!")
+
+    def feed(self, data: bytes):
+        """Feed the next chunk of an XML document to the target parser."""
+        if self.feeder is None:
+            self.feeder = self.create_parser()
+
+        self.feeder.feed(data)
+
+    def finish(self) -> Any:
+        """Close the target parser and return the resulting object."""
+        if self.feeder is None:
+            return None
+
+        return self.feeder.close()
+
+    def start(self, tag: str, attrib: Dict):
+        """Start element callback, flush the parent text or the tail of the
+        previous sibling and feed the main parser."""
+        text = self.flush_data() if self.data_frames else None
+        if self.pending:
+            self.flush_pending(text)
+        elif self.texts and self.texts[-1] is None:
+            self.texts[-1] = text
+
+        if self.ns_map:
+            ns_map = self.merge_parent_namespaces(self.ns_map)
+            self.ns_map = {}
+        else:
+            ns_map = self.queue[-1].ns_map if self.queue else {}
+
+        self.texts.append(None)
+        self.parser.start(self.clazz, self.queue, self.objects, tag, attrib, ns_map)
+
+    def end(self, tag: str):
+        """End element callback, delay the main parser notification until the
+        tail of the element is known."""
+        data = self.flush_data() if self.data_frames else None
+        text = self.texts.pop()
+        if self.pending:
+            self.flush_pending(data)
+        elif text is None:
+            text = data
+
+        self.pending = (tag, text)
+
+    def data(self, data: str):
+        """Character data callback."""
+        self.data_frames.append(data)
+
+    def start_ns(self, prefix: NoneStr, uri: str):
+        """Start namespace declaration callback."""
+        self.ns_map[prefix or None] = uri
+
+    def close(self) -> Any:
+        """Parsing finished callback, flush the root element and return the
+        resulting object."""
+        if self.pending:
+            self.flush_pending(self.flush_data() if self.data_frames else None)
+
+        return self.objects[-1][1] if self.objects else None
+
+    def flush_data(self) -> NoneStr:
+        data = "".join(self.data_frames)
+        self.data_frames.clear()
+        return data
+
+    def flush_pending(self, tail: NoneStr):
+        assert self.pending is not None
+
+        qname, text = self.pending
+        self.pending = None
+        self.parser.end(self.queue, self.objects, qname, text, tail)
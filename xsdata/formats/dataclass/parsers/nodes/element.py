@@ -27,6 +27,10 @@ class ElementNode(XmlNode):
     :param derived_factory: Derived element factory
     :param xsi_type: The xml type substitution
     :param xsi_nil: The xml type substitution
+    :param projection: The selected fields map, bind all the fields if
+        it's None
+    :param predicates: The field value predicates map, the nested maps
+        hold the predicates of the child models
     """
 
     __slots__ = (
@@ -40,8 +44,11 @@ class ElementNode(XmlNode):
         "derived_factory",
         "xsi_type",
         "xsi_nil",
+        "projection",
+        "predicates",
         "assigned",
         "tail_processed",
+        "rejected",
     )
 
     def __init__(
@@ -56,6 +63,8 @@ class ElementNode(XmlNode):
         derived_factory: Optional[Type] = None,
         xsi_type: Optional[str] = None,
         xsi_nil: Optional[bool] = None,
+        projection: Optional[Dict] = None,
+        predicates: Optional[Dict] = None,
     ):
         self.meta = meta
         self.attrs = attrs
@@ -67,17 +76,27 @@ class ElementNode(XmlNode):
         self.derived_factory = derived_factory
         self.xsi_type = xsi_type
         self.xsi_nil = xsi_nil
+        self.projection = projection
+        self.predicates = predicates
         self.assigned: Set[int] = set()
         self.tail_processed: bool = False
+        self.rejected: bool = False
 
     def bind(
         self, qname: str, text: Optional[str], tail: Optional[str], objects: List
     ) -> bool:
+        if self.rejected:
+            del objects[self.position :]
+            return False
+
         obj: Any = None
         if not self.xsi_nil or self.meta.nillable:
             params: Dict = {}
             self.bind_attrs(params)
             self.bind_content(params, text, tail, objects)
+            if self.predicates and not self.accepts_params(params):
+                return False
+
             obj = self.config.class_factory(self.meta.clazz, params)
 
         if self.derived_factory:
@@ -96,6 +115,9 @@ class ElementNode(XmlNode):
         self, params: Dict, text: Optional[str], tail: Optional[str], objects: List[Any]
     ):
         wild_var = self.meta.find_any_wildcard()
+        if wild_var and not self.is_selected(wild_var):
+            wild_var = None
+
         if wild_var and wild_var.mixed:
             self.bind_mixed_objects(params, wild_var, objects)
             bind_text = False
@@ -122,11 +144,13 @@ class ElementNode(XmlNode):
         for qname, value in self.attrs.items():
             var = self.meta.find_attribute(qname)
             if var and var.name not in params:
-                self.bind_attr(params, var, value)
+                if self.is_selected(var):
+                    self.bind_attr(params, var, value)
             else:
                 var = self.meta.find_any_attributes(qname)
                 if var:
-                    self.bind_any_attr(params, var, qname, value)
+                    if self.is_selected(var):
+                        self.bind_any_attr(params, var, qname, value)
                 else:
                     if (
                         self.config.fail_on_unknown_attributes
@@ -145,6 +169,7 @@ class ElementNode(XmlNode):
                 ns_map=self.ns_map,
                 tokens_factory=var.tokens_factory,
                 format=var.format,
+                array_tokens=self.config.array_tokens,
             )
 
     def bind_any_attr(self, params: Dict, var: XmlVar, qname: str, value: Any):
@@ -165,7 +190,7 @@ class ElementNode(XmlNode):
         del objects[position:]
 
     def bind_object(self, params: Dict, qname: str, value: Any) -> bool:
-        for var in self.meta.find_children(qname):
+        for var in self.meta.find_child_vars(qname):
             if var.is_wildcard:
                 return self.bind_wild_var(params, var, qname, value)
 
@@ -243,9 +268,18 @@ class ElementNode(XmlNode):
     def prepare_generic_value(
         self, qname: Optional[str], value: Any, var: XmlVar
     ) -> Any:
-        """Prepare parsed value before binding to a wildcard field."""
+        """
+        Prepare parsed value before binding to a wildcard field.
 
-        if qname and not self.context.class_type.is_model(value):
+        The dict and named tuple models of the parser class factories
+        are bound as they are.
+        """
+
+        if (
+            qname
+            and not self.context.class_type.is_model(value)
+            and not isinstance(value, (dict, tuple))
+        ):
             any_factory = self.context.class_type.any_element
             value = any_factory(qname=qname, text=converter.serialize(value))
 
@@ -263,6 +297,9 @@ class ElementNode(XmlNode):
         if not var or (text is None and not self.xsi_nil):
             return False
 
+        if not self.is_selected(var):
+            return True
+
         if var.init:
             if self.xsi_nil and not text:
                 params[var.name] = None
@@ -274,6 +311,7 @@ class ElementNode(XmlNode):
                     ns_map=self.ns_map,
                     tokens_factory=var.tokens_factory,
                     format=var.format,
+                    array_tokens=self.config.array_tokens,
                 )
         return True
 
@@ -319,7 +357,15 @@ class ElementNode(XmlNode):
         return True
 
     def child(self, qname: str, attrs: Dict, ns_map: Dict, position: int) -> XmlNode:
-        for var in self.meta.find_children(qname):
+        if self.rejected:
+            return nodes.SkipNode()
+
+        skipped = False
+        for var in self.meta.find_child_vars(qname):
+            if self.projection is not None and var.name not in self.projection:
+                skipped = True
+                continue
+
             unique = 0 if not var.is_element or var.list_element else var.index
             if not unique or unique not in self.assigned:
                 node = self.build_node(qname, var, attrs, ns_map, position)
@@ -330,11 +376,81 @@ class ElementNode(XmlNode):
 
                     return node
 
-        if self.config.fail_on_unknown_properties:
+        if self.config.fail_on_unknown_properties and not skipped:
             raise ParserError(f"Unknown property {self.meta.qname}:{qname}")
 
         return nodes.SkipNode()
 
+    def is_selected(self, var: XmlVar) -> bool:
+        """Return whether the given var is selected by the projection."""
+        return self.projection is None or var.name in self.projection
+
+    def accepts_attrs(self) -> bool:
+        """
+        Evaluate the attribute predicates on the element start.
+
+        The missing attributes are evaluated with their default values.
+        """
+        assert self.predicates is not None
+
+        for var in self.meta.attributes.values():
+            predicate = self.predicates.get(var.name)
+            if callable(predicate):
+                value = ParserUtils.parse_value(
+                    value=self.attrs.get(var.qname),
+                    types=var.types,
+                    default=var.default,
+                    ns_map=self.ns_map,
+                    tokens_factory=var.tokens_factory,
+                    format=var.format,
+                    array_tokens=self.config.array_tokens,
+                )
+                if not predicate(value):
+                    return False
+
+        return True
+
+    def accepts(self, qname: str, value: Any) -> bool:
+        """Evaluate the predicate of a single child element as soon as its
+        value is bound."""
+        assert self.predicates is not None
+
+        for var in self.meta.find_child_vars(qname):
+            predicate = self.predicates.get(var.name)
+            if callable(predicate) and var.is_element and not var.list_element:
+                return predicate(value)
+
+        return True
+
+    def accepts_params(self, params: Dict) -> bool:
+        """Evaluate the predicates of the text, list and missing child
+        fields on the element end."""
+        assert self.predicates is not None
+
+        for var in self.meta.get_element_vars():
+            predicate = self.predicates.get(var.name)
+            if not callable(predicate):
+                continue
+
+            if var.name in params:
+                if var.is_element and not var.list_element:
+                    continue
+
+                value = params[var.name]
+            else:
+                value = var.default() if callable(var.default) else var.default
+
+            if not predicate(value):
+                return False
+
+        return True
+
+    def reject(self, objects: List):
+        """Discard the bound child objects and skip the rest of the element
+        content."""
+        self.rejected = True
+        del objects[self.position :]
+
     def build_node(
         self, qname: str, var: XmlVar, attrs: Dict, ns_map: Dict, position: int
     ) -> Optional[XmlNode]:
@@ -351,6 +467,10 @@ class ElementNode(XmlNode):
         xsi_type = ParserUtils.xsi_type(attrs, ns_map)
         xsi_nil = ParserUtils.xsi_nil(attrs)
         derived_factory = self.context.class_type.derived_element
+        projection = None if self.projection is None else self.projection[var.name]
+        predicates = self.predicates.get(var.name) if self.predicates else None
+        if not isinstance(predicates, dict):
+            predicates = None
 
         if var.clazz:
             return self.build_element_node(
@@ -363,11 +483,17 @@ class ElementNode(XmlNode):
                 derived_factory,
                 xsi_type,
                 xsi_nil,
+                projection,
+                predicates,
             )
 
         if not var.any_type and not var.is_wildcard:
             return nodes.PrimitiveNode(
-                var, ns_map, self.meta.mixed_content, derived_factory
+                var,
+                ns_map,
+                self.meta.mixed_content,
+                derived_factory,
+                self.config.array_tokens,
             )
 
         datatype = DataType.from_qname(xsi_type) if xsi_type else None
@@ -393,6 +519,8 @@ class ElementNode(XmlNode):
                 derived_factory,
                 xsi_type,
                 xsi_nil,
+                projection,
+                predicates,
             )
 
         if node:
@@ -412,6 +540,8 @@ class ElementNode(XmlNode):
                 None,
                 xsi_type,
                 xsi_nil,
+                projection,
+                predicates,
             )
 
         if node:
@@ -436,6 +566,8 @@ class ElementNode(XmlNode):
         derived_factory: Type,
         xsi_type: Optional[str] = None,
         xsi_nil: Optional[bool] = None,
+        projection: Optional[Dict] = None,
+        predicates: Optional[Dict] = None,
     ) -> Optional[XmlNode]:
         meta = self.context.fetch(clazz, self.meta.namespace, xsi_type)
         nillable = nillable or meta.nillable
@@ -446,7 +578,7 @@ class ElementNode(XmlNode):
         if xsi_type and not derived and not issubclass(meta.clazz, clazz):
             derived = True
 
-        return ElementNode(
+        node = ElementNode(
             meta=meta,
             config=self.config,
             attrs=attrs,
@@ -457,4 +589,11 @@ class ElementNode(XmlNode):
             xsi_type=xsi_type,
             xsi_nil=xsi_nil,
             mixed=self.meta.mixed_content,
+            projection=projection,
+            predicates=predicates,
         )
+
+        if predicates and not node.accepts_attrs():
+            return nodes.SkipNode()
+
+        return node
@@ -14,15 +14,24 @@ class PrimitiveNode(XmlNode):
     :param ns_map: Namespace prefix-URI map
     :param mixed: The node supports mixed content
     :param derived_factory: Derived element factory
+    :param array_tokens: Decode the numeric token lists to typed arrays
     """
 
-    __slots__ = "var", "ns_map", "derived_factory"
+    __slots__ = "var", "ns_map", "derived_factory", "array_tokens"
 
-    def __init__(self, var: XmlVar, ns_map: Dict, mixed: bool, derived_factory: Type):
+    def __init__(
+        self,
+        var: XmlVar,
+        ns_map: Dict,
+        mixed: bool,
+        derived_factory: Type,
+        array_tokens: bool = False,
+    ):
         self.var = var
         self.ns_map = ns_map
         self.derived_factory = derived_factory
         self.mixed = mixed
+        self.array_tokens = array_tokens
 
     def bind(
         self, qname: str, text: Optional[str], tail: Optional[str], objects: List
@@ -34,6 +43,7 @@ class PrimitiveNode(XmlNode):
             ns_map=self.ns_map,
             tokens_factory=self.var.tokens_factory,
             format=self.var.format,
+            array_tokens=self.array_tokens,
         )
 
         if obj is None and not self.var.nillable:
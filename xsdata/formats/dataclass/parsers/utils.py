@@ -1,11 +1,22 @@
+from array import array
 from collections import UserList
 from typing import Any, Callable, Dict, Iterable, Optional, Sequence, Type
 
-from xsdata.formats.converter import QNameConverter, converter
+from xsdata.exceptions import ParserError
+from xsdata.formats.converter import (
+    FloatConverter,
+    IntConverter,
+    QNameConverter,
+    converter,
+)
+from xsdata.formats.dataclass.context import XmlContext
 from xsdata.models.enums import QNames
 from xsdata.utils import collections, constants, text
 from xsdata.utils.namespaces import build_qname
 
+ARRAY_TYPECODES = {int: "q", float: "d"}
+ARRAY_CONVERTERS = {int: IntConverter, float: FloatConverter}
+
 
 class PendingCollection(UserList):
     def __init__(self, initlist: Optional[Iterable], factory: Optional[Callable]):
@@ -41,8 +52,16 @@ class ParserUtils:
         ns_map: Optional[Dict] = None,
         tokens_factory: Optional[Callable] = None,
         format: Optional[str] = None,
+        array_tokens: bool = False,
     ) -> Any:
-        """Convert xml string values to s python primitive type."""
+        """
+        Convert xml string values to s python primitive type.
+
+        With array tokens, the int and float token lists are decoded in
+        bulk to typed arrays, if any token is invalid the values are
+        converted one by one. The other token sequence types and the
+        custom int and float converters are always applied per token.
+        """
 
         if value is None:
             if callable(default):
@@ -52,6 +71,12 @@ class ParserUtils:
 
         if tokens_factory:
             value = value if collections.is_array(value) else value.split()
+            if array_tokens and tokens_factory is list and cls.is_array_type(types):
+                try:
+                    return array(ARRAY_TYPECODES[types[0]], map(types[0], value))
+                except (ValueError, TypeError, OverflowError):
+                    pass
+
             return tokens_factory(
                 converter.deserialize(val, types, ns_map=ns_map, format=format)
                 for val in value
@@ -59,6 +84,129 @@ class ParserUtils:
 
         return converter.deserialize(value, types, ns_map=ns_map, format=format)
 
+    @classmethod
+    def is_array_type(cls, types: Sequence[Type]) -> bool:
+        """Return whether the types are a single int or float type with the
+        stock converter."""
+        if len(types) != 1 or types[0] not in ARRAY_TYPECODES:
+            return False
+
+        instance = converter.registry.get(types[0])
+        return type(instance) is ARRAY_CONVERTERS[types[0]]
+
+    @classmethod
+    def verify_paths(cls, context: XmlContext, clazz: Type, paths: Iterable[str]):
+        """
+        Verify the dotted field paths resolve to fields of the given class.
+
+        The paths through wildcard and any type fields are not checked
+        further, their content is only known while parsing, the compound
+        fields are checked against the types of their choices.
+
+        :raises ParserError: If a field path doesn't match any field
+        """
+        for path in paths:
+            classes = [clazz]
+            for name in path.split("."):
+                xml_vars = [
+                    var
+                    for tp in classes
+                    for var in context.build(tp).get_all_vars()
+                    if var.name == name
+                ]
+                if not xml_vars:
+                    raise ParserError(f"Unknown field `{path}` of `{clazz.__name__}`")
+
+                if any(
+                    var.is_wildcard or (var.any_type and not var.is_elements)
+                    for var in xml_vars
+                ):
+                    break
+
+                classes = [
+                    tp
+                    for var in xml_vars
+                    for tp in (var.element_types if var.is_elements else var.types)
+                    if context.class_type.is_model(tp)
+                ]
+
+    @classmethod
+    def projection(
+        cls,
+        fields: Optional[Sequence[str]],
+        predicates: Optional[Dict[str, Callable]] = None,
+    ) -> Optional[Dict]:
+        """
+        Convert the dotted field paths to a nested projection map.
+
+        The nested maps hold the selected fields of the child models, a
+        None value selects the whole field. The fields of the predicates
+        are always selected.
+
+        Example::
+
+            ["id", "book.title", "book.author"] ->
+            {"id": None, "book": {"title": None, "author": None}}
+        """
+        if fields is None:
+            return None
+
+        if predicates:
+            fields = [*fields, *predicates]
+
+        result: Dict = {}
+        for path in fields:
+            *names, last = path.split(".")
+            projection = result
+            for name in names:
+                if name in projection and projection[name] is None:
+                    break
+
+                projection = projection.setdefault(name, {})
+            else:
+                projection[last] = None
+
+        return result
+
+    @classmethod
+    def predicates(cls, predicates: Optional[Dict[str, Callable]]) -> Optional[Dict]:
+        """
+        Convert the dotted field paths predicates to a nested map.
+
+        A field can't have a predicate and child predicates at the same
+        time.
+
+        Example::
+
+            {"book.genre": func} -> {"book": {"genre": func}}
+
+        :raises ParserError: If a predicate path is the prefix of another
+        """
+        if not predicates:
+            return None
+
+        result: Dict = {}
+        for path, predicate in predicates.items():
+            *names, last = path.split(".")
+            target = result
+            for index, name in enumerate(names):
+                target = target.setdefault(name, {})
+                if not isinstance(target, dict):
+                    prefix = ".".join(names[: index + 1])
+                    raise ParserError(
+                        f"Predicate `{path}` conflicts with predicate `{prefix}`"
+                    )
+
+            if last in target:
+                nested = next(key for key in predicates if key.startswith(f"{path}."))
+                raise ParserError(
+                    f"Predicate `{nested}` conflicts with predicate `{path}`"
+                )
+
+            target[last] = predicate
+
+        return result
+
     @classmethod
     def normalize_content(cls, value: Optional[str]) -> Optional[str]:
         """
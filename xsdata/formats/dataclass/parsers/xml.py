@@ -1,5 +1,6 @@
+import inspect
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Tuple, Type
 
 from xsdata.formats.dataclass.parsers.bases import NodeParser, Parsed
 from xsdata.formats.dataclass.parsers.handlers import default_handler
@@ -33,11 +34,20 @@ class UserXmlParser(NodeParser):
     :param context: Model context provider
     :param handler: Override default XmlHandler
     :ivar ms_map: The prefix-URI map generated during parsing
-    :ivar emit_cache: Qname to event name cache
+    :ivar emit_cache: Event and qname to method name and unbound method
+        cache, shared by all the instances of the same parser class
     """
 
     handler: Type[XmlHandler] = field(default=default_handler())
-    emit_cache: Dict = field(init=False, default_factory=dict)
+    emit_cache: Dict[Tuple[str, str], Tuple[str, Optional[Callable]]] = field(
+        init=False, default_factory=dict
+    )
+    emit_tables: ClassVar[
+        Dict[Type, Dict[Tuple[str, str], Tuple[str, Optional[Callable]]]]
+    ] = {}
+
+    def __post_init__(self):
+        self.emit_cache = self.emit_tables.setdefault(type(self), {})
 
     def start(
         self,
@@ -69,7 +79,9 @@ class UserXmlParser(NodeParser):
         Propagate event to subclasses.
 
         Match event and name to a subclass method and trigger it with
-        any input keyword arguments.
+        any input keyword arguments. The methods are resolved once per
+        parser class and event/qname pair, hooks assigned to the parser
+        instance take precedence.
 
         Example::
 
@@ -80,10 +92,28 @@ class UserXmlParser(NodeParser):
         :param kwargs: Event keyword arguments
         """
         key = (event, name)
-        if key not in self.emit_cache:
+        try:
+            method_name, method = self.emit_cache[key]
+        except KeyError:
             method_name = f"{event}_{snake_case(local_name(name))}"
-            self.emit_cache[key] = getattr(self, method_name, None)
-
-        method = self.emit_cache[key]
-        if method:
-            method(**kwargs)
+            method = self.find_method(type(self), method_name)
+            self.emit_cache[key] = method_name, method
+
+        hook = self.__dict__.get(method_name)
+        if hook:
+            hook(**kwargs)
+        elif method:
+            method(self, **kwargs)
+
+    @classmethod
+    def find_method(cls, clazz: Type, name: str) -> Optional[Callable]:
+        """Return the unbound method of the given parser class and name, the
+        static and class methods are wrapped to accept the parser instance."""
+        attr = inspect.getattr_static(clazz, name, None)
+        if attr is None:
+            return None
+
+        if inspect.isfunction(attr):
+            return attr
+
+        return lambda parser, **kwargs: getattr(parser, name)(**kwargs)
@@ -1,5 +1,6 @@
 import json
 import warnings
+from array import array
 from dataclasses import dataclass, field
 from enum import Enum
 from io import StringIO
@@ -10,7 +11,7 @@ from xsdata.formats.converter import converter
 from xsdata.formats.dataclass.context import XmlContext
 from xsdata.formats.dataclass.models.elements import XmlVar
 from xsdata.formats.dataclass.serializers.config import SerializerConfig
-from xsdata.utils import collections
+from xsdata.utils import collections, streams
 
 
 def filter_none(x: Tuple) -> Dict:
@@ -68,6 +69,20 @@ class JsonSerializer(AbstractSerializer):
 
         self.dump_factory(self.convert(obj), out, indent=indent)
 
+    async def write_async(self, out: Any, obj: Any):
+        """
+        Write the given object tree to the asyncio stream writer.
+
+        The object tree is converted in memory and the output is
+        written in chunks, the stream writer is drained after every
+        chunk to respect the transport backpressure.
+
+        :param out: The stream writer, any object with a write and an
+            async drain method
+        :param obj: The input dataclass instance
+        """
+        await streams.write(out, self.render(obj), "utf-8")
+
     def convert(self, obj: Any, var: Optional[XmlVar] = None) -> Any:
         if var is None or self.context.class_type.is_model(obj):
             if collections.is_array(obj):
@@ -78,6 +93,9 @@ class JsonSerializer(AbstractSerializer):
         if collections.is_array(obj):
             return type(obj)(self.convert(v, var) for v in obj)
 
+        if isinstance(obj, array):
+            return obj.tolist()
+
         if isinstance(obj, (dict, int, float, str, bool)):
             return obj
 
@@ -1,4 +1,4 @@
-from typing import Any, Dict, Generator, List, Optional, TextIO, Tuple
+from typing import Any, Dict, Generator, Iterable, List, Optional, TextIO, Tuple
 from xml.etree.ElementTree import QName
 from xml.sax.handler import ContentHandler
 
@@ -81,6 +81,14 @@ class XmlWriter:
         :param events: Events generator
         """
         self.start_document()
+        self.write_events(events)
+        self.end_document()
+
+    def start_document(self):
+        """Start document notification receiver."""
+        if self.config.xml_declaration:
+            self.output.write(f'<?xml version="{self.config.xml_version}"')
+            self.output.write(f' encoding="{self.config.encoding}"?>\n')
 
         if self.config.schema_location:
             self.add_attribute(
@@ -96,6 +104,12 @@ class XmlWriter:
                 check_pending=False,
             )
 
+    def write_events(self, events: Iterable):
+        """
+        Feed the sax content handler with the given events.
+
+        :param events: Events iterable
+        """
         for event, *args in events:
             if event == XmlWriterEvent.START:
                 self.start_tag(*args)
@@ -108,14 +122,10 @@ class XmlWriter:
             else:
                 raise XmlWriterError(f"Unhandled event: `{event}`")
 
+    def end_document(self):
+        """End document notification receiver."""
         self.handler.endDocument()
 
-    def start_document(self):
-        """Start document notification receiver."""
-        if self.config.xml_declaration:
-            self.output.write(f'<?xml version="{self.config.xml_version}"')
-            self.output.write(f' encoding="{self.config.encoding}"?>\n')
-
     def start_tag(self, qname: str):
         """
         Start tag notification receiver.
@@ -1,4 +1,4 @@
-from typing import Dict, Generator, TextIO
+from typing import Dict, TextIO
 
 from lxml.etree import indent, tostring
 from lxml.sax import ElementTreeContentHandler
@@ -30,8 +30,8 @@ class LxmlEventWriter(XmlWriter):
 
         self.handler = ElementTreeContentHandler()
 
-    def write(self, events: Generator):
-        super().write(events)
+    def end_document(self):
+        super().end_document()
 
         assert isinstance(self.handler, ElementTreeContentHandler)
 
@@ -1,8 +1,11 @@
+import itertools
+from array import array
 from dataclasses import dataclass, field
 from enum import Enum
 from io import StringIO
 from typing import (
     Any,
+    ClassVar,
     Dict,
     Generator,
     Iterable,
@@ -24,7 +27,7 @@ from xsdata.formats.dataclass.serializers.config import SerializerConfig
 from xsdata.formats.dataclass.serializers.mixins import XmlWriter, XmlWriterEvent
 from xsdata.formats.dataclass.serializers.writers import default_writer
 from xsdata.models.enums import DataType, QNames
-from xsdata.utils import collections, namespaces
+from xsdata.utils import collections, namespaces, streams
 from xsdata.utils.constants import EMPTY_MAP
 
 NoneStr = Optional[str]
@@ -44,6 +47,8 @@ class XmlSerializer(AbstractSerializer):
     context: XmlContext = field(default_factory=XmlContext)
     writer: Type[XmlWriter] = field(default=default_writer())
 
+    batch_size: ClassVar[int] = 1000
+
     def render(self, obj: Any, ns_map: Optional[Dict] = None) -> str:
         """
         Convert and return the given object tree as xml string.
@@ -71,6 +76,39 @@ class XmlSerializer(AbstractSerializer):
         )
         handler.write(events)
 
+    async def write_async(self, out: Any, obj: Any, ns_map: Optional[Dict] = None):
+        """
+        Write the given object tree to the asyncio stream writer.
+
+        The events are fed to the xml writer in batches, after every
+        batch the output is flushed to the stream writer, which is
+        drained to respect the transport backpressure. The lxml writer
+        produces the output only when the document ends.
+
+        :param out: The stream writer, any object with a write and an
+            async drain method
+        :param obj: The input dataclass instance
+        :param ns_map: User defined namespace prefix-URI map
+        """
+        buffer = StringIO()
+        events = self.write_object(obj)
+        handler = self.writer(
+            config=self.config,
+            output=buffer,
+            ns_map=namespaces.clean_prefixes(ns_map) if ns_map else {},
+        )
+        handler.start_document()
+        while True:
+            batch = list(itertools.islice(events, self.batch_size))
+            if not batch:
+                break
+
+            handler.write_events(batch)
+            await streams.flush(out, buffer, self.config.encoding)
+
+        handler.end_document()
+        await streams.flush(out, buffer, self.config.encoding)
+
     def write_object(self, obj: Any):
         """Produce an events stream from a dataclass or a derived element."""
         qname = xsi_type = None
@@ -175,7 +213,9 @@ class XmlSerializer(AbstractSerializer):
         """Produce an events stream for the given tokens list or list of tokens
         lists."""
         if value or var.nillable or var.required:
-            if value and collections.is_array(value[0]):
+            if value and (
+                collections.is_array(value[0]) or isinstance(value[0], array)
+            ):
                 for val in value:
                     yield from self.write_element(val, var, namespace)
             else:
@@ -397,6 +437,7 @@ class XmlSerializer(AbstractSerializer):
                 value = getattr(obj, var.name)
                 if (
                     value is None
+                    or (not value and isinstance(value, array))
                     or (collections.is_array(value) and not value)
                     or (ignore_optionals and var.is_optional(value))
                 ):
@@ -261,6 +261,8 @@ class GeneratorOutput:
     :param ignore_patterns: Ignore pattern restrictions
     :param include_header: Include a header with codegen information in
         the output
+    :param prune_modules: Delete the stale modules of the previous runs,
+        requires a manifest of the generated modules in the package
     """
 
     package: str = element(default="generated")
@@ -281,6 +283,7 @@ class GeneratorOutput:
     unnest_classes: bool = element(default=False)
     ignore_patterns: bool = element(default=False)
     include_header: bool = element(default=False)
+    prune_modules: bool = element(default=False)
 
     def __post_init__(self):
         self.validate()
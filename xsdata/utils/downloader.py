@@ -1,10 +1,11 @@
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional, Union
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
-from xsdata.codegen import opener
 from xsdata.codegen.parsers import DefinitionsParser, SchemaParser
+from xsdata.codegen.resources import ResourceLoader
 from xsdata.logger import logger
 from xsdata.models.wsdl import Definitions
 from xsdata.models.xsd import Schema
@@ -16,54 +17,104 @@ class Downloader:
     locally. The imports paths will be adjusted if necessary.
 
     :param output: Output path
+    :param loader: The resources loader
+    :param workers: The number of concurrent downloads
     """
 
-    __slots__ = ("output", "base_path", "downloaded")
+    __slots__ = ("output", "loader", "workers", "base_path", "downloaded")
 
-    def __init__(self, output: Path):
+    def __init__(
+        self,
+        output: Path,
+        loader: Optional[ResourceLoader] = None,
+        workers: int = 8,
+    ):
         self.output = output
+        self.loader = loader or ResourceLoader()
+        self.workers = workers
         self.base_path: Optional[Path] = None
         self.downloaded: Dict = {}
 
     def wget(self, uri: str, location: Optional[str] = None):
-        """Download handler for any uri input with circular protection."""
-        if not (uri in self.downloaded or (location and location in self.downloaded)):
-            self.downloaded[uri] = None
-            self.downloaded[location] = None
-            self.adjust_base_path(uri)
-
-            logger.info("Fetching %s", uri)
-
-            input_stream = opener.open(uri).read()  # nosec
-            if uri.endswith("wsdl"):
-                self.parse_definitions(uri, input_stream)
-            else:
-                self.parse_schema(uri, input_stream)
+        """
+        Download the given uri and all its imports with circular
+        protection.
 
+        The imports graph is fetched breadth first, one level at a time
+        through a pool of threads. The file paths of the whole graph are
+        resolved before writing any file, in order to adjust the import
+        locations of every file regardless of the graph order.
+        """
+        resources: List[Tuple[str, Optional[str], bytes]] = []
+        pending: List[Tuple[str, Optional[str]]] = [(uri, location)]
+
+        with ThreadPoolExecutor(max_workers=max(self.workers, 1)) as executor:
+            while pending:
+                batch = []
+                for uri, location in pending:
+                    if not (
+                        uri in self.downloaded
+                        or (location and location in self.downloaded)
+                    ):
+                        self.downloaded[uri] = None
+                        self.downloaded[location] = None
+                        self.adjust_base_path(uri)
+                        batch.append((uri, location))
+
+                futures = [executor.submit(self.fetch, uri) for uri, _ in batch]
+
+                pending = []
+                for (uri, location), future in zip(batch, futures):
+                    input_stream = future.result()
+                    if uri.endswith("wsdl"):
+                        pending.extend(self.parse_definitions(uri, input_stream))
+                    else:
+                        pending.extend(self.parse_schema(uri, input_stream))
+
+                    resources.append((uri, location, input_stream))
+
+        for uri, location, _ in resources:
+            self.register_file(uri, location)
+
+        for uri, location, input_stream in resources:
             self.write_file(uri, location, input_stream.decode())
 
-    def parse_schema(self, uri: str, content: bytes):
-        """Convert content to a schema instance and process all sub imports."""
+    def fetch(self, uri: str) -> bytes:
+        """Return the contents of the given uri."""
+        logger.info("Fetching %s", uri)
+        return self.loader.load(uri)
+
+    def parse_schema(
+        self, uri: str, content: bytes
+    ) -> Iterator[Tuple[str, Optional[str]]]:
+        """Convert content to a schema instance and return all sub imports."""
         parser = SchemaParser(location=uri)
         schema = parser.from_bytes(content, Schema)
-        self.wget_included(schema)
+        return self.find_included(schema)
 
-    def parse_definitions(self, uri: str, content: bytes):
-        """Convert content to a definitions instance and process all sub
+    def parse_definitions(
+        self, uri: str, content: bytes
+    ) -> Iterator[Tuple[str, Optional[str]]]:
+        """Convert content to a definitions instance and return all sub
         imports."""
 
         parser = DefinitionsParser(location=uri)
         definitions = parser.from_bytes(content, Definitions)
-        self.wget_included(definitions)
+        yield from self.find_included(definitions)
 
         for schema in definitions.schemas:
-            self.wget_included(schema)
-
-    def wget_included(self, definition: Union[Schema, Definitions]):
+            yield from self.find_included(schema)
+
+    @classmethod
+    def find_included(
+        cls, definition: Union[Schema, Definitions]
+    ) -> Iterator[Tuple[str, Optional[str]]]:
+        """Return the locations and the original schema locations of the
+        included, imported and redefined resources."""
         for included in definition.included():
             if included.location:
                 schema_location = getattr(included, "schema_location", None)
-                self.wget(included.location, schema_location)
+                yield included.location, schema_location
 
     def adjust_base_path(self, uri: str):
         """
@@ -88,7 +139,7 @@ class Downloader:
     def adjust_imports(self, path: Path, content: str) -> str:
         """Try to adjust the import locations for external locations that are
         not relative to the first requested uri."""
-        matches = re.findall(r"ocation=\"(.*)\"", content)
+        matches = re.findall(r"ocation=\"([^\"]*)\"", content)
         for match in matches:
             if isinstance(self.downloaded.get(match), Path):
                 location = os.path.relpath(self.downloaded[match], path)
@@ -97,14 +148,13 @@ class Downloader:
 
         return content
 
-    def write_file(self, uri: str, location: Optional[str], content: str):
+    def register_file(self, uri: str, location: Optional[str]) -> Path:
         """
-        Write the given uri and it's content according to the base path and if
-        the uri is relative to first requested uri.
+        Resolve the file path of the given uri according to the base path
+        and if the uri is relative to first requested uri.
 
-        Keep track of all the written file paths, in case we have to
-        modify the location attribute in an upcoming schema/definition
-        import.
+        Keep track of all the file paths, in case we have to modify the
+        location attribute in a schema/definition import.
         """
         common_path = os.path.commonpath((self.base_path or "", uri))
         if common_path:
@@ -112,12 +162,18 @@ class Downloader:
         else:
             file_path = self.output.joinpath(Path(uri).name)
 
+        self.downloaded[uri] = file_path
+        if location:
+            self.downloaded[location] = file_path
+
+        return file_path
+
+    def write_file(self, uri: str, location: Optional[str], content: str):
+        """Write the given uri contents to its file path and adjust the
+        import locations."""
+        file_path = self.register_file(uri, location)
         content = self.adjust_imports(file_path.parent, content)
         file_path.parent.mkdir(parents=True, exist_ok=True)
         file_path.write_text(content, encoding="utf-8")
 
         logger.info("Writing %s", file_path)
-        self.downloaded[uri] = file_path
-
-        if location:
-            self.downloaded[location] = file_path
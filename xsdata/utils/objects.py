@@ -1,7 +1,10 @@
 import math
-from typing import Any
+from dataclasses import fields
+from typing import Any, Type, TypeVar
 from xml.etree.ElementTree import QName
 
+T = TypeVar("T")
+
 
 def update(obj: Any, **kwargs: Any):
     """Update an object from keyword arguments with dotted keys."""
@@ -26,3 +29,23 @@ def literal_value(value: Any) -> str:
         return f'QName("{value.text}")'
 
     return repr(value)
+
+
+def add_slots(clazz: Type[T]) -> Type[T]:
+    """
+    Recreate the given dataclass with slots for all its fields.
+
+    Backport of the dataclass slots option, which is only available
+    since python 3.10. The instances lose their ``__dict__`` and the
+    fields defaults are only available through the ``__init__``
+    signature.
+    """
+    field_names = tuple(f.name for f in fields(clazz))  # type: ignore
+    namespace = dict(clazz.__dict__)
+    namespace["__slots__"] = field_names
+    for name in (*field_names, "__dict__", "__weakref__"):
+        namespace.pop(name, None)
+
+    result: Any = type(clazz.__name__, clazz.__bases__, namespace)
+    result.__qualname__ = clazz.__qualname__
+    return result
@@ -0,0 +1,69 @@
+import functools
+import threading
+from typing import Any, Callable, ClassVar, Dict, Iterable, List, Tuple, Type
+
+
+class MethodPatcher:
+    """
+    Wrap class methods in place and restore them.
+
+    The patches are process wide, the registry of the patched methods is
+    guarded by a lock and every method can be patched by one patcher at
+    a time, overlapping activations are refused instead of nested,
+    which means the originals are always restored in order.
+    """
+
+    __slots__ = ("originals",)
+
+    lock = threading.Lock()
+    registry: ClassVar[Dict[Tuple[Type, str], "MethodPatcher"]] = {}
+
+    def __init__(self):
+        self.originals: List[Tuple[Type, str, Any]] = []
+
+    @property
+    def active(self) -> bool:
+        return len(self.originals) > 0
+
+    def apply(self, patches: Iterable[Tuple[Type, str, Callable]]):
+        """
+        Wrap the given class methods, either all of them or none.
+
+        The wrappers receive the original function and return the
+        replacement, class methods are unwrapped and wrapped again.
+
+        :param patches: The class, method name and wrapper triplets
+        :raises ValueError: If any method is already patched
+        """
+        patches = list(patches)
+        with self.lock:
+            keys = set()
+            for clazz, name, _ in patches:
+                if (clazz, name) in self.registry or (clazz, name) in keys:
+                    raise ValueError(
+                        f"Method `{clazz.__qualname__}.{name}` is already patched"
+                    )
+
+                keys.add((clazz, name))
+
+            for clazz, name, wrapper in patches:
+                original = clazz.__dict__[name]
+                self.registry[(clazz, name)] = self
+                self.originals.append((clazz, name, original))
+                setattr(clazz, name, self.wrap(original, wrapper))
+
+    def restore(self):
+        """Restore the original methods in the reverse patching order."""
+        with self.lock:
+            while self.originals:
+                clazz, name, original = self.originals.pop()
+                setattr(clazz, name, original)
+                del self.registry[(clazz, name)]
+
+    @classmethod
+    def wrap(cls, original: Any, wrapper: Callable) -> Any:
+        if isinstance(original, classmethod):
+            func = original.__func__
+            return classmethod(functools.wraps(func)(wrapper(func)))
+
+        return functools.wraps(original)(wrapper(original))
@@ -0,0 +1,64 @@
+import asyncio
+from io import StringIO
+from typing import Any, AsyncIterator
+
+CHUNK_SIZE = 64 * 1024
+
+
+async def iter_chunks(source: Any, size: int = CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """
+    Yield chunks of bytes up to the given size from an asyncio stream
+    reader or an async iterable of bytes.
+
+    The control is yielded to the event loop after every chunk, even
+    when the data are already buffered.
+
+    :param source: The stream reader or the async iterable of bytes
+    :param size: The maximum chunk size
+    """
+    if hasattr(source, "read"):
+        while True:
+            chunk = await source.read(size)
+            if not chunk:
+                break
+
+            yield chunk
+            await asyncio.sleep(0)
+    else:
+        async for data in source:
+            for i in range(0, len(data), size):
+                yield data[i : i + size]
+                await asyncio.sleep(0)
+
+
+async def read_all(source: Any) -> bytes:
+    """Read all the bytes of an asyncio stream reader or an async iterable of
+    bytes."""
+    return b"".join([chunk async for chunk in iter_chunks(source)])
+
+
+async def write(sink: Any, data: str, encoding: str, size: int = CHUNK_SIZE):
+    """
+    Write the encoded data to the asyncio stream writer in chunks up to the
+    given size and wait for the writer to drain after every chunk.
+
+    :param sink: The stream writer, any object with a write and an async
+        drain method
+    :param data: The text to write
+    :param encoding: The text encoding
+    :param size: The maximum chunk size
+    """
+    for i in range(0, len(data), size):
+        sink.write(data[i : i + size].encode(encoding))
+        await sink.drain()
+
+
+async def flush(sink: Any, buffer: StringIO, encoding: str):
+    """Move the buffer contents to the asyncio stream writer."""
+    data = buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate()
+    if data:
+        await write(sink, data, encoding)
+    else:
+        await asyncio.sleep(0)